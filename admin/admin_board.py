@@ -10,14 +10,17 @@ from core.exception import AlertException
 from core.models import Board, BoardNew, Scrap, BoardFile, BoardGood
 from core.formclass import BoardForm
 from core.template import AdminTemplates
+from lib.cache import invalidate_latest_cache
 from lib.common import (
-    dynamic_create_write_table, FileCache, get_from_list,
+    dynamic_create_write_table, get_from_list,
     safe_int_convert, select_query, set_url_query_params
 )
 from lib.dependency.board import get_board
 from lib.dependency.dependencies import (
     common_search_query_params, validate_token
 )
+from lib.search import get_search_backend
+from lib.sequence import write_num_allocator
 from lib.template_functions import (
     get_editor_select, get_group_select,
     get_member_level_select, get_paging, get_skin_select,
@@ -105,7 +108,7 @@ async def board_list_update(
             db.commit()
 
             # 최신글 캐시 삭제
-            FileCache().delete_prefix(f'latest-{board.bo_table}')
+            invalidate_latest_cache(board.bo_table)
 
     url = "/admin/board_list"
     query_params = request.query_params
@@ -145,9 +148,13 @@ async def board_list_delete(
             write_model.__table__.indexes.clear()  # 인덱스까지 삭제해야 동일한 table로 재생성시 에러가 안남
             write_model.__table__.drop(DBConnect().engine)
             _created_models.pop(board.bo_table, None)  # 동적 모델 캐싱 삭제
+            # 검색 색인 삭제
+            get_search_backend().drop_table(board.bo_table)
+            # 글번호 할당 기록 삭제
+            write_num_allocator.reset(board.bo_table)
 
             # 최신글 캐시 삭제
-            FileCache().delete_prefix(f'latest-{board.bo_table}')
+            invalidate_latest_cache(board.bo_table)
 
     url = "/admin/board_list"
     query_params = request.query_params
@@ -252,6 +259,9 @@ async def board_form_update(
             setattr(existing_board, field, value)
         db.commit()
 
+        # 검색 색인이 없는 기존 게시판은 색인 생성
+        get_search_backend().prepare_table(dynamic_create_write_table(bo_table))
+
     else:
         raise AlertException("잘못된 접근입니다.", 400)
 
@@ -274,7 +284,7 @@ async def board_form_update(
             db.commit()
 
     # 최신글 캐시 삭제
-    FileCache().delete_prefix(f'latest-{bo_table}')
+    invalidate_latest_cache(bo_table)
 
     url = f"/admin/board_form/{bo_table}"
     query_params = request.query_params
@@ -339,6 +349,8 @@ async def board_copy_update(
                 service.copy_board_files(FILE_DIRECTORY,
                                          bo_table, write.wr_id,
                                          target_table, write.wr_id)
+        # 복사한 게시글 색인
+        get_search_backend().rebuild_table(target_write_model)
 
     content = """
     <script>
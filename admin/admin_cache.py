@@ -7,6 +7,7 @@ from sse_starlette import EventSourceResponse
 
 from core.database import db_session
 from core.template import AdminTemplates
+from lib.cache import get_cache
 from lib.dependency.dependencies import validate_super_admin
 
 router = APIRouter(dependencies=[Depends(validate_super_admin)])
@@ -60,6 +61,9 @@ async def cache_file_deleting(request: Request, db: db_session):
             yield f"data: [끝]오류가 발생했습니다. {str(e)} \n\n"
             raise
 
+        # 메모리/공유 캐시 무효화
+        get_cache().clear()
+
         # 종료 메시지 전송
         yield f"data: 총 {count}개의 파일과 디렉토리를 삭제했습니다.\n\n"
         yield "data: [끝]\n\n"
@@ -13,6 +13,7 @@ from core.formclass import ConfigForm
 from core.models import Config
 from core.template import AdminTemplates
 from lib.common import get_client_ip, get_host_public_ip
+from lib.config_cache import invalidate_config_cache
 from lib.dependency.dependencies import validate_super_admin, validate_token
 from lib.template_functions import (
     get_editor_select, get_member_level_select, get_skin_select,
@@ -95,4 +96,7 @@ async def config_form_update(
         setattr(config, field, value)
     db.commit()
 
+    # 모든 worker의 기본환경설정 캐시를 갱신
+    invalidate_config_cache()
+
     return RedirectResponse("/admin/config_form", status_code=303)
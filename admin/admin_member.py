@@ -17,6 +17,7 @@ from lib.common import (
     get_from_list, is_none_datetime, select_query, set_url_query_params
 )
 from lib.dependency.dependencies import common_search_query_params, validate_token
+from lib.member_auth_cache import invalidate_member_auth
 from lib.pbkdf2 import create_hash
 from lib.template_functions import get_member_level_select, get_paging
 from service.member_service import MemberImageService
@@ -122,6 +123,7 @@ async def member_list_update(
             member.mb_intercept_date = (datetime.now().strftime("%Y%m%d") if get_from_list(mb_intercept_date, i, 0) else "")
             member.mb_level = mb_level[i]
             db.commit()
+            invalidate_member_auth(member.mb_id)
 
     query_params = request.query_params
     url = "/admin/member_list"
@@ -201,6 +203,7 @@ async def member_list_delete(
             file_service.update_image_file(member.mb_id, 'image', None, 1)
 
             db.commit()
+            invalidate_member_auth(member.mb_id)
 
     url = "/admin/member_list"
     query_params = request.query_params
@@ -271,6 +274,7 @@ async def member_form_update(
             setattr(exists_member, field, value)
 
         db.commit()
+        invalidate_member_auth(mb_id)
 
     # 이미지 검사 -> 이미지 수정(삭제 포함)
     file_service.update_image_file(mb_id, 'image', mb_img, del_mb_img)
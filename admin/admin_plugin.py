@@ -12,7 +12,7 @@ from starlette.responses import JSONResponse, FileResponse
 from core.template import AdminTemplates
 from core.plugin import (
     get_plugin_info, get_all_plugin_info, PLUGIN_DIR,
-    PluginState, read_plugin_state, write_plugin_state
+    PluginState, plugin_registry, read_plugin_state, write_plugin_state
 )
 from lib.dependency.dependencies import validate_super_admin
 
@@ -108,6 +108,9 @@ async def update_plugin_state(
         logging.error(e)
         return JSONResponse(status_code=400, content={"message": "플러그인 상태를 변경할 수 없습니다."})
 
+    # 요청을 처리한 worker는 바로 반영합니다. (다른 worker는 PLUGIN_WATCH_INTERVAL 이내에 반영)
+    await plugin_registry.refresh(request.app)
+
     return {"message": message}
 
 
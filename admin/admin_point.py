@@ -14,7 +14,6 @@ from core.template import AdminTemplates
 from lib.common import select_query, set_url_query_params
 from lib.dependency.dependencies import common_search_query_params, validate_token
 from lib.template_functions import get_paging
-from service.member_service import MemberService
 from service.point_service import PointService
 
 router = APIRouter()
@@ -106,7 +105,6 @@ async def point_update(
 async def point_list_delete(
     request: Request,
     db: db_session,
-    member_service: Annotated[MemberService, Depends()],
     service: Annotated[PointService, Depends()],
     checks: List[int] = Form(None, alias="chk[]"),
     po_id: List[int] = Form(None, alias="po_id[]"),
@@ -131,7 +129,6 @@ async def point_list_delete(
 
         # 포인트 내역 삭제
         db.delete(point)
-        db.commit()
 
         # po_mb_point에 반영
         db.execute(
@@ -139,11 +136,10 @@ async def point_list_delete(
             .values(po_mb_point=Point.po_mb_point - point.po_point)
             .where(Point.mb_id == point.mb_id, Point.po_id > point.po_id)
         )
-        db.commit()
 
         # 회원 포인트 갱신
-        sum_point = service.get_total_point(point.mb_id)
-        member_service.update_member_point(point.mb_id, sum_point)
+        service.increase_member_point(point.mb_id, -point.po_point)
+        db.commit()
 
     url = "/admin/point_list"
     query_params = request.query_params
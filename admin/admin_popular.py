@@ -6,16 +6,17 @@ from typing_extensions import Annotated
 
 from fastapi import APIRouter, Depends, Form, Query, Request
 from fastapi.responses import RedirectResponse
-from sqlalchemy import delete, desc, func, select
+from sqlalchemy import desc, func, select
 from sqlalchemy.orm import aliased
 
 from core.database import db_session
-from core.models import Popular
+from core.models import Popular, PopularDaily
 from core.template import AdminTemplates
 from lib.common import select_query, set_url_query_params
 from lib.dependency.dependencies import common_search_query_params, validate_token
+from lib.page_chrome import invalidate_page_chrome
+from service.popular_service import PopularService, prepare_popular_daily
 from lib.template_functions import get_paging
-from service.popular_service import PopularService
 
 router = APIRouter()
 templates = AdminTemplates()
@@ -58,19 +59,17 @@ async def popular_list(
 @router.post("/popular/delete", dependencies=[Depends(validate_token)], tags=["admin_popular_list"])
 async def popular_delete(
     request: Request,
-    db: db_session,
     service: Annotated[PopularService, Depends()],
     checks: List[int] = Form(..., alias="chk[]")
 ):
     """
     인기검색어 목록 삭제
     """
-    # in 조건을 사용해서 일괄 삭제
-    db.execute(delete(Popular).where(Popular.pp_id.in_(checks)))
-    db.commit()
+    # in 조건을 사용해서 일괄 삭제 (일별 집계 포함)
+    service.delete_populars_by_ids(checks)
 
     # 기존 캐시 삭제
-    service.fetch_populars().cache_clear()
+    invalidate_page_chrome("populars")
 
     url = "/admin/popular_list"
     query_params = request.query_params
@@ -96,18 +95,19 @@ async def popular_rank(
     to_date = re.sub(r'[^0-9 :\-]', '', to_date)
 
     # 인기검색어 순위 데이터 출력
-    # 인라인 뷰를 사용해서 인기검색어 순위를 구함
+    # 일별 집계 테이블의 인라인 뷰를 사용해서 인기검색어 순위를 구함
+    prepare_popular_daily()
     inline_view = aliased(
         select(
-            Popular.pp_word,
-            func.count(Popular.pp_word).label('search_count')
+            PopularDaily.pp_word,
+            func.sum(PopularDaily.pp_count).label('search_count')
         )
         .where(
-            Popular.pp_word != '',
-            Popular.pp_date >= fr_date,
-            Popular.pp_date <= to_date
+            PopularDaily.pp_word != '',
+            PopularDaily.pp_date >= fr_date,
+            PopularDaily.pp_date <= to_date
         )
-        .group_by(Popular.pp_word)
+        .group_by(PopularDaily.pp_word)
         .subquery()
     )
     query = select().order_by(
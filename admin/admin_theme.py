@@ -5,7 +5,7 @@ from typing_extensions import Annotated
 
 from jinja2 import FileSystemLoader
 from fastapi import APIRouter, Depends, HTTPException, Path, Request
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 from sqlalchemy import select, update
 
 from core.database import db_session
@@ -14,6 +14,8 @@ from core.template import (
     AdminTemplates, TEMPLATES, TemplateService, UserTemplates,
     get_current_theme, get_theme_list, get_theme_info, register_theme_statics,
 )
+from lib.cache import invalidate_latest_cache
+from lib.config_cache import invalidate_config_cache
 from lib.dependency.dependencies import validate_super_admin, validate_theme
 
 logging.basicConfig(level=logging.INFO)
@@ -41,6 +43,7 @@ async def theme(request: Request, db: db_session):
     if current_theme not in theme_list:
         config.cf_theme = current_theme = "basic"
         db.commit()
+        invalidate_config_cache()
 
     # 현재 사용 중인 테마를 목록 맨 앞으로 이동
     if current_theme and current_theme in theme_list:
@@ -94,32 +97,22 @@ async def theme_update(
     """ 테마 적용 """
     from main import app  # 순환참조 방지
 
-    before_theme = get_current_theme()
-    before_theme_path = f"{TEMPLATES}/{before_theme}"
-
     db.execute(update(Config).values(cf_theme=select_theme))
     db.commit()
+    invalidate_config_cache()
 
     # 선택한 테마로 캐시&설정 데이터들을 갱신합니다.
     get_current_theme.cache_clear()
     TemplateService.set_templates_dir()
-    cache_directory = "data/cache"
-    for filename in os.listdir(cache_directory):
-        if filename.startswith("latest-"):
-            file_path = os.path.join(cache_directory, filename)
-            os.unlink(file_path)
+    invalidate_latest_cache()
 
     # 테마 관련 정적 파일을 등록합니다.
     register_theme_statics(app)
 
-    # 이전 테마 경로를 제거 후 새로운 테마 경로를 추가합니다.
+    # 이전 테마의 템플릿 환경을 제거합니다. (새로운 테마 환경은 다음 요청에서 생성)
     user_template = UserTemplates()
-    current_theme_path: list = user_template.default_directories
-    theme_path = [path for path in current_theme_path if not path.startswith(before_theme_path)]
-    theme_path.insert(0, f"{TEMPLATES}/{select_theme}")
-
-    user_template.default_directories = theme_path
-    user_template.env.loader = FileSystemLoader(theme_path)
+    user_template.reset_environments()
+    user_template.env.loader = FileSystemLoader(user_template.get_directories(TemplateService.get_templates_dir()))
 
     # 현재 테마 정보를 가져옵니다.
     info = get_theme_info(select_theme)
@@ -127,6 +120,15 @@ async def theme_update(
     return {"success": f"{info['theme_name']} 테마로 변경되었습니다."}
 
 
+@router.get("/theme_template_metrics")
+async def theme_template_metrics():
+    """
+    사용자 템플릿 컴파일 지표
+    - 요청을 처리한 worker(프로세스)의 템플릿 컴파일 횟수와 최초 렌더링 소요시간을 반환합니다.
+    """
+    return JSONResponse(content=UserTemplates().get_metrics())
+
+
 @router.get("/screenshot/{theme}")
 async def screenshot(theme: str = Path(...)):
     try:
@@ -3,6 +3,7 @@ from datetime import datetime
 from typing import List
 
 from fastapi import APIRouter, Depends, Form, Query, Request
+from fastapi.responses import JSONResponse
 from sqlalchemy import asc, cast, delete, desc, extract, func, select, String
 
 from core.database import db_session
@@ -12,6 +13,7 @@ from core.template import AdminTemplates
 from lib.dependency.dependencies import validate_super_admin, validate_token
 from lib.pbkdf2 import validate_password
 from lib.template_functions import get_paging
+from service.visit_service import VisitLogWriter
 
 router = APIRouter()
 templates = AdminTemplates()
@@ -644,6 +646,15 @@ async def visit_year(
     return templates.TemplateResponse("visit_year.html", context)
 
 
+@router.get("/visit_log_metrics", dependencies=[Depends(validate_super_admin)])
+async def visit_log_metrics():
+    """
+    접속자 기록 대기열 지표
+    - 요청을 처리한 worker(프로세스)의 대기열 크기와 기록 소요시간을 반환합니다.
+    """
+    return JSONResponse(content=VisitLogWriter.get_metrics())
+
+
 def count_by_field(list: list, field_name: str) -> list:
     """기존 리스트를 field_name 기준으로 합산합니다.
     Args:
@@ -27,15 +27,9 @@ async def set_current_connect(
         mb_id = getattr(member, "mb_id", "")
         cf_admin = getattr(request.state.config, "cf_admin", "admin")
 
+        # 접속자 테이블 반영과 만료된 접속자 삭제는 CurrentConnectTracker에서 주기적으로 처리
         if cf_admin != mb_id:
-            current_login = service.fetch_current_connect(current_ip)
-            if current_login:
-                service.update_current_connect(current_login, path, mb_id)
-            else:
-                service.create_current_connect(current_ip, path, mb_id)
-
-        # 현재 로그인한 이력 삭제
-        service.delete_current_connect()
+            service.track_current_connect(current_ip, path, mb_id)
 
         # 세션의 member 데이터를 데이터베이스와 동기화
         if member:
@@ -13,26 +13,27 @@ from api.v1.service.member import MemberServiceAPI, ValidateMemberAPI
 from api.v1.models.auth import TokenPayload
 from api.v1.models.member import CreateMember, UpdateMember
 from lib.common import is_none_datetime
+from lib.member_auth_cache import MemberAuthSnapshot, member_auth_cache
 from lib.pbkdf2 import validate_password
 
 
-async def get_current_member(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    member_service: Annotated[MemberServiceAPI, Depends()]
-) -> Member:
-    """현재 로그인한 회원 정보를 조회합니다.
+def get_token_member_id(token: str) -> str:
+    """JWT를 검증하여 회원 아이디를 반환합니다.
+    - 검증한 토큰은 만료 전까지 짧게 캐시하여 다시 디코딩하지 않습니다.
 
     Args:
-        request (Request): Request 객체
-        db (db_session): 데이터베이스 세션
-        token (Annotated[str, Depends(oauth2_scheme)]): JWT
+        token (str): JWT
 
     Raises:
-        HTTPException: 회원아이디가 없거나 회원 정보가 없을 경우 발생하는 예외
+        HTTPException: 토큰이 올바르지 않거나 회원아이디가 없을 경우 발생하는 예외
 
     Returns:
-        Member: 현재 로그인한 회원 정보
+        str: 회원 아이디
     """
+    mb_id = member_auth_cache.get_token(token)
+    if mb_id is not None:
+        return mb_id
+
     payload: TokenPayload = JWT.decode_token(
         token,
         api_settings.ACCESS_TOKEN_SECRET_KEY
@@ -46,7 +47,40 @@ async def get_current_member(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    member = member_service.get_member(mb_id)
+    member_auth_cache.set_token(token, mb_id, payload.exp)
+    return mb_id
+
+
+async def get_current_member(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    member_service: Annotated[MemberServiceAPI, Depends()]
+) -> Member:
+    """현재 로그인한 회원 정보를 조회합니다.
+    - 인증할 수 없는 회원(탈퇴/차단/메일인증)은 캐시하여, 회원 정보를 조회하지 않고 거부합니다.
+    - 인증할 수 있는 회원은 요청마다 회원 정보를 조회하고 인증 상태를 확인합니다.
+
+    Args:
+        token (Annotated[str, Depends(oauth2_scheme)]): JWT
+        member_service (MemberServiceAPI): 회원 서비스 인스턴스
+
+    Raises:
+        HTTPException: 회원아이디가 없거나 회원 정보가 없을 경우 발생하는 예외
+
+    Returns:
+        Member: 현재 로그인한 회원 정보
+    """
+    mb_id = get_token_member_id(token)
+
+    snapshot = member_auth_cache.get_member(mb_id)
+    if snapshot is not None and not snapshot.is_valid:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=snapshot.message)
+
+    try:
+        member = member_service.get_member(mb_id)
+    except HTTPException as e:
+        if e.status_code == status.HTTP_403_FORBIDDEN:
+            member_auth_cache.set_member(MemberAuthSnapshot(mb_id, False, e.detail))
+        raise
 
     return member
 
@@ -286,6 +286,16 @@ class BoardPaginationRequest(PagenationRequest):
               """
               )
     )
+    cursor: Union[str, None] = Field(
+        Query(default=None,
+              title="커서",
+              description="""커서(keyset) 페이징 <br>\
+                이전 응답의 next_cursor/prev_cursor 값을 전달하면 page 대신 커서 위치부터 조회 <br>\
+                빈 문자열을 전달하면 첫 페이지부터 커서 페이징으로 조회 <br>\
+                커서 페이징에서 total_records는 검색이 아닌 경우 근사값
+              """
+              )
+    )
 
 
 class ResponseBoardListModel(PaginationResponse):
@@ -298,6 +308,8 @@ class ResponseBoardListModel(PaginationResponse):
     current_page: int
     prev_spt: Union[int, None]
     next_spt: Union[int, None]
+    prev_cursor: Union[str, None] = None
+    next_cursor: Union[str, None] = None
 
 
 class ResponseTotalBoardNewListModel(BaseModel):
@@ -2,12 +2,14 @@ from typing_extensions import Annotated, List
 from fastapi import (
     APIRouter, Depends, Path, HTTPException, status, Body
 )
-from fastapi.responses import FileResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.encoders import jsonable_encoder
 
 from core.database import db_session
 from lib.common import get_paging_info
 from lib.board_lib import insert_board_new, get_list_thumbnail
+from lib.download import create_download_response, is_full_download
+from lib.search import get_search_backend
 from api.v1.models.response import (
     response_401, response_403, response_404, response_422,
     response_429
@@ -54,9 +56,10 @@ async def api_list_post(
     writes = service.get_writes(
         with_files=True,
         page=pagination.page,
-        per_page=pagination.per_page
+        per_page=pagination.per_page,
+        cursor=pagination.cursor
     )
-    total_records = service.get_total_count()
+    total_records = service.get_total_count(approximate=pagination.cursor is not None)
     paging_info = get_paging_info(
         pagination.page, per_page, total_records
     )
@@ -67,10 +70,12 @@ async def api_list_post(
         "board": service.board,
         "notice_writes": service.get_notice_writes(),
         "writes": writes,
-        "total_count": service.get_total_count(),
+        "total_count": total_records,
         "current_page": service.search_params['current_page'],
         "prev_spt": service.prev_spt,
         "next_spt": service.next_spt,
+        "prev_cursor": service.prev_cursor,
+        "next_cursor": service.next_cursor,
     }
     return jsonable_encoder(content)
 
@@ -373,7 +378,8 @@ async def api_upload_file(
     - multipart/form-data로 전송해야 합니다.
     """
     write = service.get_write(wr_id)
-    service.upload_files(
+    await run_in_threadpool(
+        service.upload_files,
         file_service, write, data["files"], data["file_contents"], data["file_dels"]
     )
     return {"result": "uploaded"}
@@ -397,7 +403,11 @@ async def api_download_file(
     service.validate_download_level()
     board_file = service.get_board_file()
     service.validate_point(board_file)
-    return FileResponse(board_file.bf_file, filename=board_file.bf_source)
+    response = create_download_response(service.request, board_file.bf_file, board_file.bf_source)
+    if is_full_download(service.request, response):
+        # 다운로드 횟수 증가
+        service.file_service.update_download_count(board_file)
+    return response
 
 
 @router.post("/{bo_table}/writes/{wr_id}/comments",
@@ -469,6 +479,7 @@ async def api_update_comment(
     comment.wr_content = service.get_cleaned_data(comment_data.wr_content)
     comment.wr_option = comment_data.wr_option or "html1"
     comment.wr_last = service.g5_instance.get_wr_last_now(write_model.__tablename__)
+    get_search_backend().index_write(db, service.bo_table, comment)
     db.commit()
     return {"result": "updated"}
 
@@ -12,6 +12,7 @@ from sqlalchemy import delete
 from bbs.social import SocialAuthService
 from core.database import db_session
 from core.models import Member
+from lib.member_auth_cache import invalidate_member_auth
 from lib.pbkdf2 import validate_password
 from lib.mail import send_password_reset_mail, send_register_admin_mail, send_register_mail
 
@@ -134,6 +135,7 @@ async def certificate_email(
     member.mb_email_certify = datetime.now()
     member.mb_email_certify2 = ""
     db.commit()
+    invalidate_member_auth(mb_id)
 
     return {"message": "이메일 인증이 완료되었습니다."}
 
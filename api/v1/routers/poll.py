@@ -30,7 +30,6 @@ async def read_poll_latest(
 ) -> LatestPollResponse:
     """
     최신 설문조사 1건을 조회합니다.
-    - LRU(Least Recently Used)캐시를 사용하여 조회합니다.
     """
     return service.fetch_latest_poll()
 
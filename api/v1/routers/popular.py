@@ -9,7 +9,7 @@ from api.v1.models.popular import (
     CreatePopularRequest, PopularRequest, PopularResponse
 )
 from api.v1.models.response import MessageResponse, response_409, response_422, response_500
-from service.popular_service import PopularService
+from lib.page_chrome import get_cached_populars
 
 
 router = APIRouter()
@@ -19,14 +19,13 @@ router = APIRouter()
             summary="인기 검색어 목록 조회",
             responses={**response_422, **response_500})
 async def read_populars(
-    service: Annotated[PopularService, Depends()],
     data: Annotated[PopularRequest, Depends()]
 ) -> List[PopularResponse]:
     """
     인기 검색어 목록을 조회합니다.
-    - TTLCache(Time-To-Live) 캐시를 사용하여 조회합니다.
+    - 템플릿 공통 영역과 같은 캐시를 사용하여 조회합니다.
     """
-    return service.fetch_populars(data.limit, data.day)
+    return get_cached_populars(data.limit, data.day)
 
 
 @router.post("/populars",
@@ -40,9 +40,10 @@ async def create_visit_record(
     - 접속 이력 추가
     - 방문자 수 합계 테이블 갱신
     - 기본설정 테이블에 방문자 수 갱신
+    - 접속 이력과 방문자 수는 백그라운드에서 몇 초 간격으로 모아서 반영됩니다.
     """
-    visit = service.create_visit_record()
-    if not visit:
+    is_created = service.create_visit_record()
+    if not is_created:
         return {"message": "이미 방문한 사용자입니다."}
 
     return {"message": "방문자 접속 이력이 추가되었습니다."}
@@ -165,7 +165,7 @@ class CreatePostServiceAPI(CreatePostService):
         model_fields = inspect(self.write_model).columns.keys()
         filtered_wr_data = {key: value for key, value in wr_data_dict.items() if key in model_fields}
         write = self.write_model(**filtered_wr_data)
-        write.wr_num = parent_write.wr_num if parent_write else get_next_num(self.bo_table)
+        write.wr_num = parent_write.wr_num if parent_write else get_next_num(self.bo_table, db=self.db)
         write.wr_reply = generate_reply_character(self.board, parent_write) if parent_write else ""
         write.mb_id = self.member.mb_id if self.member.mb_id else ''
         write.wr_ip = self.request.client.host
@@ -257,8 +257,6 @@ class DownloadFileServiceAPI(DownloadFileService):
                 self.member.mb_id, download_point,
                 f"{self.board.bo_subject} {self.wr_id} 파일 다운로드", self.bo_table,
                 self.wr_id, "다운로드")
-            # 다운로드 횟수 증가
-            self.file_service.update_download_count(board_file)
             return
         
         point = number_format(abs(download_point))
@@ -4,12 +4,14 @@
 from typing_extensions import Annotated, List
 
 from fastapi import APIRouter, Depends, Request, Form, Path, Query, File, UploadFile
-from fastapi.responses import FileResponse, RedirectResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import RedirectResponse
 
 from core.database import db_session
 from core.exception import AlertException
 from core.formclass import WriteForm, WriteCommentForm
 from core.models import WriteBaseModel
+from core.settings import settings
 from core.template import UserTemplates
 from lib.member import get_admin_type
 from lib.board_lib import (
@@ -20,10 +22,12 @@ from lib.board_lib import (
 from lib.captcha import captcha_widget
 from lib.common import set_url_query_params, get_unique_id, remove_query_params
 from lib.dependency.board import get_write
+from lib.download import create_download_response
 from lib.dependency.dependencies import (
     check_group_access, common_search_query_params, validate_captcha, validate_token
 )
 from lib.template_functions import get_paging
+from lib.search import get_search_backend
 from service.board import (
     ListPostService, CreatePostService, ReadPostService,
     UpdatePostService, DeletePostService, GroupBoardListService,
@@ -76,12 +80,19 @@ async def list_post(
 ):
     """해당 게시판의 게시글 목록을 보여준다."""
     board = list_post_service.board
-    paging = get_paging(
-        list_post_service.request,
-        list_post_service.search_params['current_page'],
-        list_post_service.get_total_count(),
-        list_post_service.page_rows
-    )
+
+    # 커서 페이징을 사용하면 페이지 번호 대신 이전/다음 페이지 링크를 출력한다.
+    use_cursor = settings.BOARD_CURSOR_PAGINATION and list_post_service.is_cursor_available()
+    cursor = request.query_params.get("cursor", "") if use_cursor else None
+    if use_cursor:
+        paging = ""
+    else:
+        paging = get_paging(
+            list_post_service.request,
+            list_post_service.search_params['current_page'],
+            list_post_service.get_total_count(),
+            list_post_service.page_rows
+        )
 
     # 검색 단어를 인기검색어에 등록
     fields = search_params.get('sfl')
@@ -94,8 +105,8 @@ async def list_post(
         "board": board,
         "board_config": list_post_service,
         "notice_writes": list_post_service.get_notice_writes(),
-        "writes": list_post_service.get_writes(page=search_params.get('current_page')),
-        "total_count": list_post_service.get_total_count(),
+        "writes": list_post_service.get_writes(page=search_params.get('current_page'), cursor=cursor),
+        "total_count": list_post_service.get_total_count(approximate=use_cursor),
         "current_page": list_post_service.search_params['current_page'],
         "paging": paging,
         "is_write": list_post_service.is_write_level(),
@@ -104,6 +115,8 @@ async def list_post(
         "gallery_height": list_post_service.gallery_height,
         "prev_spt": list_post_service.prev_spt,
         "next_spt": list_post_service.next_spt,
+        "prev_cursor": list_post_service.prev_cursor if use_cursor else None,
+        "next_cursor": list_post_service.next_cursor if use_cursor else None,
     }
 
     return templates.TemplateResponse(f"/board/{board.bo_skin}/list_post.html", context)
@@ -327,7 +340,8 @@ async def create_post(
     set_write_delay(service.request)
     service.delete_auto_save(uid)
     service.save_secret_session(write.wr_id, secret)
-    service.upload_files(
+    await run_in_threadpool(
+        service.upload_files,
         file_service,
         write,
         files,
@@ -368,7 +382,8 @@ async def update_post(
     service.save_write(write, form_data)
     service.set_notice(wr_id, notice)
     service.delete_auto_save(uid)
-    service.upload_files(
+    await run_in_threadpool(
+        service.upload_files,
         file_service,
         write,
         files,
@@ -450,12 +465,12 @@ async def download_file(
         AlertException: 다운로드 권한 부재 / 파일 부재 / 포인트 부족
 
     Returns:
-        FileResponse: 파일 다운로드
+        Response: 파일 다운로드 (Range, If-None-Match 지원)
     """
     service.validate_download_level()
     board_file = service.get_board_file()
     service.validate_point_session(board_file)
-    return FileResponse(board_file.bf_file, filename=board_file.bf_source)
+    return create_download_response(service.request, board_file.bf_file, board_file.bf_source)
 
 
 @router.post(
@@ -498,6 +513,7 @@ async def write_comment_update(
         comment.wr_content = service.get_cleaned_data(form.wr_content)
         comment.wr_option = form.wr_secret or "html1"
         comment.wr_last = service.g5_instance.get_wr_last_now(write_model.__tablename__)
+        get_search_backend().index_write(service.db, service.bo_table, comment)
     service.db.commit()
     redirect_url = service.get_redirect_url(write)
     return RedirectResponse(redirect_url, status_code=303)
@@ -24,6 +24,7 @@ from lib.dependency.member import (
     validate_register_data, logout_only_view
 )
 from lib.mail import send_register_admin_mail, send_register_mail
+from lib.member_auth_cache import invalidate_member_auth
 from service.member_service import MemberImageService, MemberService, ValidateMember, ValidateMemberAjax
 from service.point_service import PointService
 
@@ -211,6 +212,7 @@ async def email_certify(
     member.mb_email_certify = datetime.now()
     member.mb_email_certify2 = ""
     db.commit()
+    invalidate_member_auth(mb_id)
 
     raise AlertException(f"메일인증 처리를 완료 하였습니다.\
                          \\n\\n지금부터 {member.mb_id} 아이디로 로그인 가능합니다", 200, "/")
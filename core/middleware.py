@@ -6,11 +6,6 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
-from core.plugin import (
-    register_plugin_admin_menu, get_plugin_state_change_time,
-    read_plugin_state, cache_plugin_state, cache_plugin_menu, register_plugin,
-    unregister_plugin, delete_router_by_tagname
-)
 from core.settings import settings, cors_config
 
 
@@ -27,22 +22,6 @@ def regist_core_middleware(app: FastAPI) -> None:
         if not await should_run_middleware(request):
             return await call_next(request)
 
-        # 플러그인 설정
-        plugin_state_change_time = get_plugin_state_change_time()
-        if cache_plugin_state.__getitem__('change_time') != plugin_state_change_time:
-            # 플러그인 상태변경시 캐시를 업데이트.
-            # 업데이트 이후 관리자 메뉴, 라우터 재등록/삭제
-            new_plugin_state = read_plugin_state()
-            register_plugin(new_plugin_state)
-            unregister_plugin(new_plugin_state)
-            for plugin in new_plugin_state:
-                if not plugin.is_enable:
-                    delete_router_by_tagname(app, plugin.module_name)
-
-            cache_plugin_menu.__setitem__('admin_menus', register_plugin_admin_menu(new_plugin_state))
-            cache_plugin_state.__setitem__('change_time', plugin_state_change_time)
-            cache_plugin_state.__setitem__('info', new_plugin_state)
-
         # 접속환경 설정
         request.state.is_mobile = False
         request.state.is_responsive = settings.IS_RESPONSIVE
@@ -731,6 +731,18 @@ class Popular(Base):
     index1 = Index("index1", pp_date, pp_word, pp_ip, unique=True)
 
 
+class PopularDaily(Base):
+    """
+    인기검색어 일별 집계 테이블
+    - (날짜, 검색어)별 검색 수를 기록하며, 인기검색어 순위는 이 테이블에서 구한다.
+    """
+    __tablename__ = DB_TABLE_PREFIX + "popular_daily"
+
+    pp_date = Column(Date, primary_key=True, nullable=False)
+    pp_word = Column(String(50), primary_key=True, nullable=False, default="")
+    pp_count = Column(Integer, nullable=False, default=0)
+
+
 class Auth(Base):
     """
     관리자페이지 권한 테이블
@@ -925,6 +937,33 @@ class BoardFile(Base):
     bf_datetime = Column(DateTime, nullable=False, default=func.now())
 
 
+class BoardSearchIndex(Base):
+    """
+    게시글 검색 색인 테이블
+    - 데이터베이스 전문검색을 사용할 수 없을 때 사용하는 역색인(2-gram) 테이블
+    """
+    __tablename__ = DB_TABLE_PREFIX + 'board_search_index'
+    __table_args__ = (
+        Index('idx_board_search_token', 'bo_table', 'si_token'),
+    )
+
+    bo_table = Column(String(20), primary_key=True, nullable=False, default='')
+    wr_id = Column(Integer, primary_key=True, nullable=False, default=0)
+    si_field = Column(String(20), primary_key=True, nullable=False, default='')
+    si_token = Column(String(10), primary_key=True, nullable=False, default='')
+
+
+class BoardNumSequence(Base):
+    """
+    게시판 글번호(wr_num) 할당 테이블
+    - 게시판별로 마지막에 할당한 wr_num(음수)을 기록한다.
+    """
+    __tablename__ = DB_TABLE_PREFIX + 'board_num_sequence'
+
+    bo_table = Column(String(20), primary_key=True, nullable=False, default='')
+    bs_num = Column(Integer, nullable=False, default=0)
+
+
 class MemberSocialProfiles(Base):
     """
     회원 소셜 프로필 테이블
@@ -1,3 +1,4 @@
+import asyncio
 import re
 import importlib
 import logging
@@ -7,12 +8,14 @@ from dataclasses import dataclass, field, asdict
 
 import cachetools
 from filelock import FileLock
+from starlette.concurrency import run_in_threadpool
 from starlette.staticfiles import StaticFiles
-from typing import List
+from typing import List, Optional
 
 PLUGIN_DIR = 'plugin'
 PLUGIN_STATE_FILE = 'plugin_states.json'
 PLUGIN_STATE_FILE_PATH = f'{PLUGIN_DIR}/{PLUGIN_STATE_FILE}'
+PLUGIN_WATCH_INTERVAL = 5  # 플러그인 상태 파일 변경 확인 주기 (단위: 초)
 
 # 전역 캐시
 # 플러그인 관리자 메뉴를 저장하는 캐시
@@ -350,3 +353,87 @@ def register_statics(app, plugin_info: List[PluginState], plugin_dir=PLUGIN_DIR)
             )
         except Exception as e:
             logging.warning(f"register_statics: {e}")
+
+
+class PluginRegistry:
+    """플러그인 등록 상태를 관리하는 클래스
+    - generation: 플러그인 라우터/관리자 메뉴를 다시 등록할 때마다 증가하는 세대 번호
+    - 상태 파일 변경은 요청마다 확인하지 않고 백그라운드 작업(run_plugin_watcher)에서 확인한다.
+    - 파일 읽기와 모듈 import는 별도 스레드에서 처리하고,
+      라우터 목록은 새 목록을 만든 뒤 한번에 교체하므로
+      요청 처리 중에 일부만 등록된 라우터 목록이 보이지 않는다.
+    """
+
+    def __init__(self):
+        self.generation = 0
+        self.change_time = 0
+        self.plugin_states: List[PluginState] = []
+        self._lock: Optional[asyncio.Lock] = None
+
+    def load(self, app) -> None:
+        """프로세스 시작 시 플러그인을 등록한다."""
+        change_time = get_plugin_state_change_time()
+        plugin_states = read_plugin_state()
+        import_plugin_by_states(plugin_states)
+        admin_menus = register_plugin_admin_menu(plugin_states)
+        self.publish(app, plugin_states, admin_menus, change_time)
+        register_statics(app, plugin_states)
+
+    async def refresh(self, app) -> bool:
+        """플러그인 상태 파일이 변경되었으면 플러그인을 다시 등록한다.
+
+        Returns:
+            bool: 다시 등록했는지 여부
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            change_time = await run_in_threadpool(get_plugin_state_change_time)
+            if change_time == self.change_time:
+                return False
+
+            plugin_states = await run_in_threadpool(read_plugin_state)
+            await run_in_threadpool(import_plugin_by_states, plugin_states)
+            admin_menus = await run_in_threadpool(register_plugin_admin_menu, plugin_states)
+            self.publish(app, plugin_states, admin_menus, change_time)
+            return True
+
+    def publish(self, app, plugin_states: List[PluginState], admin_menus: list, change_time: float) -> None:
+        """플러그인 라우터를 다시 등록한 뒤 라우터 목록과 캐시를 한번에 교체한다.
+        - 플러그인의 register_plugin()은 현재 라우터 목록의 끝에 라우터를 추가하므로,
+          등록하는 동안에는 이전 라우터가 먼저 검색되어 이전과 같이 동작한다.
+        - 등록이 끝나면 이전 플러그인 라우터를 제외한 새 목록으로 교체한다.
+          플러그인 라우터는 기존과 같이 다른 라우터보다 먼저 검색되도록 앞에 둔다.
+        """
+        routes = app.router.routes
+        registered_count = len(routes)
+        register_plugin(plugin_states)
+        unregister_plugin(plugin_states)
+
+        module_names = {plugin.module_name for plugin in [*self.plugin_states, *plugin_states]}
+        plugin_routes = routes[registered_count:]
+        core_routes = [route for route in routes[:registered_count]
+                       if not module_names.intersection(getattr(route, "tags", None) or [])]
+        app.router.routes = plugin_routes + core_routes
+
+        cache_plugin_menu.__setitem__('admin_menus', admin_menus)
+        cache_plugin_state.__setitem__('change_time', change_time)
+        cache_plugin_state.__setitem__('info', plugin_states)
+        self.plugin_states = plugin_states
+        self.change_time = change_time
+        self.generation += 1
+
+
+plugin_registry = PluginRegistry()
+
+
+async def run_plugin_watcher(app) -> None:
+    """PLUGIN_WATCH_INTERVAL 주기로 플러그인 상태 파일 변경을 확인하는 백그라운드 작업"""
+    while True:
+        await asyncio.sleep(PLUGIN_WATCH_INTERVAL)
+        try:
+            if await plugin_registry.refresh(app):
+                logging.info(f"plugin registry updated: generation {plugin_registry.generation}")
+        except Exception as e:
+            logging.error(f"플러그인 상태 반영 중 오류가 발생했습니다: {e}")
@@ -32,6 +32,14 @@ class Settings(BaseSettings):
 
     IS_RESPONSIVE: bool = True  # 반응형 사용
 
+    BOARD_CURSOR_PAGINATION: bool = False  # 게시판 목록 커서(keyset) 페이징 사용
+    SEARCH_BACKEND: str = "like"  # 게시판 검색 방식 (like, native, index)
+    CACHE_SHARED_BACKEND: str = ""  # worker 공유 캐시 저장소 ("", sqlite)
+    THUMBNAIL_WORKERS: int = 2  # 섬네일 생성 프로세스 수 (0: 요청 처리 중 바로 생성)
+    TEMPLATE_PRECOMPILE: bool = False  # 서버 시작 시 테마 템플릿 미리 컴파일
+    FILE_DOWNLOAD_OFFLOAD: str = ""  # 첨부파일 전송 웹서버 위임 ("", nginx, apache)
+    FILE_DOWNLOAD_ACCEL_PREFIX: str = "/protected"  # nginx X-Accel-Redirect internal location
+
     SESSION_COOKIE_NAME: str = "session"  # 세션 쿠키 이름
     SESSION_SECRET_KEY: str = ""  # 세션 비밀키
 
@@ -1,11 +1,16 @@
+import logging
 import os
 import re
+import threading
+import time
 import typing
+from contextvars import ContextVar
 
 from cachetools import LRUCache, cached
 from fastapi import FastAPI, Request
 from fastapi.templating import Jinja2Templates
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from jinja2.bccache import Bucket
 from sqlalchemy import select
 from starlette.background import BackgroundTask
 from starlette.staticfiles import StaticFiles
@@ -27,6 +32,8 @@ from lib.template_functions import (
     option_selected, option_array_checked, subject_sort_link
 )
 
+logger = logging.getLogger(__name__)
+
 @cached(LRUCache(maxsize=128))
 def get_current_theme() -> str:
     """현재 설정된 테마를 반환
@@ -90,6 +97,7 @@ TEMPLATES = "templates"
 
 ADMIN_TEMPLATES = "admin/templates"
 ADMIN_TEMPLATES_DIR = get_admin_theme_path()  # 관리자 템플릿 경로
+TEMPLATE_BYTECODE_DIR = os.path.join("data", "cache", "jinja")  # 컴파일된 템플릿 저장 경로
 
 class TemplateService():
     """템플릿 서비스 클래스
@@ -109,20 +117,48 @@ class TemplateService():
         cls._templates_dir = get_theme_path()
 
 
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    컴파일된 템플릿을 data 디렉토리에 저장하는 클래스
+    - 서버를 재시작하거나 worker가 늘어나도 템플릿 파일이 바뀌지 않았으면 다시 컴파일하지 않는다.
+    - 저장된 템플릿을 사용한 횟수와 새로 컴파일한 횟수를 기록한다.
+    """
+
+    def __init__(self, directory: str = TEMPLATE_BYTECODE_DIR):
+        os.makedirs(directory, exist_ok=True)
+        super().__init__(directory)
+        self.metrics = {"bytecode_hit_count": 0, "compile_count": 0}
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        super().load_bytecode(bucket)
+        if bucket.code is not None:
+            self.metrics["bytecode_hit_count"] += 1
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        # 저장된 템플릿이 없거나 템플릿 파일이 바뀌어 새로 컴파일한 경우에만 호출된다.
+        self.metrics["compile_count"] += 1
+        super().dump_bytecode(bucket)
+
+
 class UserTemplates(Jinja2Templates):
     """
     사용자 Jinja2Template 설정 클래스
     - 사용자에서 반복적으로 사용되는 템플릿 설정을 관리
     - 싱글톤 패턴으로 구현
+    - (테마 경로, 모바일 여부)마다 템플릿 환경(Environment)을 따로 두고 계속 사용한다.
+      필터/전역 설정은 기본 환경(self.env)과 공유한다.
     """
     _instance = None
-    _is_mobile: bool = False
-    default_directories = [
-        TemplateService.get_templates_dir(),
-        EDITOR_PATH,
-        CAPTCHA_PATH,
-        PLUGIN_DIR
-    ]
+    _environments: typing.Dict[typing.Tuple[str, bool], Environment] = {}
+    _rendered: typing.Set[typing.Tuple[int, str]] = set()
+    _lock = threading.Lock()
+    # 요청을 처리 중인 템플릿 환경 (동시에 처리하는 요청끼리 섞이지 않도록 컨텍스트 변수 사용)
+    _current_env: ContextVar[typing.Optional[Environment]] = ContextVar("user_template_env", default=None)
+    metrics = {
+        "cold_render_count": 0,
+        "cold_render_total_ms": 0.0,
+        "cold_render_max_ms": 0.0,
+    }
 
     def __new__(cls, *args, **kwargs):
         if not cls._instance:
@@ -136,8 +172,10 @@ class UserTemplates(Jinja2Templates):
                  env: Environment = None):
         if not getattr(self, '_initialized', False):
             self._initialized = True
-            super().__init__(directory=self.default_directories,
+            super().__init__(directory=self.get_directories(TemplateService.get_templates_dir()),
                              context_processors=context_processors)
+            self.bytecode_cache = TemplateBytecodeCache()
+            self.env.bytecode_cache = self.bytecode_cache
 
             # 템플릿 필터 설정
             self.env.filters["datetime_format"] = datetime_format
@@ -168,6 +206,79 @@ class UserTemplates(Jinja2Templates):
         }
         return context
 
+    @staticmethod
+    def get_directories(templates_dir: str, is_mobile: bool = False) -> typing.List[str]:
+        """템플릿 검색 경로를 반환한다.
+        - 모바일 템플릿을 사용할 경우 모바일 템플릿을 우선으로 검색하고,
+          mobile 템플릿이 존재하지 않을 경우 기본 템플릿을 사용한다.
+        """
+        directories = [templates_dir, EDITOR_PATH, CAPTCHA_PATH, PLUGIN_DIR]
+        if is_mobile:
+            directories.insert(0, f"{templates_dir}/mobile")
+        return directories
+
+    def get_environment(self, is_mobile: bool = False) -> Environment:
+        """현재 테마와 접속 기기에 맞는 템플릿 환경을 반환한다.
+        - 반응형(IS_RESPONSIVE)일 경우 모바일 접속도 기본 템플릿 환경을 사용한다.
+        """
+        templates_dir = TemplateService.get_templates_dir()
+        key = (templates_dir, is_mobile and not settings.IS_RESPONSIVE)
+        environment = self._environments.get(key)
+        if environment is None:
+            with self._lock:
+                environment = self._environments.get(key)
+                if environment is None:
+                    environment = self.env.overlay(
+                        loader=FileSystemLoader(self.get_directories(*key)),
+                        bytecode_cache=self.bytecode_cache
+                    )
+                    self._environments[key] = environment
+        return environment
+
+    def reset_environments(self) -> None:
+        """템플릿 환경을 모두 삭제한다. (테마 변경 시)"""
+        with self._lock:
+            self._environments.clear()
+            self._rendered.clear()
+
+    def get_template(self, name: str) -> Template:
+        environment = self._current_env.get() or self.get_environment()
+        return environment.get_template(name)
+
+    def precompile(self) -> int:
+        """현재 테마의 템플릿을 미리 컴파일한다. (TEMPLATE_PRECOMPILE)
+
+        Returns:
+            int: 컴파일한 템플릿 수
+        """
+        templates_dir = TemplateService.get_templates_dir()
+        names = [name for name in FileSystemLoader(templates_dir).list_templates()
+                 if name.endswith(".html") and not name.startswith("mobile/")]
+        devices = {False: names}
+        if not settings.IS_RESPONSIVE and os.path.isdir(f"{templates_dir}/mobile"):
+            mobile_names = FileSystemLoader(f"{templates_dir}/mobile").list_templates()
+            devices[True] = sorted(set(names) | {name for name in mobile_names if name.endswith(".html")})
+
+        count = 0
+        for is_mobile, device_names in devices.items():
+            environment = self.get_environment(is_mobile)
+            for name in device_names:
+                try:
+                    environment.get_template(name)
+                    count += 1
+                except Exception as e:
+                    logger.warning(f"템플릿 컴파일 실패 ({name}) : {e}")
+        logger.info(f"{templates_dir} 템플릿 {count}개 컴파일")
+        return count
+
+    def get_metrics(self) -> dict:
+        """템플릿 컴파일/최초 렌더링 지표를 반환한다."""
+        return {
+            "environment_count": len(self._environments),
+            **self.bytecode_cache.metrics,
+            **self.metrics,
+        }
+
     def TemplateResponse(
         self,
         name: str,
@@ -178,36 +289,39 @@ class UserTemplates(Jinja2Templates):
         background: typing.Optional[BackgroundTask] = None,
     ) -> _TemplateResponse:
         """Jinja2Templates TemplateResponse Override
-        
-        적응형&모바일 접근일 경우 모바일 템플릿을 우선으로 검색하도록 경로를 재설정한다.
-        - mobile 템플릿이 존재하지 않을 경우 기본 템플릿을 자동으로 사용한다.
-        - 클래스 변수(_is_mobile)를 통해 이전 요청과 비교하여 변경되었을 경우에만 경로를 재설정한다.
-        - 해당 로직은 생성자에서 처리하지 못한다.
+
+        적응형&모바일 접근일 경우 모바일 템플릿 환경으로 렌더링한다.
+        - 요청마다 템플릿 로더를 바꾸지 않으므로 컴파일된 템플릿을 계속 사용한다.
+        - 템플릿 환경별로 처음 렌더링하는 템플릿은 소요시간을 지표에 기록한다.
         """
         request = context.get("request")
         is_mobile: bool = getattr(request.state, "is_mobile", False)
-        if (not settings.IS_RESPONSIVE
-                and self._is_mobile != is_mobile):
-            # 경로 우선순위 변경
-            mobile_dir = f"{TemplateService.get_templates_dir()}/mobile"
-            if is_mobile:
-                self.default_directories.insert(0, mobile_dir)
-            else:
-                if mobile_dir in self.default_directories:
-                    self.default_directories.remove(mobile_dir)
-
-            # 템플릿 로더 재설정
-            self.env.loader = FileSystemLoader(self.default_directories)
-            self._is_mobile = is_mobile
-
-        return super().TemplateResponse(
-            name=name,
-            context=context,
-            status_code=status_code,
-            headers=headers,
-            media_type=media_type,
-            background=background
-        )
+        environment = self.get_environment(is_mobile)
+        rendered_key = (id(environment), name)
+        is_cold = rendered_key not in self._rendered
+
+        token = self._current_env.set(environment)
+        start_time = time.perf_counter()
+        try:
+            response = super().TemplateResponse(
+                name=name,
+                context=context,
+                status_code=status_code,
+                headers=headers,
+                media_type=media_type,
+                background=background
+            )
+        finally:
+            self._current_env.reset(token)
+
+        if is_cold:
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            self._rendered.add(rendered_key)
+            self.metrics["cold_render_count"] += 1
+            self.metrics["cold_render_total_ms"] += elapsed_ms
+            self.metrics["cold_render_max_ms"] = max(self.metrics["cold_render_max_ms"], elapsed_ms)
+
+        return response
 
 
 class AdminTemplates(Jinja2Templates):
@@ -30,6 +30,7 @@ from install.default_values import (
     default_group, default_member, default_qa_config, default_version
 )
 from lib.common import dynamic_create_write_table, read_license
+from lib.config_cache import invalidate_config_cache
 from lib.dependency.dependencies import validate_install, validate_token
 from lib.pbkdf2 import create_hash
 
@@ -211,6 +212,7 @@ async def install_process():
                 board_group_setup(db)
                 board_setup(db)
                 db.commit()
+                invalidate_config_cache()
                 yield "기본설정 정보 입력 완료"
 
             for board in default_boards:
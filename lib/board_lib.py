@@ -1,4 +1,7 @@
 """게시판/게시글 함수 모음"""
+import base64
+import binascii
+import json
 import os
 import re
 from datetime import datetime, timedelta
@@ -7,20 +10,24 @@ import bleach
 from typing import List
 from fastapi import Request
 from fastapi.templating import Jinja2Templates
-from sqlalchemy import and_, asc, desc, func, insert, or_, select
+from sqlalchemy import and_, asc, desc, func, insert, or_, select, update
 from sqlalchemy.sql.expression import Select
 from sqlalchemy.orm import Session
 
 from core.database import DBConnect
 from core.exception import AlertException
-from core.models import Board, BoardNew, Member, WriteBaseModel
+from core.models import Board, BoardFile, BoardGood, BoardNew, Member, WriteBaseModel
 from core.template import TemplateService, UserTemplates
 from lib.common import (
-    FileCache, StringEncrypt, cut_name, dynamic_create_write_table, get_admin_email,
-    get_admin_email_name, get_editor_image, thumbnail
+    StringEncrypt, cut_name, dynamic_create_write_table, get_admin_email,
+    get_admin_email_name, get_editor_image
 )
+from lib.cache import LATEST_CACHE_TAG, PENDING_THUMBNAIL_CACHE_TTL, get_cache
 from lib.mail import mailer
 from lib.member import MemberDetails
+from lib.search import get_search_backend
+from lib.sequence import write_num_allocator
+from lib.thumbnail import get_placeholder_thumbnail, get_thumbnail_generator, track_pending_thumbnails
 from service.board_file_service import BoardFileService as FileService
 
 
@@ -510,11 +517,11 @@ def write_search_filter(
                 fields.remove("wr_password")
 
             # 필드검색 필터 생성 (or 조건)
+            search_backend = get_search_backend()
             for word in words:
                 if not word.strip():
                     continue
-                word_filters.append(or_(
-                    *[getattr(model, field).like(f"%{word}%") for field in fields if hasattr(model, field)]))
+                word_filters.append(search_backend.word_filter(model, fields, word))
 
         # 분리된 단어 별 검색필터에 or 또는 and를 적용
         if operator == "and":
@@ -532,22 +539,63 @@ def write_search_filter(
         return query
 
 
-def get_next_num(bo_table: str) -> int:
-    """
-    게시판의 다음글 번호를 얻는다.
+def encode_list_cursor(write: WriteBaseModel, offset: int, direction: str = "next") -> str:
+    """게시글 목록의 커서(keyset) 페이징에 사용할 커서 문자열을 생성합니다.
+    - 커서는 (wr_num, wr_reply) 위치와 목록에서의 순번(offset)을 base64로 인코딩한 문자열입니다.
+
+    Args:
+        write (WriteBaseModel): 기준 게시글
+        offset (int): 다음(이전) 페이지 첫 게시글의 순번
+        direction (str, optional): 페이지 방향(next, prev). Defaults to "next".
+
+    Returns:
+        str: 커서 문자열
     """
-    try:
-        db = DBConnect().sessionLocal()
+    data = {"n": write.wr_num, "r": write.wr_reply, "o": offset, "d": direction}
+    encoded = base64.urlsafe_b64encode(json.dumps(data, separators=(",", ":")).encode())
+    return encoded.decode().rstrip("=")
+
 
-        write_model = dynamic_create_write_table(bo_table)
-        min_wr_num = db.scalar(select(func.coalesce(func.min(write_model.wr_num), 0)))
+def decode_list_cursor(cursor: str) -> dict:
+    """커서 문자열을 해석합니다.
 
-        return min_wr_num - 1
-    finally:
-        db.close()
+    Args:
+        cursor (str): 커서 문자열
+
+    Raises:
+        ValueError: 올바르지 않은 커서
+
+    Returns:
+        dict: wr_num, wr_reply, offset, direction
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        direction = data.get("d", "next")
+        if direction not in ("next", "prev"):
+            raise ValueError(direction)
+        return {
+            "wr_num": int(data["n"]),
+            "wr_reply": str(data["r"]),
+            "offset": max(int(data.get("o", 0)), 0),
+            "direction": direction,
+        }
+    except (TypeError, KeyError, ValueError, binascii.Error) as e:
+        raise ValueError("올바르지 않은 커서입니다.") from e
+
+
+def get_next_num(bo_table: str, count: int = 1, db: Session = None) -> int:
+    """
+    게시판의 다음글 번호를 얻는다.
+    - 여러 글을 한번에 추가할 때는 count개를 한번에 할당하며,
+      할당된 번호는 (다음글 번호 - count + 1) ~ 다음글 번호이다.
+    - 글을 저장하는 세션(db)을 전달하면 같은 트랜잭션에서 할당한다.
+    """
+    return write_num_allocator.reserve(bo_table, count, db)
 
 
-def get_list(request: Request, db: Session, write: WriteBaseModel, board_config: BoardConfig, subject_len: int = 0):
+def get_list(request: Request, db: Session, write: WriteBaseModel, board_config: BoardConfig,
+             subject_len: int = 0, icon_file: bool = None):
     """게시글 목록의 출력에 필요한 정보를 추가합니다.
     - 그누보드5의 get_list와 동일한 기능을 합니다.
 
@@ -556,11 +604,11 @@ def get_list(request: Request, db: Session, write: WriteBaseModel, board_config:
         write (WriteBaseModel): 게시글 객체.
         board (Board): 게시판 객체.
         subject_len (int, optional): 게시글 제목 길이. Defaults to 0.
+        icon_file (bool, optional): 첨부파일 존재 여부. 미리 조회한 경우 전달하며, None이면 조회한다.
 
     Returns:
         WriteBaseModel: 게시글 목록.
     """
-    file_service = FileService(request, db)
     write.subject = board_config.cut_write_subject(write.wr_subject, subject_len)
     write.name = cut_name(request, write.wr_name)
     write.email = StringEncrypt().encrypt(write.wr_email)
@@ -570,7 +618,9 @@ def get_list(request: Request, db: Session, write: WriteBaseModel, board_config:
     write.icon_secret = "secret" in write.wr_option
     write.icon_hot = board_config.is_icon_hot(write.wr_hit)
     write.icon_new = board_config.is_icon_new(write.wr_datetime)
-    write.icon_file = file_service.is_exist(board_config.board.bo_table, write.wr_id)
+    if icon_file is None:
+        icon_file = FileService(request, db).is_exist(board_config.board.bo_table, write.wr_id)
+    write.icon_file = icon_file
     write.icon_link = write.wr_link1 or write.wr_link2
     write.icon_reply = write.wr_reply
 
@@ -727,7 +777,8 @@ def send_write_mail(request: Request, board: Board, write: WriteBaseModel, origi
             mailer(get_admin_email(request), email, subject, body, get_admin_email_name(request))
 
 
-def get_list_thumbnail(request: Request, board: Board, write: WriteBaseModel, thumb_width: int, thumb_height: int, **kwargs):
+def get_list_thumbnail(request: Request, board: Board, write: WriteBaseModel, thumb_width: int, thumb_height: int,
+                       images: List[BoardFile] = None, **kwargs):
     """게시글 목록의 섬네일 이미지를 생성한다.
 
     Args:
@@ -736,11 +787,13 @@ def get_list_thumbnail(request: Request, board: Board, write: WriteBaseModel, th
         write (WriteBaseModel): _description_
         thumb_width (int, optional): _description_. Defaults to 0.
         thumb_height (int, optional): _description_. Defaults to 0.
+        images (List[BoardFile], optional): 미리 조회한 이미지 파일 목록. None이면 조회한다.
     """
     config = request.state.config
-    with DBConnect().sessionLocal() as db:
-        service = FileService(request, db)
-        images, files = service.get_board_files_by_type(board.bo_table, write.wr_id)
+    if images is None:
+        with DBConnect().sessionLocal() as db:
+            service = FileService(request, db)
+            images, _ = service.get_board_files_by_type(board.bo_table, write.wr_id)
     source_file = None
     result = {"src": "", "alt": "", "noimg":""}
 
@@ -773,14 +826,13 @@ def get_list_thumbnail(request: Request, board: Board, write: WriteBaseModel, th
                 print(e)
                 continue
 
-    # 섬네일 생성
+    # 섬네일 생성 (생성 중이면 대체 이미지를 보여준다)
     if source_file:
-        result["src"] = thumbnail(source_file, width=thumb_width, height=thumb_height, **kwargs)
+        src = get_thumbnail_generator().get(source_file, thumb_width, thumb_height)
+        result["src"] = get_placeholder_thumbnail(thumb_width, thumb_height) if src is None else src
     # 이미지가 없을 때
     else:
-        result["src"] = thumbnail("./static/img/dummy-donotremove.png",
-                        target_path="./data/thumbnail_tmp",
-                        width=thumb_width, height=thumb_height, **kwargs)
+        result["src"] = get_placeholder_thumbnail(thumb_width, thumb_height)
         result["noimg"] = "img_not_found"
 
     return result
@@ -890,6 +942,41 @@ def insert_board_new(bo_table: str, write: WriteBaseModel) -> None:
     db.close()
 
 
+def reconcile_good_counts():
+    """게시글의 추천/비추천 수(wr_good, wr_nogood)를 추천 데이터(BoardGood)와 맞춘다.
+    - 추천/비추천 수는 게시글 테이블의 값을 그대로 사용하므로,
+      집계가 어긋난 게시글만 다시 계산하여 수정한다.
+    """
+    with DBConnect().sessionLocal() as db:
+        bo_tables = db.scalars(select(Board.bo_table)).all()
+        for bo_table in bo_tables:
+            try:
+                write_model = dynamic_create_write_table(bo_table)
+                counts = {
+                    flag: (
+                        select(func.count(BoardGood.bg_id))
+                        .where(BoardGood.bo_table == bo_table,
+                               BoardGood.wr_id == write_model.wr_id,
+                               BoardGood.bg_flag == flag)
+                        .scalar_subquery()
+                    )
+                    for flag in ("good", "nogood")
+                }
+                result = db.execute(
+                    update(write_model)
+                    .where(or_(write_model.wr_good != counts["good"],
+                               write_model.wr_nogood != counts["nogood"]))
+                    .values(wr_good=counts["good"], wr_nogood=counts["nogood"])
+                    .execution_options(synchronize_session=False)
+                )
+                db.commit()
+                if result.rowcount:
+                    print(f"{bo_table} 게시판 추천/비추천 수 보정 : {result.rowcount}건")
+            except Exception as e:
+                db.rollback()
+                print(f"{bo_table} 게시판 추천/비추천 수 보정 실패 : ", e)
+
+
 def get_bo_table_list(added_bo_table_list: List[str] = None) -> list:
     from install.default_values import default_boards
 
@@ -917,44 +1004,50 @@ def render_latest_posts(request: Request, skin_name: str = 'basic', bo_table: st
     templates.env.globals["get_list_thumbnail"] = get_list_thumbnail
 
     device = request.state.device
-    file_cache = FileCache()
-    cache_filename = f"latest-{bo_table}-{device}-{skin_name}-{rows}-{subject_len}-{file_cache.get_cache_secret_key()}.html"
-    cache_file = os.path.join(file_cache.cache_dir, cache_filename)
+    cache_key = f"latest-{bo_table}-{device}-{skin_name}-{rows}-{subject_len}"
+    cache_tags = (LATEST_CACHE_TAG, f"{LATEST_CACHE_TAG}-{bo_table}")
+    pending_thumbnails = []
 
-    # 캐시된 파일이 있으면 파일을 읽어서 반환
-    if os.path.exists(cache_file):
-        return file_cache.get(cache_file)
+    def create_latest_posts() -> str:
+        with track_pending_thumbnails() as pending:
+            html = render_html()
+        pending_thumbnails.extend(pending)
+        return html
 
-    with DBConnect().sessionLocal() as db:
-        # 게시판 설정
-        board = db.get(Board, bo_table)
-        if not board:
-            return ""
+    def render_html() -> str:
+        with DBConnect().sessionLocal() as db:
+            # 게시판 설정
+            board = db.get(Board, bo_table)
+            if not board:
+                return ""
 
-        board_config = BoardConfig(request, board)
-        board.subject = board_config.subject
-
-        #게시글 목록 조회
-        write_model = dynamic_create_write_table(bo_table)
-        writes = db.scalars(
-            select(write_model)
-            .where(write_model.wr_is_comment == 0)
-            .order_by(write_model.wr_num)
-            .limit(rows)
-        ).all()
-        for write in writes:
-            write = get_list(request, db, write, board_config, subject_len)
-
-    context = {
-        "request": request,
-        "board": board,
-        "writes": writes,
-        "bo_table": bo_table,
-    }
-    temp = templates.TemplateResponse(f"latest/{skin_name}.html", context)
-    temp_decode = temp.body.decode("utf-8")
-
-    # 캐시 파일 생성
-    file_cache.create(temp_decode, cache_file)
-
-    return temp_decode
+            board_config = BoardConfig(request, board)
+            board.subject = board_config.subject
+
+            #게시글 목록 조회
+            write_model = dynamic_create_write_table(bo_table)
+            writes = db.scalars(
+                select(write_model)
+                .where(write_model.wr_is_comment == 0)
+                .order_by(write_model.wr_num)
+                .limit(rows)
+            ).all()
+            for write in writes:
+                write = get_list(request, db, write, board_config, subject_len)
+
+        context = {
+            "request": request,
+            "board": board,
+            "writes": writes,
+            "bo_table": bo_table,
+        }
+        temp = templates.TemplateResponse(f"latest/{skin_name}.html", context)
+        return temp.body.decode("utf-8")
+
+    # 캐시된 최신글이 있으면 반환하고, 없으면 생성하여 캐시한다.
+    cache = get_cache()
+    html = cache.get_or_set(cache_key, create_latest_posts, tags=cache_tags)
+    # 섬네일 생성 중이라 대체 이미지가 포함되었으면 섬네일이 생성된 뒤 다시 렌더링하도록 짧게 캐시한다.
+    if pending_thumbnails:
+        cache.set(cache_key, html, PENDING_THUMBNAIL_CACHE_TTL, cache_tags)
+    return html
@@ -0,0 +1,360 @@
+"""렌더링 결과 등을 저장하는 캐시 모듈입니다.
+
+- 1차 캐시: 프로세스 메모리의 LRU 캐시
+- 2차 캐시(선택): 여러 worker가 함께 사용하는 SQLite 파일 캐시 (CACHE_SHARED_BACKEND="sqlite")
+- 태그 단위 무효화: 캐시 저장 시 태그 버전을 함께 저장하고, 조회 시 현재 태그 버전과 비교한다.
+  태그 버전은 VersionStamp로 관리하므로 모든 worker에 바로 반영된다.
+- 동시 갱신 방지: 캐시가 만료되면 잠금을 얻은 하나의 worker만 다시 생성하고,
+  나머지 worker는 이전 캐시를 반환하거나 생성이 끝날 때까지 잠시 기다린다.
+- 백그라운드 갱신(get_or_revalidate): 유효시간만 지난 캐시는 이전 값을 바로 반환하고,
+  잠금을 얻은 하나의 worker가 백그라운드 스레드에서 다시 생성한다.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from glob import glob
+from typing import Callable, Dict, Iterable, NamedTuple, Optional
+
+from cachetools import LRUCache
+from filelock import FileLock
+
+from core.settings import settings
+from lib.common import VersionStamp
+
+logger = logging.getLogger(__name__)
+
+CACHE_DEFAULT_TTL = 3600  # 단위: 초
+# 섬네일 생성 중이라 대체 이미지가 포함된 렌더링 결과의 유효시간
+PENDING_THUMBNAIL_CACHE_TTL = 10  # 단위: 초
+# 모든 캐시에 붙는 태그 (전체 캐시 삭제용)
+CACHE_ALL_TAG = "all"
+# 최신글 캐시 태그 (게시판별 태그: latest-{bo_table})
+LATEST_CACHE_TAG = "latest"
+
+
+class CacheEntry(NamedTuple):
+    """캐시 항목"""
+    value: str
+    expire_at: float
+    tag_versions: Dict[str, int]
+
+
+class MemoryCacheStore():
+    """프로세스 메모리 LRU 캐시 저장소"""
+
+    def __init__(self, maxsize: int = 1024):
+        self.entries = LRUCache(maxsize=maxsize)
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self.lock:
+            return self.entries.get(key)
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self.lock:
+            self.entries[key] = entry
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+class SQLiteCacheStore():
+    """여러 worker가 함께 사용하는 SQLite 파일 캐시 저장소
+    - data 디렉토리는 정적 파일(/data)로 공개되므로, 처음 만들 때 임의의 파일이름을 사용하여
+      캐시 파일 주소를 추측할 수 없도록 한다. 이후에는 모든 worker가 같은 파일을 찾아 사용한다.
+    """
+    directory = "data"
+    filename_pattern = "shared_cache_*.sqlite3"
+    # 이전 버전에서 사용하던 고정된 파일이름 (공개되지 않도록 삭제)
+    legacy_path = os.path.join("data", "shared_cache.sqlite3")
+
+    def __init__(self):
+        self.local = threading.local()
+        self.path = self._get_path()
+
+    @classmethod
+    def _get_path(cls) -> str:
+        """캐시 파일 경로를 반환한다. 파일이 없으면 임의의 파일이름으로 만든다."""
+        os.makedirs(cls.directory, exist_ok=True)
+        with FileLock(os.path.join(cls.directory, "shared_cache.lock")):
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(cls.legacy_path + suffix):
+                    os.remove(cls.legacy_path + suffix)
+
+            paths = sorted(glob(os.path.join(cls.directory, cls.filename_pattern)))
+            if paths:
+                return paths[0]
+
+            path = os.path.join(cls.directory, f"shared_cache_{os.urandom(16).hex()}.sqlite3")
+            # 다른 worker가 같은 파일을 찾을 수 있도록 잠금 안에서 빈 파일을 만든다.
+            open(path, "a").close()
+            return path
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """스레드별 연결을 반환한다."""
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entry ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expire_at REAL NOT NULL, tag_versions TEXT NOT NULL)"
+            )
+            self.local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            row = self.connection.execute(
+                "SELECT value, expire_at, tag_versions FROM cache_entry WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        if not row:
+            return None
+        return CacheEntry(row[0], row[1], json.loads(row[2]))
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        try:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO cache_entry (key, value, expire_at, tag_versions) VALUES (?, ?, ?, ?)",
+                (key, entry.value, entry.expire_at, json.dumps(entry.tag_versions))
+            )
+        except sqlite3.Error:
+            pass
+
+    def clear(self) -> None:
+        try:
+            self.connection.execute("DELETE FROM cache_entry")
+        except sqlite3.Error:
+            pass
+
+
+class CacheLock():
+    """여러 worker 사이의 캐시 생성 잠금
+    - 잠금 파일을 배타적으로 생성(O_EXCL)하여 하나의 worker만 잠금을 얻는다.
+    - 잠금을 얻은 worker가 비정상 종료한 경우를 대비하여 timeout이 지난 잠금 파일은 무시한다.
+    """
+    lock_dir = os.path.join("data", "cache_lock")
+    timeout = 10  # 단위: 초
+
+    def __init__(self, key: str):
+        self.path = os.path.join(self.lock_dir, key.replace(os.sep, "_"))
+
+    def acquire(self) -> bool:
+        """잠금을 얻으면 True, 다른 worker가 잠금 중이면 False를 반환한다."""
+        os.makedirs(self.lock_dir, exist_ok=True)
+        for _ in range(2):
+            try:
+                os.close(os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return True
+            except FileExistsError:
+                try:
+                    if time.time() - os.stat(self.path).st_mtime < self.timeout:
+                        return False
+                    os.remove(self.path)
+                except OSError:
+                    pass
+        return False
+
+    def release(self) -> None:
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+class Cache():
+    """메모리 LRU + 공유 저장소(선택) 2단계 캐시"""
+    # 다른 worker가 생성 중일 때 기다리는 최대 시간(초)과 확인 간격(초)
+    wait_timeout = 1
+    wait_interval = 0.05
+
+    def __init__(self, shared_store: Optional[SQLiteCacheStore] = None):
+        self.memory_store = MemoryCacheStore()
+        self.shared_store = shared_store
+        self.tag_stamps: Dict[str, VersionStamp] = {}
+
+    def get_tag_versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        """태그별 현재 버전을 반환한다."""
+        versions = {}
+        for tag in (CACHE_ALL_TAG, *tags):
+            if tag not in self.tag_stamps:
+                self.tag_stamps[tag] = VersionStamp(f"cache-{tag}")
+            versions[tag] = self.tag_stamps[tag].current()
+        return versions
+
+    def invalidate_tags(self, *tags: str) -> None:
+        """태그가 붙은 캐시를 모두 무효화한다.
+
+        Args:
+            *tags (str): 무효화할 태그 (예: latest-{bo_table})
+        """
+        for tag in tags:
+            VersionStamp(f"cache-{tag}").bump()
+
+    def clear(self) -> None:
+        """전체 캐시를 무효화한다."""
+        self.memory_store.clear()
+        if self.shared_store:
+            self.shared_store.clear()
+        self.invalidate_tags(CACHE_ALL_TAG)
+
+    def get(self, key: str, tags: Iterable[str] = ()) -> Optional[str]:
+        """유효한 캐시가 있으면 반환한다."""
+        tag_versions = self.get_tag_versions(tags)
+        entry = self._get_entry(key, tag_versions)
+        if entry and self._is_fresh(entry, tag_versions):
+            return entry.value
+        return None
+
+    def set(self, key: str, value: str, ttl: int = CACHE_DEFAULT_TTL,
+            tags: Iterable[str] = (), tag_versions: Dict[str, int] = None) -> None:
+        """캐시를 저장한다.
+
+        Args:
+            key (str): 캐시 키
+            value (str): 저장할 값
+            ttl (int, optional): 유효시간(초). Defaults to CACHE_DEFAULT_TTL.
+            tags (Iterable[str], optional): 무효화에 사용할 태그 목록. Defaults to ().
+            tag_versions (Dict[str, int], optional): 값을 생성하기 전에 조회한 태그 버전.
+                생성 중에 무효화된 경우 다음 조회에서 다시 생성되도록 한다.
+        """
+        entry = CacheEntry(value, time.time() + ttl, tag_versions or self.get_tag_versions(tags))
+        self.memory_store.set(key, entry)
+        if self.shared_store:
+            self.shared_store.set(key, entry)
+
+    def get_or_set(self, key: str, creator: Callable[[], str],
+                   ttl: int = CACHE_DEFAULT_TTL, tags: Iterable[str] = ()) -> str:
+        """캐시가 있으면 반환하고, 없으면 creator로 생성하여 저장한 뒤 반환한다.
+        - 하나의 worker만 잠금을 얻어 생성하고, 다른 worker는 이전 캐시를 반환하거나 잠시 기다린다.
+
+        Args:
+            key (str): 캐시 키
+            creator (Callable[[], str]): 캐시할 값을 생성하는 함수
+            ttl (int, optional): 유효시간(초). Defaults to CACHE_DEFAULT_TTL.
+            tags (Iterable[str], optional): 무효화에 사용할 태그 목록. Defaults to ().
+
+        Returns:
+            str: 캐시된 값 또는 새로 생성한 값
+        """
+        tag_versions = self.get_tag_versions(tags)
+        entry = self._get_entry(key, tag_versions)
+        if entry and self._is_fresh(entry, tag_versions):
+            return entry.value
+
+        lock = CacheLock(key)
+        if lock.acquire():
+            try:
+                value = creator()
+                self.set(key, value, ttl, tags, tag_versions)
+                return value
+            finally:
+                lock.release()
+
+        # 다른 worker가 생성 중이면 이전 캐시를 반환한다.
+        if entry:
+            return entry.value
+
+        # 이전 캐시가 없으면 공유 저장소에 생성될 때까지 잠시 기다린다.
+        if self.shared_store:
+            deadline = time.monotonic() + self.wait_timeout
+            while time.monotonic() < deadline:
+                time.sleep(self.wait_interval)
+                entry = self._get_entry(key, tag_versions)
+                if entry and self._is_fresh(entry, tag_versions):
+                    return entry.value
+
+        value = creator()
+        self.set(key, value, ttl, tags, tag_versions)
+        return value
+
+    def get_or_revalidate(self, key: str, creator: Callable[[], str],
+                          ttl: int = CACHE_DEFAULT_TTL, tags: Iterable[str] = ()) -> str:
+        """캐시가 있으면 반환하고, 유효시간만 지난 캐시는 이전 값을 반환하면서 백그라운드에서 다시 생성한다.
+        - 태그가 무효화된 캐시는 이전 값을 반환하지 않고 get_or_set()으로 바로 다시 생성한다.
+        - creator는 백그라운드 스레드에서 실행될 수 있으므로 요청에 묶인 데이터베이스 세션을 사용하면 안된다.
+
+        Args:
+            key (str): 캐시 키
+            creator (Callable[[], str]): 캐시할 값을 생성하는 함수
+            ttl (int, optional): 유효시간(초). Defaults to CACHE_DEFAULT_TTL.
+            tags (Iterable[str], optional): 무효화에 사용할 태그 목록. Defaults to ().
+
+        Returns:
+            str: 캐시된 값 또는 새로 생성한 값
+        """
+        tag_versions = self.get_tag_versions(tags)
+        entry = self._get_entry(key, tag_versions)
+        if entry is None or entry.tag_versions != tag_versions:
+            return self.get_or_set(key, creator, ttl, tags)
+
+        if entry.expire_at < time.time():
+            self._revalidate(key, creator, ttl, tags, tag_versions)
+        return entry.value
+
+    def _revalidate(self, key: str, creator: Callable[[], str],
+                    ttl: int, tags: Iterable[str], tag_versions: Dict[str, int]) -> None:
+        """잠금을 얻으면 백그라운드 스레드에서 캐시를 다시 생성한다."""
+        lock = CacheLock(key)
+        if not lock.acquire():
+            return
+
+        def refresh():
+            try:
+                self.set(key, creator(), ttl, tags, tag_versions)
+            except Exception as e:
+                logger.warning(f"캐시를 갱신하지 못했습니다 ({key}) : {e}")
+            finally:
+                lock.release()
+
+        try:
+            _revalidate_executor.submit(refresh)
+        except RuntimeError:
+            lock.release()
+
+    def _get_entry(self, key: str, tag_versions: Dict[str, int]) -> Optional[CacheEntry]:
+        """메모리 캐시를 먼저 조회하고, 유효하지 않으면 공유 저장소를 조회한다."""
+        entry = self.memory_store.get(key)
+        if (entry is None or not self._is_fresh(entry, tag_versions)) and self.shared_store:
+            shared_entry = self.shared_store.get(key)
+            if shared_entry and (entry is None or self._is_fresh(shared_entry, tag_versions)):
+                entry = shared_entry
+                self.memory_store.set(key, entry)
+        return entry
+
+    def _is_fresh(self, entry: CacheEntry, tag_versions: Dict[str, int]) -> bool:
+        """유효시간이 지나지 않았고 태그 버전이 같으면 유효한 캐시이다."""
+        return entry.expire_at >= time.time() and entry.tag_versions == tag_versions
+
+
+_cache: Optional[Cache] = None
+_revalidate_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cache-revalidate")
+
+
+def get_cache() -> Cache:
+    """설정(CACHE_SHARED_BACKEND)에 맞는 캐시 인스턴스를 반환하는 함수"""
+    global _cache
+    if _cache is None:
+        shared_store = SQLiteCacheStore() if settings.CACHE_SHARED_BACKEND.lower() == "sqlite" else None
+        _cache = Cache(shared_store)
+    return _cache
+
+
+def invalidate_latest_cache(bo_table: str = None) -> None:
+    """최신글 캐시를 무효화하는 함수
+
+    Args:
+        bo_table (str, optional): 게시판 아이디. 없으면 모든 게시판의 최신글 캐시를 무효화한다.
+    """
+    tag = f"{LATEST_CACHE_TAG}-{bo_table}" if bo_table else LATEST_CACHE_TAG
+    get_cache().invalidate_tags(tag)
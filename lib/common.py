@@ -7,6 +7,7 @@ import os
 import random
 import re
 import shutil
+import threading
 from datetime import date, datetime, timedelta
 from time import sleep
 from typing import Any, List, Optional, Union
@@ -15,7 +16,7 @@ import httpx
 from dotenv import load_dotenv
 from fastapi import Request, UploadFile
 from markupsafe import Markup, escape
-from PIL import Image, ImageOps, UnidentifiedImageError
+from PIL import Image, UnidentifiedImageError
 from sqlalchemy import (
     Index, asc, cast, delete, desc, func, select, String, DateTime
 )
@@ -27,6 +28,9 @@ from core.models import (
     BoardNew, Config, Member, Memo, UniqId, Visit, WriteBaseModel
 )
 from core.plugin import get_admin_menu_id_by_path
+from lib.g5_compatibility import schema_registry
+from lib.search import get_search_backend
+from lib.thumbnail import create_thumbnail
 
 load_dotenv()
 
@@ -76,6 +80,9 @@ def dynamic_create_write_table(
     # 게시판 추가시 한번만 테이블 생성
     if create_table:
         DynamicModel.__table__.create(bind=db_connect.engine, checkfirst=True)
+        get_search_backend().prepare_table(DynamicModel)
+        # 새로 생성한 테이블의 컬럼 차이는 다시 조회한다.
+        schema_registry.invalidate(DynamicModel.__tablename__)
     # 생성된 모델 캐싱
     _created_models[table_name] = DynamicModel
     return DynamicModel
@@ -369,62 +376,46 @@ class StringEncrypt:
 # decrypted_text = enc.decrypt(encrypted_text)
 # print(decrypted_text)
 
-class FileCache():
-    """파일 캐시 클래스
+class VersionStamp():
+    """여러 프로세스(uvicorn worker)가 공유하는 버전 스탬프 클래스
+    - data/version 디렉토리의 파일에 임의의 버전 값을 저장한다.
+    - 데이터가 변경되면 bump()로 새 버전 값을 기록하고,
+      각 프로세스는 current()를 비교하여 캐시를 다시 불러온다.
+    - 파일 변경시간(mtime)은 파일시스템에 따라 같은 시간 단위 안에서 바뀌지 않으므로
+      버전으로 사용하지 않고, 파일 내용을 비교한다.
     """
-    cache_dir = os.path.join("data", "cache")
-    cache_secret_key = None
+    version_dir = os.path.join("data", "version")
 
-    def __init__(self):
-        # 캐시 디렉토리가 없으면 생성
-        os.makedirs(self.cache_dir, exist_ok=True)
+    def __init__(self, name: str):
+        self.name = name
+        self.path = os.path.join(self.version_dir, name)
 
-    def get_cache_secret_key(self):
-        """
-        캐시 비밀키를 반환하는 함수
-        """
-        # 캐시된 값이 있다면, 해당 값을 반환
-        if self.cache_secret_key:
-            return self.cache_secret_key
-
-        # 서버 소프트웨어 및 DOCUMENT_ROOT 값을 해싱하여 6자리 문자열 생성
-        server_software = os.environ.get("SERVER_SOFTWARE", "")
-        document_root = os.environ.get("DOCUMENT_ROOT", "")
-        combined_data = server_software + document_root
-        self.cache_secret_key = hashlib.md5(combined_data.encode()).hexdigest()[:6]
-
-        return self.cache_secret_key
-
-    def get(self, cache_file: str):
-        """
-        캐시된 파일이 있으면 파일을 읽어서 반환
-        """
-        if os.path.exists(cache_file):
-            with open(cache_file, "r", encoding="utf-8") as f:
-                return f.read()
-        return None
+    def current(self) -> int:
+        """현재 버전을 반환한다.
 
-    def create(self, data: str, cache_file: str):
-        """
-        cache_file을 생성하는 함수
+        Returns:
+            int: 버전 파일에 기록된 값, 파일이 없거나 읽을 수 없으면 0
         """
-        with open(cache_file, "w", encoding="utf-8") as f:
-            f.write(data)
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return int(f.read().strip())
+        except (OSError, ValueError):
+            return 0
 
-    def delete(self, cache_file: str):
-        """
-        cache_file을 삭제하는 함수
-        """
-        if os.path.exists(cache_file):
-            os.remove(cache_file)
+    def bump(self) -> int:
+        """버전을 갱신한다.
+        - 임시 파일에 기록한 뒤 교체하므로 다른 프로세스가 기록 중인 값을 읽지 않는다.
 
-    def delete_prefix(self, prefix: str):
-        """
-        prefix로 시작하는 캐시 파일을 모두 삭제하는 함수
+        Returns:
+            int: 갱신된 버전
         """
-        for file in os.listdir(self.cache_dir):
-            if file.startswith(prefix):
-                os.remove(os.path.join(self.cache_dir, file))
+        os.makedirs(self.version_dir, exist_ok=True)
+        version = int.from_bytes(os.urandom(7), "big") + 1
+        temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(str(version))
+        os.replace(temp_path, self.path)
+        return version
 
 
 def get_admin_email(request: Request):
@@ -534,25 +525,9 @@ def thumbnail(source_file: str, target_path: str = None, width: int = 200, heigh
             if os.path.getmtime(source_file) < os.path.getmtime(thumbnail_file):
                 return thumbnail_file
 
-        # 이미지 객체 생성
+        # 이미지 객체 생성 및 섬네일 저장
         # 파일이 없가나 이미지가 아닐 경우 예외가 발생하므로 검사를 따로 하지 않음.
-        source_image = Image.open(source_file)
-        source_width, source_height = source_image.size
-
-        # 이미지가 섬네일이미지보다 작을 경우
-        if source_width < width or source_height < height:
-            # 확장 이미지 생성
-            expanded_img = Image.new("RGB", (width, height), (255, 255, 255))
-            # 기존 이미지를 확장된 이미지 중앙에 삽입
-            left = (width - source_width) // 2
-            top = (height - source_height) // 2
-            expanded_img.paste(source_image, (left, top))
-            expanded_img.save(thumbnail_file)
-        else:
-            # 이미지를 지정한 크기로 자르고 저장
-            ImageOps.fit(source_image, (width, height)).save(thumbnail_file)
-            # source_image.thumbnail((width, height))
-            # source_image.save(thumbnail_file)
+        create_thumbnail(source_file, thumbnail_file, width, height)
 
         return thumbnail_file
 
@@ -0,0 +1,78 @@
+"""기본환경설정(Config) 캐시 관련 기능을 제공하는 모듈입니다.
+
+main_middleware는 정적파일을 제외한 모든 요청에서 기본환경설정을 조회하므로,
+한번 조회한 설정을 프로세스 메모리에 읽기 전용 스냅샷으로 저장하여 재사용합니다.
+- 관리자에서 설정을 변경하면 버전 스탬프를 갱신하여 모든 worker가 다음 요청에서 다시 조회합니다.
+- 방문자 수(cf_visit)처럼 버전 스탬프 없이 변경되는 값을 위해 일정 시간이 지나면 다시 조회합니다.
+"""
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.models import Config
+from lib.common import VersionStamp
+
+CONFIG_CACHE_TTL = 60  # 단위: 초
+
+config_version = VersionStamp("config")
+
+
+class ConfigSnapshot:
+    """세션과 분리된 읽기 전용 기본환경설정 객체"""
+
+    def __init__(self, config: Config):
+        for column in Config.__table__.columns.keys():
+            object.__setattr__(self, column, getattr(config, column))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ConfigSnapshot은 수정할 수 없습니다.")
+
+    def __delattr__(self, name):
+        raise AttributeError("ConfigSnapshot은 수정할 수 없습니다.")
+
+
+class _ConfigCache:
+    """프로세스 단위 기본환경설정 캐시"""
+    snapshot: Optional[ConfigSnapshot] = None
+    version: int = 0
+    loaded_at: float = 0
+    lock = threading.Lock()
+
+
+def get_config_snapshot(db: Session) -> Optional[ConfigSnapshot]:
+    """캐시된 기본환경설정 스냅샷을 반환한다.
+    - 캐시가 없거나 버전이 변경되었거나 유효시간이 지나면 다시 조회한다.
+
+    Args:
+        db (Session): 데이터베이스 세션
+
+    Returns:
+        Optional[ConfigSnapshot]: 기본환경설정, 설정이 없으면 None
+    """
+    version = config_version.current()
+    if (_ConfigCache.snapshot is not None
+            and _ConfigCache.version == version
+            and time.monotonic() - _ConfigCache.loaded_at < CONFIG_CACHE_TTL):
+        return _ConfigCache.snapshot
+
+    with _ConfigCache.lock:
+        config = db.scalar(select(Config))
+        if not config:
+            return None
+
+        _ConfigCache.snapshot = ConfigSnapshot(config)
+        _ConfigCache.version = version
+        _ConfigCache.loaded_at = time.monotonic()
+
+    return _ConfigCache.snapshot
+
+
+def invalidate_config_cache() -> None:
+    """기본환경설정 캐시를 무효화한다.
+    - 버전 스탬프를 갱신하여 다른 worker의 캐시도 다음 요청에서 갱신되도록 한다.
+    """
+    _ConfigCache.snapshot = None
+    config_version.bump()
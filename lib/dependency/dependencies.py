@@ -16,11 +16,10 @@ from lib.captcha import get_current_captcha_cls
 from lib.common import get_client_ip, get_current_admin_menu_id
 from lib.dependency.auth import get_login_member_optional
 from lib.member import get_admin_type
+from lib.page_chrome import get_page_chrome_data
 from lib.token import check_token
 from service.current_connect_service import CurrentConnectService
 from service.menu_service import MenuService
-from service.poll_service import PollService
-from service.popular_service import PopularService
 
 
 async def get_variety_bo_table(
@@ -217,17 +216,14 @@ async def no_cache_response(response: Response):
 
 async def set_template_basic_data(
     request: Request,
-    current_connect_service: Annotated[CurrentConnectService, Depends()],
     menu_service: Annotated[MenuService, Depends()],
-    poll_service: Annotated[PollService, Depends()],
-    popular_service: Annotated[PopularService, Depends()]
 ):
-    """템플릿 기본 조회 데이터 설정"""
+    """템플릿 기본 조회 데이터 설정
+    - 접속자 수, 최신 설문조사, 인기검색어는 공통 영역 캐시에서 조회한다. (lib.page_chrome)
+    """
     template_data = {
-        "current_login_count": current_connect_service.fetch_total_records(),
+        **get_page_chrome_data(request),
         "menus": menu_service.fetch_menus(),
-        "poll": poll_service.fetch_latest_poll(),
-        "populars": popular_service.fetch_populars(),
     }
     request.state.template_data = template_data
 
@@ -242,15 +238,9 @@ async def set_current_connect(
         path = request.url.path
         mb_id = getattr(member, "mb_id", "")
 
+        # 접속자 테이블 반영과 만료된 접속자 삭제는 CurrentConnectTracker에서 주기적으로 처리
         if not request.state.is_super_admin:
-            current_login = service.fetch_current_connect(current_ip)
-            if current_login:
-                service.update_current_connect(current_login, path, mb_id)
-            else:
-                service.create_current_connect(current_ip, path, mb_id)
-
-        # 현재 로그인한 이력 삭제
-        service.delete_current_connect()
+            service.track_current_connect(current_ip, path, mb_id)
 
     except ProgrammingError as e:
         print(e)
@@ -0,0 +1,160 @@
+"""첨부파일 다운로드 응답을 생성하는 모듈입니다.
+
+- ETag/If-None-Match 조건부 요청 (304 Not Modified)
+- Range 요청 (206 Partial Content, 단일 구간)
+- 웹서버 위임 (FILE_DOWNLOAD_OFFLOAD)
+  - "nginx" : X-Accel-Redirect 헤더로 nginx가 파일을 직접 전송
+  - "apache" : X-Sendfile 헤더로 apache(mod_xsendfile)가 파일을 직접 전송
+"""
+import os
+import re
+from email.utils import formatdate
+from typing import Iterator, Optional, Tuple
+from urllib.parse import quote
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response, StreamingResponse
+
+from core.settings import settings
+
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def create_download_response(request: Request, path: str, filename: str) -> Response:
+    """첨부파일 다운로드 응답을 생성하는 함수
+
+    Args:
+        request (Request): FastAPI Request 객체
+        path (str): 파일 경로
+        filename (str): 다운로드 파일이름
+
+    Returns:
+        Response: 다운로드 응답
+    """
+    stat = os.stat(path)
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    headers = {
+        "accept-ranges": "bytes",
+        "content-disposition": get_content_disposition(filename),
+        "etag": etag,
+        "last-modified": formatdate(stat.st_mtime, usegmt=True),
+    }
+
+    # 브라우저에 캐시된 파일과 같으면 파일을 다시 전송하지 않는다.
+    if is_etag_matched(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    offload = settings.FILE_DOWNLOAD_OFFLOAD.lower()
+    if offload == "nginx":
+        location = settings.FILE_DOWNLOAD_ACCEL_PREFIX.rstrip("/") + "/" + quote(os.path.normpath(path).lstrip("/"))
+        return Response(headers={**headers, "x-accel-redirect": location})
+    if offload == "apache":
+        return Response(headers={**headers, "x-sendfile": os.path.abspath(path)})
+
+    # If-Range가 현재 파일과 다르면 전체 파일을 전송한다.
+    if_range = request.headers.get("if-range")
+    byte_range = None
+    if not if_range or if_range == etag:
+        byte_range = parse_range(request.headers.get("range"), stat.st_size)
+
+    if byte_range is None:
+        return FileResponse(path, headers=headers, stat_result=stat)
+    if byte_range == (-1, -1):
+        return Response(status_code=416, headers={**headers, "content-range": f"bytes */{stat.st_size}"})
+
+    start, end = byte_range
+    headers["content-range"] = f"bytes {start}-{end}/{stat.st_size}"
+    headers["content-length"] = str(end - start + 1)
+    return StreamingResponse(
+        iter_file(path, start, end),
+        status_code=206,
+        headers=headers,
+        media_type="application/octet-stream"
+    )
+
+
+def is_full_download(request: Request, response: Response) -> bool:
+    """다운로드 횟수에 반영할 응답인지 확인한다.
+    - 304(캐시 사용), 416 응답과 이어받기(처음이 아닌 위치부터의 Range) 요청은 제외한다.
+
+    Args:
+        request (Request): FastAPI Request 객체
+        response (Response): create_download_response()로 생성한 응답
+
+    Returns:
+        bool: 파일을 처음부터 전송하는 응답이면 True
+    """
+    if response.status_code == 206:
+        return response.headers.get("content-range", "").startswith("bytes 0-")
+    if response.status_code != 200:
+        return False
+
+    # 웹서버에 위임한 경우에는 웹서버가 Range 요청을 처리한다.
+    if "x-accel-redirect" in response.headers or "x-sendfile" in response.headers:
+        match = RANGE_PATTERN.match((request.headers.get("range") or "").strip())
+        if not match:
+            return True
+        start, end = match.groups()
+        return start == "0" or not (start or end)
+    return True
+
+
+def get_content_disposition(filename: str) -> str:
+    """다운로드 파일이름 헤더 (한글 파일이름은 RFC 5987 형식)"""
+    quoted_filename = quote(filename)
+    if quoted_filename != filename:
+        return f"attachment; filename*=utf-8''{quoted_filename}"
+    return f'attachment; filename="{filename}"'
+
+
+def is_etag_matched(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더에 현재 ETag가 포함되어 있는지 확인한다."""
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+def parse_range(range_header: Optional[str], file_size: int) -> Optional[Tuple[int, int]]:
+    """Range 헤더를 (시작, 끝) 위치로 변환한다.
+    - 여러 구간 요청(multipart/byteranges)은 지원하지 않으므로 전체 파일을 전송한다.
+
+    Returns:
+        Optional[Tuple[int, int]]: (시작, 끝) 위치, Range 요청이 아니면 None,
+            파일 범위를 벗어나면 (-1, -1)
+    """
+    if not range_header:
+        return None
+    match = RANGE_PATTERN.match(range_header.strip())
+    if not match:
+        return None
+
+    start, end = match.groups()
+    if not start and not end:
+        return None
+    if not start:
+        # bytes=-500 : 마지막 500바이트
+        length = int(end)
+        if not length:
+            return (-1, -1)
+        return max(file_size - length, 0), file_size - 1
+
+    start = int(start)
+    end = min(int(end), file_size - 1) if end else file_size - 1
+    if start >= file_size or start > end:
+        return (-1, -1)
+    return start, end
+
+
+def iter_file(path: str, start: int, end: int) -> Iterator[bytes]:
+    """파일의 지정한 구간을 DOWNLOAD_CHUNK_SIZE 단위로 읽는다."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(DOWNLOAD_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
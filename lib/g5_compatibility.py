@@ -1,8 +1,60 @@
+from dataclasses import dataclass
 from datetime import datetime
-from sqlalchemy import MetaData, Table
+import threading
+from typing import Dict, Optional
 
-from core.database import db_session
+from sqlalchemy import Engine, inspect
 
+from core.database import DBConnect, db_session
+
+
+@dataclass(frozen=True)
+class TableQuirks:
+    """
+    gnuboard5에서 생성된 테이블의 컬럼 차이를 담은 클래스입니다.
+    - column_types: 컬럼 이름 => 컬럼 타입 (예: 'VARCHAR(19)')
+    """
+    column_types: Dict[str, str]
+
+    @property
+    def wr_last_is_string(self) -> bool:
+        """wr_last 필드가 문자열(VARCHAR(19))인지 여부 (gnuboard5 게시판 테이블)"""
+        return self.column_types.get('wr_last') == 'VARCHAR(19)'
+
+
+class SchemaRegistry:
+    """
+    테이블별 컬럼 차이를 프로세스 단위로 기록하는 클래스입니다.
+    - 테이블마다 처음 한번만 해당 테이블의 컬럼 정보를 조회합니다.
+    - 테이블을 새로 생성하면 invalidate()로 기록을 삭제합니다.
+    """
+
+    def __init__(self):
+        self.quirks: Dict[str, TableQuirks] = {}
+        self.lock = threading.Lock()
+
+    def get(self, table_name: str, bind: Optional[Engine] = None) -> TableQuirks:
+        """테이블의 컬럼 차이를 반환합니다."""
+        with self.lock:
+            if table_name in self.quirks:
+                return self.quirks[table_name]
+
+        columns = inspect(bind or DBConnect().engine).get_columns(table_name)
+        quirks = TableQuirks({column['name']: str(column['type']) for column in columns})
+        with self.lock:
+            self.quirks[table_name] = quirks
+        return quirks
+
+    def invalidate(self, table_name: Optional[str] = None) -> None:
+        """테이블의 기록을 삭제합니다. table_name이 없으면 모든 기록을 삭제합니다."""
+        with self.lock:
+            if table_name is None:
+                self.quirks.clear()
+            else:
+                self.quirks.pop(table_name, None)
+
+
+schema_registry = SchemaRegistry()
 
 
 class G5Compatibility:
@@ -17,12 +69,7 @@ class G5Compatibility:
         """
         write_free, write_notice 등의 테이블의 wr_last 필드에 들어갈 현재 시간을 반환합니다.
         """
-        metadata = MetaData()
-        metadata.reflect(bind=self.db.bind)
-        table = Table(table_name, metadata, autoload_with=self.db.bind)
-        wr_last_col = table.columns.get('wr_last')
-        wr_last_type = str(wr_last_col.type)
         now = datetime.now()
-        if wr_last_type == 'VARCHAR(19)':
+        if schema_registry.get(table_name, self.db.get_bind()).wr_last_is_string:
             now = now.strftime('%Y-%m-%d %H:%M:%S')
-        return now
\ No newline at end of file
+        return now
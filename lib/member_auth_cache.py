@@ -0,0 +1,101 @@
+"""API 인증 회원 캐시 관련 기능을 제공하는 모듈입니다.
+
+인증이 필요한 API 요청마다 JWT를 디코딩하고 회원의 인증 상태를 확인하므로,
+검증한 결과를 프로세스 메모리에 짧게(MEMBER_AUTH_CACHE_TTL) 저장하여 재사용합니다.
+- 토큰: 토큰 해시 => 회원 아이디 (토큰 만료시간이 지나면 사용하지 않음)
+- 회원: 회원 아이디 => 인증할 수 없는 회원의 스냅샷 (탈퇴/차단/메일인증 사유)
+  인증할 수 있는 회원은 요청마다 회원 정보를 조회하므로 저장하지 않습니다.
+- 회원 정보 수정/탈퇴/차단 시 invalidate_member_auth()로 무효화하고,
+  버전 스탬프를 갱신하여 다른 worker의 회원 스냅샷도 다음 요청에서 다시 확인합니다.
+"""
+import hashlib
+import threading
+import time
+from typing import NamedTuple, Optional
+
+from cachetools import TTLCache
+
+from lib.common import VersionStamp
+
+MEMBER_AUTH_CACHE_TTL = 30  # 단위: 초
+MEMBER_AUTH_CACHE_SIZE = 10000
+
+member_auth_version = VersionStamp("member_auth")
+
+
+class MemberAuthSnapshot(NamedTuple):
+    """회원 인증 상태 스냅샷 (세션과 분리된 읽기 전용 객체)"""
+    mb_id: str
+    is_valid: bool
+    message: str = ""  # 인증할 수 없는 이유
+
+
+class MemberAuthCache:
+    """프로세스 단위 API 인증 회원 캐시"""
+
+    def __init__(self, maxsize: int = MEMBER_AUTH_CACHE_SIZE, ttl: int = MEMBER_AUTH_CACHE_TTL):
+        self.tokens = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.members = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.version = 0
+        self.lock = threading.Lock()
+
+    def get_token(self, token: str) -> Optional[str]:
+        """검증된 토큰의 회원 아이디를 반환한다. 캐시가 없거나 토큰이 만료되었으면 None을 반환한다."""
+        key = self._get_token_key(token)
+        with self.lock:
+            entry = self.tokens.get(key)
+            if entry is None:
+                return None
+            mb_id, expire_at = entry
+            if expire_at and expire_at <= time.time():
+                self.tokens.pop(key, None)
+                return None
+            return mb_id
+
+    def set_token(self, token: str, mb_id: str, expire_at: Optional[int]) -> None:
+        """검증된 토큰의 회원 아이디를 저장한다."""
+        with self.lock:
+            self.tokens[self._get_token_key(token)] = (mb_id, expire_at)
+
+    def get_member(self, mb_id: str) -> Optional[MemberAuthSnapshot]:
+        """회원 인증 상태 스냅샷을 반환한다.
+        - 다른 worker에서 회원 정보가 변경되었으면 스냅샷을 모두 비운다.
+        """
+        version = member_auth_version.current()
+        with self.lock:
+            if self.version != version:
+                self.members.clear()
+                self.version = version
+                return None
+            return self.members.get(mb_id)
+
+    def set_member(self, snapshot: MemberAuthSnapshot) -> None:
+        with self.lock:
+            self.members[snapshot.mb_id] = snapshot
+
+    def invalidate(self, mb_id: Optional[str] = None) -> None:
+        """회원 스냅샷을 삭제한다. mb_id가 없으면 모든 스냅샷을 삭제한다."""
+        with self.lock:
+            if mb_id is None:
+                self.members.clear()
+            else:
+                self.members.pop(mb_id, None)
+
+    @staticmethod
+    def _get_token_key(token: str) -> str:
+        # 토큰 원문을 메모리에 보관하지 않도록 해시값을 키로 사용한다.
+        return hashlib.sha256(token.encode()).hexdigest()
+
+
+member_auth_cache = MemberAuthCache()
+
+
+def invalidate_member_auth(mb_id: Optional[str] = None) -> None:
+    """회원 인증 캐시를 무효화한다.
+    - 버전 스탬프를 갱신하여 다른 worker의 캐시도 다음 요청에서 갱신되도록 한다.
+
+    Args:
+        mb_id (Optional[str]): 회원 아이디. 없으면 모든 회원의 캐시를 무효화한다.
+    """
+    member_auth_cache.invalidate(mb_id)
+    member_auth_version.bump()
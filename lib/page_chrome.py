@@ -0,0 +1,106 @@
+"""템플릿 공통 영역(page chrome) 데이터를 캐시하는 모듈입니다.
+
+테마 페이지의 모든 요청에서 조회하는 접속자 수, 최신 설문조사, 인기검색어를 조각(fragment) 단위로 캐시한다.
+- 조각마다 유효시간(PAGE_CHROME_TTL)이 다르며, 유효시간이 지나면 이전 값을 바로 반환하고
+  백그라운드 스레드에서 다시 조회한다. (Cache.get_or_revalidate)
+- 관리자에서 설문조사/인기검색어를 변경하면 invalidate_page_chrome()으로 조각을 무효화한다.
+- 값은 JSON으로 저장하므로 CACHE_SHARED_BACKEND="sqlite"이면 모든 worker가 함께 사용한다.
+- 메뉴는 MenuService가 버전 스탬프로 캐시하므로 그대로 사용한다.
+"""
+import json
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+from fastapi import Request
+
+from core.database import DBConnect
+from core.models import Poll
+from lib.cache import get_cache
+from service.current_connect_service import CurrentConnectService
+from service.poll_service import PollService
+from service.popular_service import PopularService
+
+# 조각별 유효시간 (단위: 초)
+PAGE_CHROME_TTL = {
+    "current_login_count": 10,
+    "poll": 3600,
+    "populars": 60,
+}
+
+
+def get_page_chrome_data(request: Request) -> Dict[str, Any]:
+    """템플릿 공통 영역 데이터를 반환하는 함수
+
+    Args:
+        request (Request): FastAPI Request 객체
+
+    Returns:
+        Dict[str, Any]: 조각 이름 => 데이터
+    """
+    return {
+        "current_login_count": _get_fragment("current_login_count", lambda: _create_current_login_count(request)),
+        "poll": _to_namespace(_get_fragment("poll", lambda: _create_latest_poll(request))),
+        "populars": [_to_namespace(popular) for popular in get_cached_populars()],
+    }
+
+
+def get_cached_populars(limit: int = 10, day: int = 3) -> List[dict]:
+    """캐시된 인기검색어 목록을 반환하는 함수 (인기검색어 API에서도 사용)
+
+    Args:
+        limit (int, optional): 조회 갯수. Defaults to 10.
+        day (int, optional): 오늘부터 {day}일 전. Defaults to 3.
+
+    Returns:
+        List[dict]: 인기검색어 목록 (pp_word, count)
+    """
+    return _get_fragment("populars", lambda: _create_populars(limit, day), f"{limit}:{day}")
+
+
+def invalidate_page_chrome(*names: str) -> None:
+    """템플릿 공통 영역 조각을 무효화하는 함수
+
+    Args:
+        *names (str): 무효화할 조각 이름 (current_login_count, poll, populars)
+    """
+    get_cache().invalidate_tags(*[_get_tag(name) for name in names])
+
+
+def _get_tag(name: str) -> str:
+    return f"page-chrome-{name}"
+
+
+def _get_fragment(name: str, creator: Callable[[], Any], key_suffix: str = "") -> Any:
+    """조각을 캐시에서 조회하고, 없으면 생성한다."""
+    value = get_cache().get_or_revalidate(
+        f"page-chrome:{name}:{key_suffix}",
+        lambda: json.dumps(creator(), ensure_ascii=False, default=str),
+        ttl=PAGE_CHROME_TTL[name],
+        tags=(_get_tag(name),)
+    )
+    return json.loads(value)
+
+
+def _to_namespace(data: Optional[dict]) -> Optional[SimpleNamespace]:
+    """템플릿에서 속성으로 접근할 수 있도록 변환한다. (getattr(poll, 'po_poll1'))"""
+    return SimpleNamespace(**data) if data else None
+
+
+def _create_current_login_count(request: Request) -> int:
+    with DBConnect().sessionLocal() as db:
+        return CurrentConnectService(request, db).fetch_total_records()
+
+
+def _create_latest_poll(request: Request) -> Optional[dict]:
+    with DBConnect().sessionLocal() as db:
+        poll = PollService(request, db).fetch_latest_poll()
+        if not poll:
+            return None
+        # 투표한 IP 목록(po_ips)은 템플릿에서 사용하지 않으므로 저장하지 않는다.
+        return {column: getattr(poll, column) for column in Poll.__table__.columns.keys() if column != "po_ips"}
+
+
+def _create_populars(limit: int, day: int) -> List[dict]:
+    with DBConnect().sessionLocal() as db:
+        populars = PopularService(db).fetch_populars(limit, day)
+        return [{"pp_word": popular.pp_word, "count": popular.count} for popular in populars]
@@ -1,4 +1,6 @@
+from lib.board_lib import reconcile_good_counts
 from lib.common import delete_old_records
+from service.point_service import expire_points, reconcile_member_points
 
 
 cron_jobs = [
@@ -7,6 +9,19 @@ cron_jobs = [
         'job_func': delete_old_records,
         'expression': {'hour': 5, 'minute': 30, 'second': 0}
     },
+    {
+        'job_id': 'cron_1',
+        'job_func': reconcile_good_counts,
+        'expression': {'hour': 5, 'minute': 40, 'second': 0}
+    },
+    {
+        'job_id': 'cron_2',
+        'job_func': expire_points,
+        'expression': {'hour': 0, 'minute': 5, 'second': 0}
+    },
+    {
+        'job_id': 'cron_3',
+        'job_func': reconcile_member_points,
+        'expression': {'hour': 5, 'minute': 50, 'second': 0}
+    },
 ]
-
-
@@ -0,0 +1,41 @@
+from typing import Optional
+
+from core.database import DBConnect
+from core.settings import settings
+from lib.search.base import SearchBackend
+from lib.search.inverted_index import InvertedIndexSearchBackend
+from lib.search.like import LikeSearchBackend
+from lib.search.native import (
+    MySQLFullTextSearchBackend, PostgreSQLTrigramSearchBackend, SQLiteFTS5SearchBackend
+)
+
+NATIVE_SEARCH_BACKENDS = {
+    "mysql": MySQLFullTextSearchBackend,
+    "postgresql": PostgreSQLTrigramSearchBackend,
+    "sqlite": SQLiteFTS5SearchBackend,
+}
+
+_search_backend: Optional[SearchBackend] = None
+
+
+def get_search_backend() -> SearchBackend:
+    """설정(SEARCH_BACKEND)에 맞는 게시판 검색 백엔드를 반환하는 함수
+    - like : LIKE 검색 (기본값)
+    - native : 데이터베이스 전문검색 (지원하지 않는 데이터베이스는 index 사용)
+    - index : 역색인 테이블 검색
+
+    Returns:
+        SearchBackend: 검색 백엔드 인스턴스
+    """
+    global _search_backend
+    if _search_backend is None:
+        backend_name = settings.SEARCH_BACKEND.lower()
+        if backend_name == "native":
+            dialect = DBConnect().engine.dialect.name
+            _search_backend = NATIVE_SEARCH_BACKENDS.get(dialect, InvertedIndexSearchBackend)()
+        elif backend_name == "index":
+            _search_backend = InvertedIndexSearchBackend()
+        else:
+            _search_backend = LikeSearchBackend()
+
+    return _search_backend
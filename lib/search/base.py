@@ -0,0 +1,107 @@
+import abc
+import html
+import re
+from typing import List, Set
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from core.database import DBConnect
+from core.models import WriteBaseModel
+
+TAG_PATTERN = re.compile(r"<[^>]*>")
+WORD_PATTERN = re.compile(r"\w+")
+
+
+def get_bo_table(model: WriteBaseModel) -> str:
+    """게시판 모델의 테이블명에서 게시판 아이디를 추출한다."""
+    return model.__tablename__.removeprefix(DBConnect().table_prefix + "write_")
+
+
+def normalize_search_text(value: str) -> str:
+    """색인/검색에 사용할 수 있도록 HTML 태그를 제거하고 소문자로 변환한다."""
+    if not value:
+        return ""
+    return html.unescape(TAG_PATTERN.sub(" ", value)).lower()
+
+
+def split_search_tokens(value: str) -> Set[str]:
+    """문자열을 2-gram 토큰으로 분리한다.
+    - 형태소 분석 없이도 한글 부분 검색이 가능하도록 단어를 2글자씩 겹쳐서 자른다.
+    - 1글자 단어는 토큰을 만들지 않는다.
+
+    Args:
+        value (str): 분리할 문자열
+
+    Returns:
+        Set[str]: 토큰 목록
+    """
+    tokens = set()
+    for word in WORD_PATTERN.findall(normalize_search_text(value)):
+        tokens.update(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+def like_filter(model: WriteBaseModel, fields: List[str], word: str) -> ColumnElement:
+    """필드별 LIKE 검색 필터를 or 조건으로 생성한다."""
+    return or_(*[getattr(model, field).like(f"%{word}%") for field in fields])
+
+
+class SearchBackend(metaclass=abc.ABCMeta):
+    """게시판 검색 백엔드 기본 클래스
+    - 색인을 사용하는 필드(INDEXED_FIELDS)는 백엔드의 match_filter로 검색하고,
+      나머지 필드는 LIKE로 검색한다.
+    """
+    NAME = None
+    # 전문검색 색인을 사용하는 필드
+    INDEXED_FIELDS = ("wr_subject", "wr_content")
+    # 검색단위(cf_search_part)로 나누어 검색해야 하는지 여부
+    use_search_part = False
+
+    def word_filter(self, model: WriteBaseModel, fields: List[str], word: str) -> ColumnElement:
+        """검색어 한 단어에 대한 검색 필터를 생성한다.
+
+        Args:
+            model (WriteBaseModel): 게시판 모델
+            fields (List[str]): 검색할 필드 목록
+            word (str): 검색어
+
+        Returns:
+            ColumnElement: 필드별 검색 조건을 or로 묶은 필터
+        """
+        fields = [field for field in fields if hasattr(model, field)]
+        indexed_fields = [field for field in fields if field in self.INDEXED_FIELDS]
+        other_fields = [field for field in fields if field not in self.INDEXED_FIELDS]
+
+        filters = []
+        if indexed_fields:
+            filters.append(self.match_filter(model, indexed_fields, word))
+        if other_fields:
+            filters.append(like_filter(model, other_fields, word))
+        return or_(*filters)
+
+    @abc.abstractmethod
+    def match_filter(self, model: WriteBaseModel, fields: List[str], word: str) -> ColumnElement:
+        """색인 필드에 대한 검색 필터를 생성하는 구현 메서드"""
+        pass
+
+    def prepare_table(self, model: WriteBaseModel) -> None:
+        """게시판 테이블의 검색 색인을 준비한다. (게시판 생성/수정 시 호출)"""
+        pass
+
+    def index_write(self, db: Session, bo_table: str, write: WriteBaseModel) -> None:
+        """게시글(댓글)을 색인한다. commit은 호출한 쪽에서 처리한다."""
+        pass
+
+    def delete_writes(self, db: Session, bo_table: str, wr_ids: List[int]) -> None:
+        """게시글(댓글)의 색인을 삭제한다. commit은 호출한 쪽에서 처리한다."""
+        pass
+
+    def drop_table(self, bo_table: str) -> None:
+        """게시판 삭제 시 검색 색인을 삭제한다."""
+        pass
+
+    def rebuild_table(self, model: WriteBaseModel) -> None:
+        """게시판의 검색 색인을 다시 생성한다."""
+        pass
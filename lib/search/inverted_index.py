@@ -0,0 +1,128 @@
+from typing import List, Set
+
+from sqlalchemy import and_, delete, distinct, exists, func, insert, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from core.database import DBConnect
+from core.models import BoardSearchIndex, WriteBaseModel
+from lib.search.base import (
+    SearchBackend, get_bo_table, like_filter, split_search_tokens
+)
+
+
+class InvertedIndexSearchBackend(SearchBackend):
+    """역색인 테이블(g6_board_search_index) 검색 백엔드
+    - 데이터베이스의 전문검색 기능을 사용할 수 없을 때 사용한다.
+    - 게시글 작성/수정/삭제 서비스에서 색인을 갱신한다.
+    - 2-gram 토큰이 모두 포함된 게시글만 후보로 추린 뒤 LIKE로 정확히 비교한다.
+    - 색인 생성(rebuild_table)을 마친 게시판에만 완료 표시(INDEXED_MARKER)를 기록하며,
+      완료 표시가 없는 게시판은 LIKE로 검색한다.
+    """
+    NAME = "index"
+    INSERT_CHUNK_SIZE = 1000
+    # 색인 생성 완료 표시 (wr_id=0, si_field='', si_token='')
+    INDEXED_MARKER = {"wr_id": 0, "si_field": "", "si_token": ""}
+
+    def __init__(self):
+        BoardSearchIndex.__table__.create(bind=DBConnect().engine, checkfirst=True)
+        # 색인 생성이 끝난 게시판 (완료된 경우만 프로세스별로 캐시)
+        self._indexed_tables: Set[str] = set()
+
+    def match_filter(self, model: WriteBaseModel, fields: List[str], word: str) -> ColumnElement:
+        tokens = split_search_tokens(word)
+        if not tokens or not self.is_indexed(get_bo_table(model)):
+            return like_filter(model, fields, word)
+
+        candidates = (
+            select(BoardSearchIndex.wr_id)
+            .where(
+                BoardSearchIndex.bo_table == get_bo_table(model),
+                BoardSearchIndex.si_field.in_(fields),
+                BoardSearchIndex.si_token.in_(tokens)
+            )
+            .group_by(BoardSearchIndex.wr_id)
+            .having(func.count(distinct(BoardSearchIndex.si_token)) == len(tokens))
+        )
+        return and_(model.wr_id.in_(candidates), like_filter(model, fields, word))
+
+    def is_indexed(self, bo_table: str) -> bool:
+        """게시판의 색인 생성이 끝났는지(완료 표시가 있는지) 확인한다."""
+        if bo_table in self._indexed_tables:
+            return True
+
+        with DBConnect().sessionLocal() as db:
+            is_indexed = db.scalar(
+                exists(BoardSearchIndex)
+                .where(
+                    BoardSearchIndex.bo_table == bo_table,
+                    *[getattr(BoardSearchIndex, key) == value for key, value in self.INDEXED_MARKER.items()]
+                )
+                .select()
+            )
+        if is_indexed:
+            self._indexed_tables.add(bo_table)
+        return is_indexed
+
+    def prepare_table(self, model: WriteBaseModel) -> None:
+        # 색인 생성을 마치지 않은 게시판은 색인을 새로 생성한다.
+        if not self.is_indexed(get_bo_table(model)):
+            self.rebuild_table(model)
+
+    def index_write(self, db: Session, bo_table: str, write: WriteBaseModel) -> None:
+        if write.wr_id is None:
+            db.flush()
+
+        self.delete_writes(db, bo_table, [write.wr_id])
+        rows = self._get_index_rows(bo_table, write)
+        if rows:
+            db.execute(insert(BoardSearchIndex), rows)
+
+    def delete_writes(self, db: Session, bo_table: str, wr_ids: List[int]) -> None:
+        if not wr_ids:
+            return
+        db.execute(
+            delete(BoardSearchIndex)
+            .where(BoardSearchIndex.bo_table == bo_table, BoardSearchIndex.wr_id.in_(wr_ids))
+        )
+
+    def drop_table(self, bo_table: str) -> None:
+        with DBConnect().sessionLocal() as db:
+            db.execute(delete(BoardSearchIndex).where(BoardSearchIndex.bo_table == bo_table))
+            db.commit()
+        self._indexed_tables.discard(bo_table)
+
+    def rebuild_table(self, model: WriteBaseModel) -> None:
+        bo_table = get_bo_table(model)
+        with DBConnect().sessionLocal() as db:
+            db.execute(delete(BoardSearchIndex).where(BoardSearchIndex.bo_table == bo_table))
+
+            # wr_id 순으로 나누어 읽으면서 색인을 추가한다.
+            last_wr_id = 0
+            while True:
+                writes = db.execute(
+                    select(model.wr_id, *[getattr(model, field) for field in self.INDEXED_FIELDS])
+                    .where(model.wr_id > last_wr_id)
+                    .order_by(model.wr_id)
+                    .limit(self.INSERT_CHUNK_SIZE)
+                ).all()
+                if not writes:
+                    break
+
+                rows = [row for write in writes for row in self._get_index_rows(bo_table, write)]
+                if rows:
+                    db.execute(insert(BoardSearchIndex), rows)
+                last_wr_id = writes[-1].wr_id
+
+            # 색인을 모두 추가한 뒤 완료 표시를 기록한다.
+            db.execute(insert(BoardSearchIndex).values(bo_table=bo_table, **self.INDEXED_MARKER))
+            db.commit()
+        self._indexed_tables.add(bo_table)
+
+    def _get_index_rows(self, bo_table: str, write) -> List[dict]:
+        """게시글의 색인 필드를 토큰으로 분리하여 색인 레코드 목록을 만든다."""
+        return [
+            {"bo_table": bo_table, "wr_id": write.wr_id, "si_field": field, "si_token": token}
+            for field in self.INDEXED_FIELDS
+            for token in split_search_tokens(getattr(write, field))
+        ]
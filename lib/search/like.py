@@ -0,0 +1,17 @@
+from typing import List
+
+from sqlalchemy.sql.elements import ColumnElement
+
+from core.models import WriteBaseModel
+from lib.search.base import SearchBackend, like_filter
+
+
+class LikeSearchBackend(SearchBackend):
+    """LIKE '%검색어%' 검색 백엔드 (기존 그누보드 방식)
+    - 색인 없이 전체 테이블을 검색하므로 검색단위(spt)로 나누어 검색한다.
+    """
+    NAME = "like"
+    use_search_part = True
+
+    def match_filter(self, model: WriteBaseModel, fields: List[str], word: str) -> ColumnElement:
+        return like_filter(model, fields, word)
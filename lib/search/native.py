@@ -0,0 +1,194 @@
+import logging
+from typing import List, Set
+
+from cachetools import TTLCache
+from sqlalchemy import inspect, literal_column, or_, select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.sql.elements import ColumnElement
+
+from core.database import DBConnect
+from core.models import WriteBaseModel
+from lib.search.base import SearchBackend, get_bo_table, like_filter
+
+logger = logging.getLogger(__name__)
+
+
+class NativeSearchBackend(SearchBackend):
+    """데이터베이스 전문검색 기능을 사용하는 검색 백엔드 기본 클래스
+    - 색인이 준비된 게시판만 전문검색을 사용하고, 준비되지 않은 게시판은 LIKE로 검색한다.
+    - 색인은 데이터베이스가 직접 관리하므로 게시글 작성/수정/삭제 시 별도 처리가 필요 없다.
+    """
+    # 전문검색을 사용할 수 있는 최소 검색어 길이
+    MIN_WORD_LENGTH = 2
+    # 색인이 준비되지 않은 게시판을 다시 확인하는 주기 (단위: 초)
+    NOT_READY_TTL = 60
+
+    def __init__(self):
+        # 색인이 준비된 게시판은 계속 캐시하고, 준비되지 않은 게시판은 NOT_READY_TTL 동안만 캐시한다.
+        # (다른 worker에서 색인을 생성해도 NOT_READY_TTL 이내에 전문검색을 사용한다.)
+        self._ready_tables: Set[str] = set()
+        self._not_ready_tables = TTLCache(maxsize=1000, ttl=self.NOT_READY_TTL)
+
+    def match_filter(self, model: WriteBaseModel, fields: List[str], word: str) -> ColumnElement:
+        if len(word) < self.MIN_WORD_LENGTH or not self.is_ready(model):
+            return like_filter(model, fields, word)
+        return self.native_filter(model, fields, word)
+
+    def native_filter(self, model: WriteBaseModel, fields: List[str], word: str) -> ColumnElement:
+        """데이터베이스 전문검색 필터를 생성한다."""
+        return like_filter(model, fields, word)
+
+    def is_ready(self, model: WriteBaseModel) -> bool:
+        """게시판 테이블의 전문검색 색인이 준비되었는지 확인한다. (프로세스별 캐시)"""
+        table_name = model.__tablename__
+        if table_name in self._ready_tables:
+            return True
+        if table_name in self._not_ready_tables:
+            return False
+
+        try:
+            is_ready = self.has_index(model)
+        except DBAPIError:
+            is_ready = False
+        if is_ready:
+            self._ready_tables.add(table_name)
+        else:
+            self._not_ready_tables[table_name] = True
+        return is_ready
+
+    def has_index(self, model: WriteBaseModel) -> bool:
+        """전문검색 색인이 존재하는지 확인하는 구현 메서드"""
+        return False
+
+    def get_index_names(self, model: WriteBaseModel) -> List[str]:
+        """게시판 테이블의 인덱스 이름 목록"""
+        indexes = inspect(DBConnect().engine).get_indexes(model.__tablename__)
+        return [index["name"] for index in indexes]
+
+    def prepare_table(self, model: WriteBaseModel) -> None:
+        try:
+            with DBConnect().engine.begin() as conn:
+                for statement in self.get_prepare_statements(model):
+                    conn.execute(text(statement))
+        except DBAPIError as e:
+            logger.warning(f"{model.__tablename__} 전문검색 색인을 생성하지 못했습니다: {e}")
+        self._forget_table(model.__tablename__)
+
+    def get_prepare_statements(self, model: WriteBaseModel) -> List[str]:
+        """전문검색 색인 생성 SQL 목록을 반환하는 구현 메서드"""
+        return []
+
+    def drop_table(self, bo_table: str) -> None:
+        self._forget_table(DBConnect().table_prefix + "write_" + bo_table)
+
+    def _forget_table(self, table_name: str) -> None:
+        """게시판 테이블의 색인 준비 여부 캐시를 삭제한다."""
+        self._ready_tables.discard(table_name)
+        self._not_ready_tables.pop(table_name, None)
+
+
+class MySQLFullTextSearchBackend(NativeSearchBackend):
+    """MySQL FULLTEXT(ngram parser) 검색 백엔드
+    - ngram parser는 ngram_token_size(기본 2) 단위로 색인하므로 한글 부분 검색이 가능하다.
+    """
+    NAME = "mysql"
+
+    def index_name(self, field: str) -> str:
+        return f"ftx_{field}"
+
+    def native_filter(self, model: WriteBaseModel, fields: List[str], word: str) -> ColumnElement:
+        # 큰따옴표로 감싸 ngram 구문(phrase) 검색을 한다. (BOOLEAN MODE)
+        phrase = '"' + word.replace('"', " ") + '"'
+        return or_(*[getattr(model, field).match(phrase) for field in fields])
+
+    def has_index(self, model: WriteBaseModel) -> bool:
+        index_names = self.get_index_names(model)
+        return all(self.index_name(field) in index_names for field in self.INDEXED_FIELDS)
+
+    def get_prepare_statements(self, model: WriteBaseModel) -> List[str]:
+        index_names = self.get_index_names(model)
+        return [
+            f"ALTER TABLE {model.__tablename__} ADD FULLTEXT INDEX {self.index_name(field)} ({field}) WITH PARSER ngram"
+            for field in self.INDEXED_FIELDS
+            if self.index_name(field) not in index_names
+        ]
+
+
+class PostgreSQLTrigramSearchBackend(NativeSearchBackend):
+    """PostgreSQL pg_trgm 검색 백엔드
+    - tsvector는 공백 단위로 단어를 나누므로 한글 부분 검색에 적합하지 않아
+      LIKE 검색을 그대로 사용하고 pg_trgm GIN 인덱스로 검색 속도를 높인다.
+    """
+    NAME = "postgresql"
+    MIN_WORD_LENGTH = 1
+
+    def index_name(self, model: WriteBaseModel, field: str) -> str:
+        return f"trgm_{field}_{get_bo_table(model)}"
+
+    def has_index(self, model: WriteBaseModel) -> bool:
+        index_names = self.get_index_names(model)
+        return all(self.index_name(model, field) in index_names for field in self.INDEXED_FIELDS)
+
+    def get_prepare_statements(self, model: WriteBaseModel) -> List[str]:
+        return ["CREATE EXTENSION IF NOT EXISTS pg_trgm"] + [
+            f"CREATE INDEX IF NOT EXISTS {self.index_name(model, field)} "
+            f"ON {model.__tablename__} USING gin ({field} gin_trgm_ops)"
+            for field in self.INDEXED_FIELDS
+        ]
+
+
+class SQLiteFTS5SearchBackend(NativeSearchBackend):
+    """SQLite FTS5(trigram tokenizer) 검색 백엔드
+    - 게시판 테이블을 external content로 사용하는 가상 테이블을 만들고 트리거로 동기화한다.
+    - trigram tokenizer는 3글자 이상의 검색어만 색인을 사용할 수 있다. (SQLite 3.34 이상)
+    """
+    NAME = "sqlite"
+    MIN_WORD_LENGTH = 3
+
+    def fts_name(self, model: WriteBaseModel) -> str:
+        return f"{model.__tablename__}_fts"
+
+    def native_filter(self, model: WriteBaseModel, fields: List[str], word: str) -> ColumnElement:
+        fts_name = self.fts_name(model)
+        phrase = '"' + word.replace('"', '""') + '"'
+        query = "{" + " ".join(fields) + "}: " + phrase
+        return model.wr_id.in_(
+            select(literal_column("rowid"))
+            .select_from(text(fts_name))
+            .where(literal_column(fts_name).op("MATCH")(query))
+        )
+
+    def has_index(self, model: WriteBaseModel) -> bool:
+        return inspect(DBConnect().engine).has_table(self.fts_name(model))
+
+    def get_prepare_statements(self, model: WriteBaseModel) -> List[str]:
+        if self.has_index(model):
+            return []
+
+        table_name = model.__tablename__
+        fts_name = self.fts_name(model)
+        columns = ", ".join(self.INDEXED_FIELDS)
+        new_values = ", ".join(f"new.{field}" for field in self.INDEXED_FIELDS)
+        old_values = ", ".join(f"old.{field}" for field in self.INDEXED_FIELDS)
+        delete_old = (f"INSERT INTO {fts_name}({fts_name}, rowid, {columns}) "
+                      f"VALUES ('delete', old.wr_id, {old_values});")
+        insert_new = f"INSERT INTO {fts_name}(rowid, {columns}) VALUES (new.wr_id, {new_values});"
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_name} USING fts5("
+            f"{columns}, content='{table_name}', content_rowid='wr_id', tokenize='trigram')",
+            f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ai AFTER INSERT ON {table_name} BEGIN {insert_new} END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ad AFTER DELETE ON {table_name} BEGIN {delete_old} END",
+            f"CREATE TRIGGER IF NOT EXISTS {fts_name}_au AFTER UPDATE ON {table_name} BEGIN {delete_old} {insert_new} END",
+            f"INSERT INTO {fts_name}({fts_name}) VALUES ('rebuild')",
+        ]
+
+    def drop_table(self, bo_table: str) -> None:
+        fts_name = DBConnect().table_prefix + "write_" + bo_table + "_fts"
+        with DBConnect().engine.begin() as conn:
+            conn.execute(text(f"DROP TABLE IF EXISTS {fts_name}"))
+        super().drop_table(bo_table)
+
+    def rebuild_table(self, model: WriteBaseModel) -> None:
+        if self.is_ready(model):
+            with DBConnect().engine.begin() as conn:
+                conn.execute(text(f"INSERT INTO {self.fts_name(model)}({self.fts_name(model)}) VALUES ('rebuild')"))
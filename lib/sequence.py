@@ -0,0 +1,101 @@
+"""게시판 글번호(wr_num)를 할당하는 모듈입니다.
+
+- 게시판별 할당 테이블(g6_board_num_sequence)의 행을 UPDATE로 잠그고 줄인 뒤 값을 읽으므로
+  동시에 글을 작성해도 같은 wr_num이 할당되지 않는다.
+- 할당 기록이 없는 게시판은 처음 한 번만 MIN(wr_num)으로 시작 값을 정한다.
+- 복사/이동/가져오기처럼 여러 글을 추가할 때는 필요한 개수만큼 한번에 할당한다.
+- 글을 저장하는 세션(db)을 전달하면 같은 트랜잭션에서 할당하므로,
+  이미 변경 내용이 있는 트랜잭션에서도 다른 연결의 잠금을 기다리지 않는다. (SQLite)
+  글 저장이 실패하면 할당도 함께 롤백된다.
+- 세션 없이 할당하면 별도 연결에서 바로 커밋하며,
+  글 저장이 실패하면 할당된 번호는 비어있게 된다. (wr_num은 정렬에만 사용)
+- 할당 테이블은 서버 시작 시 prepare()로 생성한다.
+"""
+from typing import Optional
+
+from sqlalchemy import Connection, delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from core.database import DBConnect
+from core.models import BoardNumSequence
+from lib.common import dynamic_create_write_table
+
+
+class WriteNumAllocator():
+    """게시판 글번호 할당 클래스"""
+    # 시작 값을 정하는 중 다른 worker와 충돌했을 때 다시 시도하는 횟수
+    MAX_RETRY = 3
+
+    def __init__(self):
+        self.is_prepared = False
+
+    def prepare(self) -> None:
+        """할당 테이블이 없으면 생성한다."""
+        if not self.is_prepared:
+            BoardNumSequence.__table__.create(bind=DBConnect().engine, checkfirst=True)
+            self.is_prepared = True
+
+    def reserve(self, bo_table: str, count: int = 1, db: Optional[Session] = None) -> int:
+        """게시판의 글번호를 count개 할당한다.
+
+        Args:
+            bo_table (str): 게시판 아이디
+            count (int, optional): 할당할 글번호 개수. Defaults to 1.
+            db (Session, optional): 글을 저장하는 세션. 전달하면 세션의 트랜잭션에서 할당한다.
+
+        Returns:
+            int: 할당된 첫번째 글번호. 할당된 범위는 (첫번째 글번호 - count + 1) ~ 첫번째 글번호이다.
+        """
+        count = max(count, 1)
+        self.prepare()
+
+        if db is not None:
+            return self._reserve(db.connection(), bo_table, count)
+        with DBConnect().engine.begin() as conn:
+            return self._reserve(conn, bo_table, count)
+
+    def _reserve(self, conn: Connection, bo_table: str, count: int) -> int:
+        for _ in range(self.MAX_RETRY):
+            last_num = self._decrease(conn, bo_table, count)
+            if last_num is not None:
+                return last_num + count - 1
+
+            # 할당 기록이 없으면 게시판의 MIN(wr_num)부터 시작한다.
+            write_model = dynamic_create_write_table(bo_table)
+            min_num = conn.scalar(select(func.coalesce(func.min(write_model.wr_num), 0)))
+            try:
+                with conn.begin_nested():
+                    conn.execute(insert(BoardNumSequence).values(bo_table=bo_table, bs_num=min_num - count))
+                return min_num - 1
+            except IntegrityError:
+                # 다른 worker가 먼저 시작 값을 기록했으면 다시 할당한다.
+                continue
+
+        raise RuntimeError(f"{bo_table} 게시판의 글번호를 할당하지 못했습니다.")
+
+    def reset(self, bo_table: str) -> None:
+        """게시판의 할당 기록을 삭제한다. (게시판 삭제 시)"""
+        self.prepare()
+        with DBConnect().engine.begin() as conn:
+            conn.execute(delete(BoardNumSequence).where(BoardNumSequence.bo_table == bo_table))
+
+    def _decrease(self, conn: Connection, bo_table: str, count: int):
+        """할당 기록을 count만큼 줄이고 줄어든 값을 반환한다. 기록이 없으면 None을 반환한다.
+        - UPDATE ... RETURNING을 지원하지 않는 데이터베이스(MySQL)는
+          UPDATE로 행을 잠근 뒤 같은 트랜잭션에서 값을 읽는다.
+        """
+        statement = (
+            update(BoardNumSequence)
+            .where(BoardNumSequence.bo_table == bo_table)
+            .values(bs_num=BoardNumSequence.bs_num - count)
+        )
+        if conn.dialect.update_returning:
+            return conn.scalar(statement.returning(BoardNumSequence.bs_num))
+
+        if not conn.execute(statement).rowcount:
+            return None
+        return conn.scalar(select(BoardNumSequence.bs_num).where(BoardNumSequence.bo_table == bo_table))
+
+
+write_num_allocator = WriteNumAllocator()
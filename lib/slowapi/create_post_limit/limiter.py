@@ -1,50 +1,21 @@
-from typing import Annotated, Optional
-from fastapi import Request, Depends
+from typing import Optional
+from fastapi import Request
 from fastapi.security.utils import get_authorization_scheme_param
 from sqlalchemy import select
 from slowapi.util import get_remote_address
 
 from core.database import DBConnect
-from core.models import Config, Member
-from api.settings import api_settings
-from api.v1.auth import oauth2_scheme
-from api.v1.auth.jwt import JWT
-from api.v1.service.member import MemberServiceAPI
-from api.v1.models.auth import TokenPayload
+from core.models import Config
+from api.v1.dependencies.member import get_token_member_id
+from lib.config_cache import get_config_snapshot
 from lib.slowapi import LimiterNoWarning
 
 
-def get_request_member(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    member_service: Annotated[MemberServiceAPI, Depends()]
-) -> Optional[Member]:
-    """
-    REST_API 요청 시 JWT 토큰을 통해 사용자 정보를 가져오는 함수
-
-    Args:
-        token (Annotated[str, Depends(oauth2_scheme)]): JWT 토큰
-        member_service (Annotated[MemberServiceAPI, Depends()]): 사용자 정보 서비스
-
-    Returns:
-        Member: 사용자 정보 객체 또는 None
-    """
-    payload: TokenPayload = JWT.decode_token(
-        token,
-        api_settings.ACCESS_TOKEN_SECRET_KEY
-    )
-
-    mb_id: str = payload.sub
-    if mb_id is None:
-        return None
-
-    member = member_service.get_member(mb_id)
-    return member
-
-
 def limiter_key_func(request: Request) -> Optional[str]:
     """
     Limiter 인스턴스 생성시 key_func 인자에 제공될 함수.
     None으로 반환되는 IP 주소(관리자 IP)는 요청 제한을 하지 않는다.
+    - 토큰은 get_current_member()와 같은 캐시로 검증하므로 회원 정보를 조회하지 않는다.
 
     Args:
         request (Request): FastAPI Request 객체
@@ -58,12 +29,13 @@ def limiter_key_func(request: Request) -> Optional[str]:
     if not authorization or scheme.lower() != "bearer":
         return get_remote_address(request)
 
-    with DBConnect().sessionLocal() as db:
-        member_service = MemberServiceAPI(request, db)
-        cf_admin = db.scalar(select(Config)).cf_admin
+    mb_id = get_token_member_id(token)
 
-    member = get_request_member(token, member_service)
-    if member.mb_id == cf_admin:
+    config = getattr(request.state, "config", None)
+    if config is None:
+        with DBConnect().sessionLocal() as db:
+            config = get_config_snapshot(db)
+    if mb_id == getattr(config, "cf_admin", None):
         return None
 
     return get_remote_address(request)
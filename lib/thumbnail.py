@@ -0,0 +1,332 @@
+"""섬네일 이미지를 생성하고 관리하는 모듈입니다.
+
+- 매니페스트: 생성된 섬네일을 (원본 파일, 너비, 높이) 단위로 기록한다.
+  프로세스 메모리 LRU와 data/thumbnail_manifest.sqlite3 파일에 저장하여 worker끼리 공유한다.
+- 생성 프로세스: 섬네일은 별도 프로세스(THUMBNAIL_WORKERS)에서 생성하여 요청 처리를 막지 않는다.
+  생성 중에는 대체 이미지를 반환하고, 생성이 끝나면 매니페스트에 기록한다.
+  매니페스트에 없더라도 이미 생성된 섬네일 파일이 있으면 다시 생성하지 않고 기록한다.
+- track_pending_thumbnails(): 생성 중이라 대체 이미지를 반환한 섬네일을 기록하여,
+  대체 이미지가 포함된 렌더링 결과를 오래 캐시하지 않도록 한다.
+- JPEG은 draft(), 그 외 이미지는 reduce()로 먼저 축소한 뒤 자르므로 큰 원본도 빠르게 처리한다.
+"""
+import logging
+import multiprocessing
+import os
+import sqlite3
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from cachetools import LRUCache
+from PIL import Image, ImageOps
+
+from core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# 이미지가 없거나 섬네일을 생성 중일 때 보여줄 대체 이미지
+PLACEHOLDER_IMAGE = "./static/img/dummy-donotremove.png"
+PLACEHOLDER_DIRECTORY = "./data/thumbnail_tmp"
+
+ThumbnailKey = Tuple[str, int, int]
+
+# 생성 중이라 대체 이미지를 반환한 섬네일 목록 (track_pending_thumbnails 블록 안에서만 기록)
+_pending_thumbnails: ContextVar[Optional[List[ThumbnailKey]]] = ContextVar("pending_thumbnails", default=None)
+
+
+@contextmanager
+def track_pending_thumbnails() -> Iterator[List[ThumbnailKey]]:
+    """블록 안에서 생성 중이라 대체 이미지를 반환한 섬네일 목록을 기록한다.
+
+    Examples:
+        with track_pending_thumbnails() as pending:
+            html = render()
+        if pending:
+            # 대체 이미지가 포함되어 있으므로 짧게 캐시한다.
+    """
+    pending: List[ThumbnailKey] = []
+    token = _pending_thumbnails.set(pending)
+    try:
+        yield pending
+    finally:
+        _pending_thumbnails.reset(token)
+
+
+def get_thumbnail_path(source_file: str, width: int, height: int, target_path: str = None) -> str:
+    """섬네일 파일 경로를 반환한다.
+
+    Args:
+        source_file (str): 원본 이미지 파일 경로
+        width (int): 섬네일 이미지 너비
+        height (int): 섬네일 이미지 높이
+        target_path (str, optional): 섬네일 저장 경로. Defaults to 원본 이미지 경로.
+
+    Returns:
+        str: 섬네일 파일 경로
+    """
+    target_path = target_path or os.path.dirname(source_file)
+    return os.path.join(target_path, f"thumbnail_{width}x{height}_{os.path.basename(source_file)}")
+
+
+def create_thumbnail(source_file: str, thumbnail_file: str, width: int, height: int) -> str:
+    """섬네일 이미지 파일을 생성한다. (생성 프로세스에서 실행)
+
+    Args:
+        source_file (str): 원본 이미지 파일 경로
+        thumbnail_file (str): 섬네일 파일 경로
+        width (int): 섬네일 이미지 너비
+        height (int): 섬네일 이미지 높이
+
+    Returns:
+        str: 섬네일 파일 경로
+    """
+    directory, basename = os.path.split(thumbnail_file)
+    os.makedirs(directory, exist_ok=True)
+
+    # 파일이 없거나 이미지가 아닐 경우 예외가 발생하므로 검사를 따로 하지 않음.
+    with Image.open(source_file) as source_image:
+        source_width, source_height = source_image.size
+
+        # 이미지가 섬네일이미지보다 작을 경우 흰 배경 중앙에 삽입
+        if source_width < width or source_height < height:
+            image = Image.new("RGB", (width, height), (255, 255, 255))
+            left = (width - source_width) // 2
+            top = (height - source_height) // 2
+            image.paste(source_image, (left, top))
+        else:
+            image = ImageOps.fit(_reduce_image(source_image, width, height), (width, height))
+
+        # 임시 파일에 저장한 뒤 교체하여 저장 중인 섬네일이 노출되지 않도록 한다.
+        temp_file = os.path.join(directory, f".{os.getpid()}_{basename}")
+        image.save(temp_file)
+        os.replace(temp_file, thumbnail_file)
+
+    return thumbnail_file
+
+
+def _reduce_image(image: Image.Image, width: int, height: int) -> Image.Image:
+    """섬네일 크기보다 작아지지 않는 범위에서 이미지를 미리 축소한다.
+    - JPEG: 디코딩 단계에서 1/2, 1/4, 1/8 크기로 읽는다. (draft)
+    - 그 외: 정수 배율로 빠르게 축소한다. (reduce)
+    """
+    if image.format == "JPEG":
+        image.draft("RGB", (width, height))
+        return image
+
+    factor = min(image.width // width, image.height // height)
+    if factor >= 2 and image.mode in ("RGB", "RGBA", "L", "LA"):
+        return image.reduce(factor)
+    return image
+
+
+class ThumbnailManifest():
+    """생성된 섬네일 기록 (프로세스 메모리 LRU + worker 공유 SQLite 파일)
+    - 생성에 실패한 섬네일은 메모리에만 빈 문자열로 기록하여 다시 생성하지 않는다.
+    """
+    path = os.path.join("data", "thumbnail_manifest.sqlite3")
+
+    def __init__(self, maxsize: int = 4096):
+        self.entries = LRUCache(maxsize=maxsize)
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """스레드별 연결을 반환한다."""
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS thumbnail ("
+                "source TEXT NOT NULL, width INTEGER NOT NULL, height INTEGER NOT NULL, "
+                "path TEXT NOT NULL, PRIMARY KEY (source, width, height))"
+            )
+            self.local.connection = connection
+        return connection
+
+    def get(self, key: ThumbnailKey) -> Optional[str]:
+        """섬네일 경로를 반환한다. 기록이 없으면 None, 생성에 실패했으면 빈 문자열을 반환한다."""
+        with self.lock:
+            if key in self.entries:
+                return self.entries[key]
+
+        try:
+            row = self.connection.execute(
+                "SELECT path FROM thumbnail WHERE source = ? AND width = ? AND height = ?", key
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        # 다른 worker가 기록한 섬네일은 처음 한 번만 파일을 확인한다.
+        if not row or not os.path.exists(row[0]):
+            return None
+
+        with self.lock:
+            self.entries[key] = row[0]
+        return row[0]
+
+    def set(self, key: ThumbnailKey, path: str) -> None:
+        with self.lock:
+            self.entries[key] = path
+        if not path:
+            return
+        try:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO thumbnail (source, width, height, path) VALUES (?, ?, ?, ?)",
+                (*key, path)
+            )
+        except sqlite3.Error:
+            pass
+
+    def delete(self, source_file: str) -> Iterable[str]:
+        """원본 파일의 섬네일 기록을 삭제하고, 기록되어 있던 섬네일 경로 목록을 반환한다."""
+        with self.lock:
+            keys = [key for key in self.entries.keys() if key[0] == source_file]
+            paths = {self.entries.pop(key) for key in keys}
+        try:
+            rows = self.connection.execute(
+                "SELECT path FROM thumbnail WHERE source = ?", (source_file,)
+            ).fetchall()
+            self.connection.execute("DELETE FROM thumbnail WHERE source = ?", (source_file,))
+            paths.update(row[0] for row in rows)
+        except sqlite3.Error:
+            pass
+        return [path for path in paths if path]
+
+
+class ThumbnailGenerator():
+    """섬네일 생성 관리 클래스
+    - THUMBNAIL_WORKERS가 0이면 요청 처리 중에 바로 생성한다.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self.manifest = ThumbnailManifest()
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.pending: Dict[ThumbnailKey, Future] = {}
+        self.lock = threading.Lock()
+
+    def get(self, source_file: str, width: int, height: int, target_path: str = None) -> Optional[str]:
+        """섬네일 경로를 반환한다. 섬네일이 없으면 생성을 요청한다.
+
+        Args:
+            source_file (str): 원본 이미지 파일 경로
+            width (int): 섬네일 이미지 너비
+            height (int): 섬네일 이미지 높이
+            target_path (str, optional): 섬네일 저장 경로. Defaults to None.
+
+        Returns:
+            Optional[str]: 섬네일 경로, 생성 중이면 None, 생성할 수 없으면 빈 문자열
+        """
+        key = (source_file, width, height)
+        path = self.manifest.get(key)
+        if path is not None:
+            return path
+
+        thumbnail_file = get_thumbnail_path(source_file, width, height, target_path)
+        # 매니페스트 도입 전에 생성되었거나 기록이 지워진 섬네일 파일은 그대로 사용한다.
+        if os.path.isfile(thumbnail_file) and os.path.getsize(thumbnail_file) > 0:
+            self.manifest.set(key, thumbnail_file)
+            return thumbnail_file
+
+        if not self.max_workers:
+            return self._create(key, thumbnail_file)
+
+        self.submit(key, thumbnail_file)
+        pending = _pending_thumbnails.get()
+        if pending is not None:
+            pending.append(key)
+        return None
+
+    def pregenerate(self, source_file: str, sizes: Iterable[Tuple[int, int]]) -> None:
+        """업로드된 이미지의 섬네일을 미리 생성한다. (생성 프로세스를 사용할 때만)
+
+        Args:
+            source_file (str): 원본 이미지 파일 경로
+            sizes (Iterable[Tuple[int, int]]): 생성할 섬네일 크기 (너비, 높이) 목록
+        """
+        if not self.max_workers:
+            return
+        for width, height in set(sizes):
+            key = (source_file, width, height)
+            self.submit(key, get_thumbnail_path(source_file, width, height))
+
+    def submit(self, key: ThumbnailKey, thumbnail_file: str) -> None:
+        """섬네일 생성을 요청한다. 이미 생성 중이면 다시 요청하지 않는다."""
+        with self.lock:
+            if key in self.pending:
+                return
+            try:
+                future = self._get_executor().submit(create_thumbnail, key[0], thumbnail_file, *key[1:])
+            except RuntimeError as e:
+                logger.warning(f"섬네일 생성 요청 실패 : {e}")
+                return
+            self.pending[key] = future
+        future.add_done_callback(lambda f: self._on_done(key, f))
+
+    def delete(self, source_file: str) -> None:
+        """원본 파일의 섬네일 기록과 섬네일 파일을 삭제한다."""
+        for path in self.manifest.delete(source_file):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def shutdown(self) -> None:
+        """생성 프로세스를 종료한다."""
+        with self.lock:
+            if self.executor:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+            self.pending.clear()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self.executor
+
+    def _create(self, key: ThumbnailKey, thumbnail_file: str) -> str:
+        try:
+            path = create_thumbnail(key[0], thumbnail_file, *key[1:])
+        except Exception as e:
+            logger.warning(f"섬네일 생성 실패 ({key[0]}) : {e}")
+            path = ""
+        self.manifest.set(key, path)
+        return path
+
+    def _on_done(self, key: ThumbnailKey, future: Future) -> None:
+        with self.lock:
+            self.pending.pop(key, None)
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error:
+            logger.warning(f"섬네일 생성 실패 ({key[0]}) : {error}")
+            self.manifest.set(key, "")
+        else:
+            self.manifest.set(key, future.result())
+
+
+_generator: Optional[ThumbnailGenerator] = None
+
+
+def get_thumbnail_generator() -> ThumbnailGenerator:
+    """설정(THUMBNAIL_WORKERS)에 맞는 섬네일 생성 관리 인스턴스를 반환하는 함수"""
+    global _generator
+    if _generator is None:
+        _generator = ThumbnailGenerator(max(settings.THUMBNAIL_WORKERS, 0))
+    return _generator
+
+
+def get_placeholder_thumbnail(width: int, height: int) -> str:
+    """대체 이미지 섬네일 경로를 반환하는 함수
+    - 대체 이미지 섬네일도 생성 중이면 원본 대체 이미지를 반환한다.
+    """
+    path = get_thumbnail_generator().get(PLACEHOLDER_IMAGE, width, height, PLACEHOLDER_DIRECTORY)
+    return path or PLACEHOLDER_IMAGE
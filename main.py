@@ -1,3 +1,5 @@
+import asyncio
+import logging
 import os
 import re
 from contextlib import asynccontextmanager
@@ -5,33 +7,35 @@ from datetime import datetime, timedelta
 
 from dotenv import load_dotenv
 from fastapi import Depends, FastAPI, Path, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse
-from sqlalchemy import delete, insert, select
+from sqlalchemy import delete, insert
 from sqlalchemy.exc import ProgrammingError
 from starlette.staticfiles import StaticFiles
 
-from core import models
 from core.database import DBConnect
 from core.exception import AlertException, regist_core_exception_handler, template_response
 from core.middleware import regist_core_middleware, should_run_middleware
-from core.plugin import (
-    cache_plugin_menu, cache_plugin_state, get_plugin_state_change_time,
-    import_plugin_by_states, read_plugin_state, register_plugin,
-    register_plugin_admin_menu, register_statics,
-)
+from core.plugin import plugin_registry, run_plugin_watcher
 from core.routers import router as template_router
 from core.settings import ENV_PATH, settings
-from core.template import register_theme_statics
+from core.template import UserTemplates, register_theme_statics
 from lib.common import (
     get_client_ip, is_intercept_ip, is_possible_ip, session_member_key
 )
+from lib.config_cache import get_config_snapshot
 from lib.dependency.dependencies import check_use_template
 from lib.member import is_super_admin
 from lib.scheduler import scheduler
+from lib.sequence import write_num_allocator
+from lib.thumbnail import get_thumbnail_generator
 from lib.token import create_session_token
+from service.board_file_service import DownloadCounter, run_download_counter
+from service.current_connect_service import CurrentConnectTracker, run_current_connect_tracker
 from service.member_service import MemberService
 from service.point_service import PointService
-from service.visit_service import VisitService
+from service.popular_service import PopularBuffer, prepare_popular_daily, run_popular_buffer
+from service.visit_service import VisitLogWriter, flush_visit_log, run_visit_log_writer
 
 from admin.admin import router as admin_router
 from install.router import router as install_router
@@ -39,6 +43,8 @@ from bbs.login import router as login_router
 
 from api.v1.routers import router as api_router
 
+logger = logging.getLogger(__name__)
+
 # .env 파일로부터 환경 변수를 로드합니다.
 # 이 함수는 해당 파일 내의 키-값 쌍을 환경 변수로 로드하는 데 사용됩니다.
 load_dotenv()
@@ -51,8 +57,47 @@ async def lifespan(app: FastAPI):
     - yield 이전의 코드: 서버가 시작될 때 실행
     - yield 이후의 코드: 서버가 종료될 때 실행
     """
+    if os.path.exists(ENV_PATH):
+        # 요청 처리 중(트랜잭션 안에서) 테이블을 생성하지 않도록 시작 시 미리 생성합니다.
+        try:
+            write_num_allocator.prepare()
+        except Exception as e:
+            logger.error(f"글번호 할당 테이블을 준비하지 못했습니다: {e}")
+        try:
+            await run_in_threadpool(prepare_popular_daily)
+        except Exception as e:
+            logger.error(f"인기검색어 집계 테이블을 준비하지 못했습니다: {e}")
+    visit_log_task = asyncio.create_task(run_visit_log_writer())
+    download_count_task = asyncio.create_task(run_download_counter())
+    popular_buffer_task = asyncio.create_task(run_popular_buffer())
+    current_connect_task = asyncio.create_task(run_current_connect_tracker())
+    plugin_watcher_task = asyncio.create_task(run_plugin_watcher(app))
+    background_tasks = [
+        visit_log_task, download_count_task, popular_buffer_task,
+        current_connect_task, plugin_watcher_task
+    ]
+    if settings.USE_TEMPLATE and settings.TEMPLATE_PRECOMPILE:
+        # 요청 처리를 막지 않도록 별도 스레드에서 컴파일합니다.
+        background_tasks.append(asyncio.create_task(run_in_threadpool(UserTemplates().precompile)))
     yield
-    scheduler.remove_flag()
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+
+    # 하나가 실패해도 나머지 종료 작업은 실행되도록 각각 처리합니다.
+    shutdown_jobs = [
+        ("방문자 기록", flush_visit_log),
+        ("다운로드 횟수", DownloadCounter.flush),
+        ("인기검색어", PopularBuffer.flush),
+        ("현재 접속자", CurrentConnectTracker.flush),
+        ("썸네일 생성", lambda: get_thumbnail_generator().shutdown()),
+        ("스케줄러", scheduler.remove_flag),
+    ]
+    for name, job in shutdown_jobs:
+        try:
+            await run_in_threadpool(job)
+        except Exception as e:
+            logger.error(f"{name} 종료 작업 중 오류가 발생했습니다: {e}")
 
 app = FastAPI(
     debug=settings.APP_IS_DEBUG,  # 디버그 모드가 활성화 설정
@@ -71,14 +116,7 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 app.mount("/data", StaticFiles(directory="data"), name="data")
 
 # 플러그인 라우터 우선 등록
-plugin_states = read_plugin_state()
-import_plugin_by_states(plugin_states)
-register_plugin(plugin_states)
-register_statics(app, plugin_states)
-
-cache_plugin_state.__setitem__('info', plugin_states)
-cache_plugin_state.__setitem__('change_time', get_plugin_state_change_time())
-cache_plugin_menu.__setitem__('admin_menus', register_plugin_admin_menu(plugin_states))
+plugin_registry.load(app)
 
 app.include_router(admin_router)
 app.include_router(api_router)
@@ -103,8 +141,8 @@ async def main_middleware(request: Request, call_next):
             if not url_path.startswith("/install"):
                 if not os.path.exists(ENV_PATH):
                     raise AlertException(".env 파일이 없습니다. 설치를 진행해 주세요.", 400, "/install")
-                # 기본환경설정 테이블 조회
-                config = db.scalar(select(models.Config))
+                # 기본환경설정 조회 (프로세스 캐시)
+                config = get_config_snapshot(db)
             else:
                 return await call_next(request)
 
@@ -198,23 +236,21 @@ async def main_middleware(request: Request, call_next):
     # 응답 객체 설정
     response: Response = await call_next(request)
 
-    with DBConnect().sessionLocal() as db:
-        age_1day = 60 * 60 * 24
-
-        # 자동로그인 쿠키 재설정
-        # is_autologin과 세션을 확인해서 로그아웃 처리 이후 쿠키가 재설정되는 것을 방지
-        if is_autologin and request.session.get("ss_mb_id"):
-            response.set_cookie(key="ck_mb_id", value=cookie_mb_id,
-                                max_age=age_1day * 30, domain=cookie_domain)
-            response.set_cookie(key="ck_auto", value=ss_mb_key,
-                                max_age=age_1day * 30, domain=cookie_domain)
-        # 방문자 이력 기록
-        ck_visit_ip = request.cookies.get('ck_visit_ip', None)
-        if ck_visit_ip != current_ip:
-            response.set_cookie(key="ck_visit_ip", value=current_ip,
-                                max_age=age_1day, domain=cookie_domain)
-            visit_service = VisitService(request, db)
-            visit_service.create_visit_record()
+    age_1day = 60 * 60 * 24
+
+    # 자동로그인 쿠키 재설정
+    # is_autologin과 세션을 확인해서 로그아웃 처리 이후 쿠키가 재설정되는 것을 방지
+    if is_autologin and request.session.get("ss_mb_id"):
+        response.set_cookie(key="ck_mb_id", value=cookie_mb_id,
+                            max_age=age_1day * 30, domain=cookie_domain)
+        response.set_cookie(key="ck_auto", value=ss_mb_key,
+                            max_age=age_1day * 30, domain=cookie_domain)
+    # 방문자 이력 기록 (대기열에 추가 후 백그라운드에서 기록)
+    ck_visit_ip = request.cookies.get('ck_visit_ip', None)
+    if ck_visit_ip != current_ip:
+        response.set_cookie(key="ck_visit_ip", value=current_ip,
+                            max_age=age_1day, domain=cookie_domain)
+        VisitLogWriter.enqueue(request)
 
     return response
 
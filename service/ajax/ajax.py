@@ -1,8 +1,9 @@
-from typing_extensions import Union, List
+from typing_extensions import Dict, Union, List
 from datetime import datetime
 
 from fastapi import Request
-from sqlalchemy import select, insert, func
+from sqlalchemy import delete, select, insert, func, update
+from sqlalchemy.exc import IntegrityError
 
 from core.database import db_session
 from core.formclass import AutoSaveForm
@@ -75,59 +76,72 @@ class AJAXService:
             raise JSONException(status_code=403, message=f"자신의 글에는 {type_str}을 할 수 없습니다.")
 
     def get_ajax_good_data(self, bo_table: str, write: WriteBaseModel) -> dict:
-        """게시글의 추천/비추천 데이터 확인"""
-        result = {"good": 0, "nogood": 0}
-        write_good_results = self.db.scalars(select(BoardGood).where(
-            BoardGood.bo_table == bo_table, BoardGood.wr_id == write.wr_id
-        ))
-        for good_data in write_good_results:
-            if good_data.bg_flag == "good":
-                result["good"] += 1
-            else:
-                result["nogood"] += 1
-        return result
+        """게시글의 추천/비추천 데이터 확인
+        - 게시글의 추천/비추천 수(wr_good, wr_nogood)를 그대로 사용합니다.
+        """
+        return {"good": write.wr_good, "nogood": write.wr_nogood}
 
     def get_ajax_good_result(self, bo_table: str, member: Member, write: WriteBaseModel, type: str) -> dict:
-        """게시글의 추천/비추천 데이터 확인"""
+        """게시글의 추천/비추천 데이터 확인
+        - 추천/비추천 수는 UPDATE 문으로 증감하여 동시에 요청해도 누락되지 않습니다.
+        - 중복 추천은 (bo_table, wr_id, mb_id) 유니크 제약조건으로 막습니다.
+        """
         result = {"status": "success", "message": "", "good": 0, "nogood": 0}
         type_str = "추천" if type == "good" else "비추천"
-        type_attr = f"wr_{type}"  # 선택한 타입
-        type_attr_rev = "wr_good" if type == "nogood" else "wr_nogood"  # 반대 타입
-        good_query = select(BoardGood).where(
+        write_model = write.__class__
+        type_column = getattr(write_model, f"wr_{type}")  # 선택한 타입
+        type_column_rev = write_model.wr_good if type == "nogood" else write_model.wr_nogood  # 반대 타입
+        good_query = select(BoardGood.bg_id, BoardGood.bg_flag).where(
             BoardGood.bo_table == bo_table,
             BoardGood.wr_id == write.wr_id,
             BoardGood.mb_id == member.mb_id
         )
-        good_data = self.db.scalars(good_query).first()
+        good_data = self.db.execute(good_query).first()
         if good_data:
             # 추천/비추천의 bg_flag가 선택한 타입과 같다면,
             # 데이터 삭제 + 게시글의 추천/비추천 카운트 감소
             if good_data.bg_flag == type:
-                self.db.delete(good_data)
-                setattr(write, type_attr, getattr(write, type_attr) - 1)
+                deleted = self.db.execute(
+                    delete(BoardGood)
+                    .where(BoardGood.bg_id == good_data.bg_id, BoardGood.bg_flag == type)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                if deleted:
+                    self._update_good_count(write, {type_column: type_column - 1})
                 self.db.commit()
                 result["status"] = "cancel"
                 result["message"] = f"{type_str}이 취소되었습니다."
             # 존재하는데 다른 타입이라면
             # 데이터 수정 + 게시글의 추천/비추천 카운트 증가 + 반대 타입 카운트 감소
             else:
-                good_data.bg_flag = type
-                setattr(write, type_attr, getattr(write, type_attr) + 1)
-                setattr(write, type_attr_rev, getattr(write, type_attr_rev) - 1)
+                changed = self.db.execute(
+                    update(BoardGood)
+                    .where(BoardGood.bg_id == good_data.bg_id, BoardGood.bg_flag == good_data.bg_flag)
+                    .values(bg_flag=type)
+                    .execution_options(synchronize_session=False)
+                ).rowcount
+                if changed:
+                    self._update_good_count(write, {type_column: type_column + 1,
+                                                    type_column_rev: type_column_rev - 1})
                 self.db.commit()
                 result["message"] = f"게시글을 {type_str} 했습니다."
         else:
             # 존재하지 않으면
             # 데이터 추가 + 게시글의 추천/비추천 카운트 증가
-            self.db.execute(
-                insert(BoardGood).values(
-                    bo_table=bo_table,
-                    wr_id=write.wr_id,
-                    mb_id=member.mb_id,
-                    bg_flag=type
-                )
-            )
-            setattr(write, type_attr, getattr(write, type_attr) + 1)
+            try:
+                with self.db.begin_nested():
+                    self.db.execute(
+                        insert(BoardGood).values(
+                            bo_table=bo_table,
+                            wr_id=write.wr_id,
+                            mb_id=member.mb_id,
+                            bg_flag=type
+                        )
+                    )
+                self._update_good_count(write, {type_column: type_column + 1})
+            except IntegrityError:
+                # 같은 회원의 요청이 동시에 처리되어 이미 추천/비추천된 경우
+                pass
             self.db.commit()
             result["message"] = f"게시글을 {type_str} 했습니다."
 
@@ -137,6 +151,16 @@ class AJAXService:
         result["nogood"] = write.wr_nogood
         return result
 
+    def _update_good_count(self, write: WriteBaseModel, values: dict) -> None:
+        """게시글의 추천/비추천 수를 증감한다. (UPDATE ... SET wr_good = wr_good + 1)"""
+        write_model = write.__class__
+        self.db.execute(
+            update(write_model)
+            .where(write_model.wr_id == write.wr_id)
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+
     def validate_login(self, member: Member):
         """로그인 여부 검증"""
         if not member:
@@ -3,5 +3,5 @@ from .list_post import ListPostService
 from .create_post import CreatePostService, MoveUpdateService
 from .read_post import ReadPostService, DownloadFileService
 from .update_post import UpdatePostService, CommentService
-from .delete_post import DeletePostService, DeleteCommentService, ListDeleteService
+from .delete_post import DeletePostService, DeleteCommentService, ListDeleteService, BulkDeleteService
 from .group_board_list import GroupBoardListService
\ No newline at end of file
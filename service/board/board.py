@@ -9,8 +9,9 @@ from core.models import Board, WriteBaseModel, Group, AutoSave
 from core.exception import AlertException
 from core.formclass import WriteForm
 from lib.board_lib import (
-    BoardConfig, FileCache, is_owner, is_write_delay, send_write_mail
+    BoardConfig, is_owner, is_write_delay, send_write_mail
 )
+from lib.cache import invalidate_latest_cache
 from lib.member import MemberDetails
 from lib.common import (
     dynamic_create_write_table, filter_words,
@@ -261,7 +262,7 @@ class BoardService(BaseService, BoardConfig):
 
     def delete_cache(self):
         """최신글 캐시 삭제"""
-        FileCache().delete_prefix(f"latest-{self.bo_table}")
+        invalidate_latest_cache(self.bo_table)
     
     def delete_auto_save(self, uid: str):
         """자동저장 글 삭제"""
@@ -322,15 +323,18 @@ class BoardService(BaseService, BoardConfig):
                 board_file = file_service.get_board_file(self.board.bo_table, write.wr_id, index)
                 bf_content = file_content[index] if file_content and file_content[index] else ""
                 filename = file_service.get_filename(file.filename)
+                # 파일 업로드 (업로드 용량을 넘으면 저장을 중단)
+                max_size = 0 if self.member.admin_type else self.board.bo_upload_size
+                if not file_service.upload_file(directory, filename, file, max_size):
+                    exclude_file["size"].append(file.filename)
+                    continue
+
                 if board_file:
-                    # 기존파일 삭제
+                    # 기존파일 삭제 및 정보 업데이트
                     file_service.remove_file(board_file.bf_file)
-                    # 파일 업로드 및 정보 업데이트
-                    file_service.upload_file(directory, filename, file)
                     file_service.update_board_file(board_file, directory, filename, file, bf_content)
                 else:
-                    # 파일 업로드 및 정보 추가
-                    file_service.upload_file(directory, filename, file)
+                    # 파일 정보 추가
                     file_service.insert_board_file(self.board.bo_table, write.wr_id, index,
                                                         directory, filename, file, bf_content)
                     wr_file += 1
@@ -1,13 +1,15 @@
 from datetime import datetime
-from typing_extensions import Annotated, List, Union
+from typing_extensions import Annotated, Dict, List, Union
 from fastapi import Request, Path, Form, Depends
-from sqlalchemy import select, update
+from sqlalchemy import bindparam, delete, or_, select, update
 
 from core.database import db_session
-from core.models import WriteBaseModel, BoardNew, BoardGood, Scrap
+from core.models import Board, WriteBaseModel, BoardNew, BoardGood, Scrap
 from core.formclass import WriteForm
-from lib.board_lib import FileCache, get_next_num, generate_reply_character
+from lib.board_lib import get_next_num, generate_reply_character
+from lib.cache import invalidate_latest_cache
 from lib.common import cut_name, dynamic_create_write_table
+from lib.search import get_search_backend
 from lib.dependency.dependencies import (
     validate_captcha as lib_validate_captcha, get_variety_bo_table
 )
@@ -15,7 +17,7 @@ from lib.template_filters import datetime_format
 from api.v1.models.board import WriteModel, WriteTransportation
 from service.point_service import PointService
 from . import BoardService
-from service.board_file_service import BoardFileService
+from service.board_file_service import BoardFileService, remove_files_in_background
 
 class CreatePostService(BoardService):
     """
@@ -55,7 +57,7 @@ class CreatePostService(BoardService):
         """게시글을 저장"""
         parent_write = self.get_parent_post(parent_id)
         write = self.write_model(
-            wr_num=parent_write.wr_num if parent_write else get_next_num(self.bo_table),
+            wr_num=parent_write.wr_num if parent_write else get_next_num(self.bo_table, db=self.db),
             wr_reply=generate_reply_character(self.board, parent_write) if parent_write else "",
             wr_datetime=datetime.now(),
             mb_id=self.member.mb_id or "",
@@ -67,6 +69,7 @@ class CreatePostService(BoardService):
 
         write.wr_parent = write.wr_id  # 부모아이디 설정
         self.board.bo_count_write = self.board.bo_count_write + 1  # 게시판 글 갯수 1 증가
+        get_search_backend().index_write(self.db, self.bo_table, write)
         self.db.commit()
         return write
 
@@ -112,90 +115,177 @@ class MoveUpdateService(BoardService):
         ).all()
         return origin_writes
 
-    def move_copy_post(self, target_bo_tables: list, origin_writes: WriteBaseModel):
-        """게시글들을 복사/이동 합니다."""
-        origin_board = self.board
+    def move_copy_post(self, target_bo_tables: list, origin_writes: List[WriteBaseModel]):
+        """게시글들을 복사/이동 합니다.
+        - 선택한 게시글의 댓글도 함께 복사/이동합니다.
+        - 대상 게시판마다 wr_num을 한번에 할당하고 게시글을 한번에 추가합니다.
+        - 최신글/추천/스크랩/파일 정보는 한번에 수정하며, 전체 작업을 하나의 트랜잭션으로 처리합니다.
+        - 여러 게시판으로 이동하는 경우, 첫번째 게시판으로 이동하고 나머지 게시판에는 복사합니다.
+        """
         origin_bo_table = self.bo_table
+        origin_rows = self.get_origin_rows(origin_writes)
+        if not origin_rows or not target_bo_tables:
+            return
 
-        # 게시글 복사/이동 작업 반복
-        file_cache = FileCache()
-        for target_bo_table in target_bo_tables:
-            for origin_write in origin_writes:
-                target_write_model = dynamic_create_write_table(target_bo_table)
-                target_write = target_write_model()
-
-                # 복사/이동 로그 기록
-                log_msg = ""
-                if not origin_write.wr_is_comment and self.config.cf_use_copy_log:
-                    nick = cut_name(self.request, self.member.mb_nick)
-                    log_msg = f"[이 게시물은 {nick}님에 의해 {datetime_format(datetime.now()) } {origin_board.bo_subject}에서 {self.act} 됨]"
-                    if "html" in origin_write.wr_option:
-                        log_msg = f'<div class="content_{self.sw}">' + log_msg + '</div>'
-                    else:
-                        log_msg = '\n' + log_msg
-
-                # 게시글 복사
-                initial_field = ["wr_id", "wr_parent"]
-                for field in origin_write.__table__.columns.keys():
-                    if field in initial_field:
-                        continue
-                    elif field == 'wr_content':
-                        target_write.wr_content = origin_write.wr_content + log_msg
-                    elif field == 'wr_num':
-                        target_write.wr_num = get_next_num(target_bo_table)
-                    else:
-                        setattr(target_write, field, getattr(origin_write, field))
-
-                if self.sw == WriteTransportation.MOVE.value:
-                    target_write.wr_good = 0
-                    target_write.wr_nogood = 0
-                    target_write.wr_hit = 0
-                    target_write.wr_datetime = datetime.now()
-
-                # 게시글 추가
-                self.db.add(target_write)
-                self.db.commit()
-                # 부모아이디 설정
-                target_write.wr_parent = target_write.wr_id
-                self.db.commit()
-
-                if self.sw == WriteTransportation.MOVE.value:
-                    # 최신글 이동
-                    self.db.execute(
-                        update(BoardNew)
-                        .where(BoardNew.bo_table == origin_board.bo_table, BoardNew.wr_id == origin_write.wr_id)
-                        .values(bo_table=target_bo_table, wr_id=target_write.wr_id, wr_parent=target_write.wr_id)
-                    )
-                    # 게시글
-                    if not origin_write.wr_is_comment:
-                        # 추천데이터 이동
-                        self.db.execute(
-                            update(BoardGood)
-                            .where(BoardGood.bo_table == target_bo_table, BoardGood.wr_id == target_write.wr_id)
-                            .values(bo_table=target_bo_table, wr_id=target_write.wr_id)
-                        )
-                        # 스크랩 이동
-                        self.db.execute(
-                            update(Scrap)
-                            .where(Scrap.bo_table == target_bo_table, Scrap.wr_id == target_write.wr_id)
-                            .values(bo_table=target_bo_table, wr_id=target_write.wr_id)
-                        )
-                    # 기존 데이터 삭제
-                    self.db.delete(origin_write)
-                    self.db.commit()
-
-                # 파일이 존재할 경우
-                if self.file_service.is_exist(origin_board.bo_table, origin_write.wr_id):
-                    if self.sw == WriteTransportation.MOVE.value:
-                        self.file_service.move_board_files(CreatePostService.FILE_DIRECTORY,
-                                                           origin_bo_table, origin_write.wr_id,
-                                                           target_bo_table, target_write.wr_id)
-                    else:
-                        self.file_service.copy_board_files(CreatePostService.FILE_DIRECTORY,
-                                                           origin_bo_table, origin_write.wr_id,
-                                                           target_bo_table, target_write.wr_id)
-            # 최신글 캐시 삭제
-            file_cache.delete_prefix(f'latest-{target_bo_table}')
+        is_move = self.sw == WriteTransportation.MOVE.value
+        search_backend = get_search_backend()
+        # 이동하면 원본 파일 정보가 대상 게시판으로 바뀌므로,
+        # 복사할 게시판을 먼저 처리하고 이동할 첫번째 게시판은 마지막에 처리합니다.
+        targets = [(target_bo_table, False) for target_bo_table in target_bo_tables[1:]]
+        targets.append((target_bo_tables[0], is_move))
+        # 새로 만든 파일은 롤백하면 삭제하고, 이동한 원본 파일은 커밋한 뒤 삭제합니다.
+        created_paths: List[str] = []
+        obsolete_paths: List[str] = []
+        try:
+            for target_bo_table, move_related in targets:
+                wr_id_map = self.insert_target_rows(target_bo_table, origin_rows, move_related)
+                for origin_row in origin_rows:
+                    search_backend.index_write(self.db, target_bo_table, origin_row.target_write)
+
+                if move_related:
+                    self.move_related_data(target_bo_table, origin_rows)
+                created, obsolete = self.file_service.transfer_board_files(
+                    CreatePostService.FILE_DIRECTORY, origin_bo_table, target_bo_table,
+                    wr_id_map, is_move=move_related
+                )
+                created_paths.extend(created)
+                obsolete_paths.extend(obsolete)
+                self.update_board_count(target_bo_table, origin_rows, 1)
+
+            if is_move:
+                origin_wr_ids = [origin_row.wr_id for origin_row in origin_rows]
+                self.db.execute(
+                    delete(self.write_model)
+                    .where(self.write_model.wr_id.in_(origin_wr_ids))
+                    .execution_options(synchronize_session=False)
+                )
+                search_backend.delete_writes(self.db, origin_bo_table, origin_wr_ids)
+                self.update_board_count(origin_bo_table, origin_rows, -1)
 
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            remove_files_in_background(created_paths)
+            raise
+
+        # 새 게시글이 사용하는 파일은 삭제하지 않습니다.
+        created_path_set = set(created_paths)
+        remove_files_in_background([path for path in obsolete_paths if path not in created_path_set])
+
+        # 최신글 캐시 삭제
+        for target_bo_table in target_bo_tables:
+            invalidate_latest_cache(target_bo_table)
         # 원본 게시판 최신글 캐시 삭제
-        file_cache.delete_prefix(f'latest-{origin_bo_table}')
+        invalidate_latest_cache(origin_bo_table)
+
+    def get_origin_rows(self, origin_writes: List[WriteBaseModel]) -> List[WriteBaseModel]:
+        """선택된 게시글과 댓글을 wr_id 순으로 조회합니다."""
+        parent_ids = [write.wr_id for write in origin_writes if not write.wr_is_comment]
+        comment_ids = [write.wr_id for write in origin_writes if write.wr_is_comment]
+        return self.db.scalars(
+            select(self.write_model)
+            .where(or_(self.write_model.wr_parent.in_(parent_ids),
+                       self.write_model.wr_id.in_(comment_ids)))
+            .order_by(self.write_model.wr_id)
+        ).all()
+
+    def insert_target_rows(self, target_bo_table: str,
+                           origin_rows: List[WriteBaseModel], is_move: bool) -> Dict[int, int]:
+        """대상 게시판에 게시글/댓글을 한번에 추가합니다.
+        - 원본의 wr_num 묶음(원글, 답변글, 댓글)마다 새 wr_num을 한번에 할당합니다.
+        - 추가한 뒤 원본 wr_parent를 새 wr_id로 바꿉니다.
+
+        Returns:
+            Dict[int, int]: 원본 게시글 아이디 => 대상 게시글 아이디
+        """
+        target_write_model = dynamic_create_write_table(target_bo_table)
+
+        # wr_num은 음수이며 작을수록 최근 글이므로, 오래된 묶음부터 차례로 할당합니다.
+        origin_nums = sorted({origin_row.wr_num for origin_row in origin_rows}, reverse=True)
+        next_num = get_next_num(target_bo_table, len(origin_nums), self.db)
+        num_map = {wr_num: next_num - i for i, wr_num in enumerate(origin_nums)}
+
+        log_msg = self.get_copy_log_message()
+        now = datetime.now()
+        columns = [column for column in self.write_model.__table__.columns.keys()
+                   if column in target_write_model.__table__.columns.keys()
+                   and column not in ("wr_id", "wr_parent", "wr_num")]
+        for origin_row in origin_rows:
+            target_write = target_write_model(wr_parent=0, wr_num=num_map[origin_row.wr_num])
+            for column in columns:
+                setattr(target_write, column, getattr(origin_row, column))
+
+            # 복사/이동 로그 기록
+            if not origin_row.wr_is_comment and log_msg:
+                if "html" in origin_row.wr_option:
+                    target_write.wr_content += f'<div class="content_{self.sw}">' + log_msg + '</div>'
+                else:
+                    target_write.wr_content += '\n' + log_msg
+
+            if is_move:
+                target_write.wr_hit = 0
+                target_write.wr_datetime = now
+            else:
+                # 추천 데이터는 복사하지 않으므로 추천/비추천 수를 초기화
+                target_write.wr_good = 0
+                target_write.wr_nogood = 0
+            origin_row.target_write = target_write
+
+        self.db.add_all([origin_row.target_write for origin_row in origin_rows])
+        self.db.flush()
+
+        # 부모아이디 설정
+        wr_id_map = {origin_row.wr_id: origin_row.target_write.wr_id for origin_row in origin_rows}
+        for origin_row in origin_rows:
+            origin_row.target_write.wr_parent = wr_id_map.get(origin_row.wr_parent,
+                                                              origin_row.target_write.wr_id)
+        self.db.flush()
+        return wr_id_map
+
+    def get_copy_log_message(self) -> str:
+        """복사/이동 로그 문구"""
+        if not self.config.cf_use_copy_log:
+            return ""
+        nick = cut_name(self.request, self.member.mb_nick)
+        return f"[이 게시물은 {nick}님에 의해 {datetime_format(datetime.now()) } {self.board.bo_subject}에서 {self.act} 됨]"
+
+    def move_related_data(self, target_bo_table: str, origin_rows: List[WriteBaseModel]) -> None:
+        """최신글/추천/스크랩 정보를 대상 게시판으로 한번에 옮깁니다."""
+        params = [
+            {"origin_wr_id": origin_row.wr_id,
+             "target_wr_id": origin_row.target_write.wr_id,
+             "target_wr_parent": origin_row.target_write.wr_parent}
+            for origin_row in origin_rows
+        ]
+        new_table = BoardNew.__table__
+        self.db.execute(
+            update(new_table)
+            .where(new_table.c.bo_table == self.bo_table, new_table.c.wr_id == bindparam("origin_wr_id"))
+            .values(bo_table=target_bo_table,
+                    wr_id=bindparam("target_wr_id"),
+                    wr_parent=bindparam("target_wr_parent")),
+            params
+        )
+
+        post_params = [param for param, origin_row in zip(params, origin_rows) if not origin_row.wr_is_comment]
+        if not post_params:
+            return
+        for table in (BoardGood.__table__, Scrap.__table__):
+            self.db.execute(
+                update(table)
+                .where(table.c.bo_table == self.bo_table, table.c.wr_id == bindparam("origin_wr_id"))
+                .values(bo_table=target_bo_table, wr_id=bindparam("target_wr_id")),
+                post_params
+            )
+
+    def update_board_count(self, bo_table: str, rows: List[WriteBaseModel], sign: int) -> None:
+        """게시판의 글/댓글 수를 증감합니다."""
+        write_count = sum(1 for row in rows if not row.wr_is_comment)
+        comment_count = len(rows) - write_count
+        self.db.execute(
+            update(Board)
+            .where(Board.bo_table == bo_table)
+            .values(bo_count_write=Board.bo_count_write + sign * write_count,
+                    bo_count_comment=Board.bo_count_comment + sign * comment_count)
+            .execution_options(synchronize_session=False)
+        )
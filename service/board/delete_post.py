@@ -1,13 +1,15 @@
-from typing_extensions import List, Annotated
+from typing_extensions import Dict, Iterable, List, Annotated, Tuple
 
 from fastapi import Depends, Request, HTTPException, Path
-from sqlalchemy import select, exists, delete, update
+from sqlalchemy import bindparam, select, exists, delete, or_, update
 
 from core.database import db_session
-from core.models import Member, BoardNew, Scrap, WriteBaseModel
-from lib.board_lib import is_owner, FileCache
-from lib.common import remove_query_params, set_url_query_params
-from service.board_file_service import BoardFileService
+from core.models import Board, BoardGood, Member, BoardNew, Scrap, WriteBaseModel
+from lib.board_lib import is_owner
+from lib.cache import invalidate_latest_cache
+from lib.common import dynamic_create_write_table, remove_query_params, set_url_query_params
+from lib.search import get_search_backend
+from service.board_file_service import BoardFileService, remove_files_in_background
 from service.point_service import PointService
 from .board import BoardService
 
@@ -88,66 +90,10 @@ class DeletePostService(BoardService):
 
     def delete_write(self):
         """게시글 삭제 처리"""
-        write_model = self.write_model
-        db = self.db
-        bo_table = self.bo_table
-        board = self.board
-
-        # 원글 + 댓글
-        delete_write_count = 0
-        delete_comment_count = 0
-        writes: List[WriteBaseModel] = db.scalars(
-            select(write_model)
-            .filter_by(wr_parent=self.wr_id)
-            .order_by(write_model.wr_id)
-        ).all()
-        for write in writes:
-            # 원글 삭제
-            if not write.wr_is_comment:
-                # 원글 포인트 삭제
-                if not self.point_service.delete_point(write.mb_id, bo_table, self.wr_id, "쓰기"):
-                    self.point_service.save_point(write.mb_id, board.bo_write_point * (-1),
-                                                    f"{board.bo_subject} {self.wr_id} 글 삭제")
-                # 파일+섬네일 삭제
-                self.file_service.delete_board_files(board.bo_table, self.wr_id)
-
-                delete_write_count += 1
-                # TODO: 에디터 섬네일 삭제
-            else:
-                # 댓글 포인트 삭제
-                if not self.point_service.delete_point(write.mb_id, bo_table, self.wr_id, "댓글"):
-                    self.point_service.save_point(self.request, write.mb_id, board.bo_comment_point * (-1),
-                                                  f"{board.bo_subject} {self.wr_id} 댓글 삭제")
-
-                delete_comment_count += 1
-
-        # 원글+댓글 삭제
-        db.execute(delete(write_model).filter_by(wr_parent=self.wr_id))
-
-        # 최근 게시물 삭제
-        db.execute(delete(BoardNew).where(
-            BoardNew.bo_table == bo_table,
-            BoardNew.wr_parent == self.wr_id
-        ))
-
-        # 스크랩 삭제
-        db.execute(delete(Scrap).filter_by(
-            bo_table=bo_table,
-            wr_id=self.wr_id
-        ))
-
-        # 공지사항 삭제
-        board.bo_notice = self.set_board_notice(self.wr_id, False)
-
-        # 게시글 갯수 업데이트
-        board.bo_count_write -= delete_write_count
-        board.bo_count_comment -= delete_comment_count
-
-        db.commit()
-        db.close()
-
-        # 최신글 캐시 삭제
-        FileCache().delete_prefix(f'latest-{bo_table}')
+        deleter = BulkDeleteService(self.request, self.db, self.file_service, self.point_service)
+        deleter.delete_writes(self.board, [self.wr_id])
+        deleter.commit()
+        self.db.close()
 
 
 class DeleteCommentService(DeletePostService):
@@ -224,6 +170,7 @@ class DeleteCommentService(DeletePostService):
 
         # 댓글 삭제
         self.db.delete(self.comment)
+        get_search_backend().delete_writes(self.db, self.bo_table, [self.comment.wr_id])
 
         # 게시글에 댓글 수 감소
         self.db.execute(
@@ -264,26 +211,125 @@ class ListDeleteService(BoardService):
         return instance
 
     def delete_writes(self, wr_ids: list):
-        """게시글 목록 삭제"""
-        write_model = self.write_model
-        writes: List[WriteBaseModel] = self.db.scalars(
-            select(write_model)
-            .where(write_model.wr_id.in_(wr_ids))
+        """게시글 목록 삭제 (댓글 포함)"""
+        deleter = BulkDeleteService(self.request, self.db, self.file_service, self.point_service)
+        deleter.delete_writes(self.board, wr_ids)
+        deleter.commit()
+
+
+class BulkDeleteService():
+    """
+    여러 게시글/댓글을 한번에 삭제하는 클래스
+    - 포인트는 회원별로 합산하여 되돌리고, 관련 데이터는 게시판별로 IN 조건 쿼리 한번씩 삭제한다.
+    - 첨부파일은 커밋한 뒤 백그라운드 스레드에서 삭제하고, 최신글 캐시는 게시판별로 한번만 무효화한다.
+    """
+
+    def __init__(
+        self,
+        request: Request,
+        db: db_session,
+        file_service: Annotated[BoardFileService, Depends()],
+        point_service: Annotated[PointService, Depends()],
+    ):
+        self.request = request
+        self.db = db
+        self.file_service = file_service
+        self.point_service = point_service
+        self.deleted_tables: List[str] = []
+        self.file_paths: List[str] = []
+
+    def delete_writes(self, board: Board, wr_ids: Iterable[int]) -> Tuple[int, int]:
+        """게시판의 게시글/댓글을 삭제한다. 게시글을 삭제하면 댓글도 함께 삭제한다.
+        - 커밋은 commit()에서 한다.
+
+        Args:
+            board (Board): 게시판 정보
+            wr_ids (Iterable[int]): 삭제할 게시글/댓글 아이디 목록
+
+        Returns:
+            Tuple[int, int]: (삭제한 게시글 수, 삭제한 댓글 수)
+        """
+        wr_ids = list({int(wr_id) for wr_id in wr_ids})
+        if not wr_ids:
+            return 0, 0
+
+        db = self.db
+        bo_table = board.bo_table
+        write_model = dynamic_create_write_table(bo_table)
+
+        # 원글 + 댓글
+        writes = db.execute(
+            select(write_model.wr_id, write_model.wr_parent, write_model.wr_is_comment, write_model.mb_id)
+            .where(or_(write_model.wr_id.in_(wr_ids), write_model.wr_parent.in_(wr_ids)))
         ).all()
+        if not writes:
+            return 0, 0
+
+        delete_ids = [write.wr_id for write in writes]
+        post_ids = [write.wr_id for write in writes if not write.wr_is_comment]
+        post_id_set = set(post_ids)
+        # 원글은 남아있고 댓글만 삭제되는 경우 원글의 댓글 수 감소
+        comment_counts: Dict[int, int] = {}
         for write in writes:
-            self.db.delete(write)
-            # 원글 포인트 삭제
-            if not self.point_service.delete_point(write.mb_id, self.bo_table, write.wr_id, "쓰기"):
-                self.point_service.save_point(write.mb_id, self.board.bo_write_point * (-1),
-                                              f"{self.board.bo_subject} {write.wr_id} 글 삭제")
+            if write.wr_is_comment and write.wr_parent not in post_id_set:
+                comment_counts[write.wr_parent] = comment_counts.get(write.wr_parent, 0) + 1
+
+        # 포인트 삭제 (회원별 합산)
+        self.point_service.delete_write_points(board, writes)
+
+        # 원글+댓글 삭제
+        db.execute(delete(write_model).where(write_model.wr_id.in_(delete_ids)))
+        get_search_backend().delete_writes(db, bo_table, delete_ids)
+
+        if comment_counts:
+            table = write_model.__table__
+            db.execute(
+                update(table)
+                .where(table.c.wr_id == bindparam("parent_wr_id"))
+                .values(wr_comment=table.c.wr_comment - bindparam("comment_count")),
+                [{"parent_wr_id": wr_id, "comment_count": count} for wr_id, count in comment_counts.items()]
+            )
+
+        # 최근 게시물 삭제
+        db.execute(delete(BoardNew).where(BoardNew.bo_table == bo_table, BoardNew.wr_id.in_(delete_ids)))
+
+        if post_ids:
+            # 스크랩, 좋아요/싫어요 삭제
+            db.execute(delete(Scrap).where(Scrap.bo_table == bo_table, Scrap.wr_id.in_(post_ids)))
+            db.execute(delete(BoardGood).where(BoardGood.bo_table == bo_table, BoardGood.wr_id.in_(post_ids)))
+            # 파일 정보 삭제 (파일은 커밋 후 삭제)
+            # TODO: 에디터 섬네일 삭제
+            self.file_paths.extend(self.file_service.delete_board_files_by_wr_ids(bo_table, post_ids))
+
+        # 공지사항 삭제, 게시글 갯수 업데이트
+        delete_write_count = len(post_ids)
+        delete_comment_count = len(delete_ids) - delete_write_count
+        delete_notice_ids = {str(wr_id) for wr_id in post_ids}
+        notice_ids = [notice_id for notice_id in (board.bo_notice or "").split(",")
+                      if notice_id and notice_id not in delete_notice_ids]
+        db.execute(
+            update(Board)
+            .where(Board.bo_table == bo_table)
+            .values(
+                bo_notice=",".join(notice_ids),
+                bo_count_write=Board.bo_count_write - delete_write_count,
+                bo_count_comment=Board.bo_count_comment - delete_comment_count,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        if bo_table not in self.deleted_tables:
+            self.deleted_tables.append(bo_table)
 
-            # 파일 삭제
-            self.file_service.delete_board_files(self.board.bo_table, write.wr_id)
+        return delete_write_count, delete_comment_count
 
-            # TODO: 댓글 삭제
+    def commit(self) -> None:
+        """삭제 내용을 커밋하고, 파일 삭제와 최신글 캐시 무효화를 처리한다."""
         self.db.commit()
 
-        # 최신글 캐시 삭제
-        FileCache().delete_prefix(f'latest-{self.bo_table}')
+        remove_files_in_background(self.file_paths)
+        self.file_paths = []
 
-        # TODO: 게시글 삭제시 같이 삭제해야할 것들 추가
+        for bo_table in self.deleted_tables:
+            invalidate_latest_cache(bo_table)
+        self.deleted_tables = []
@@ -1,13 +1,16 @@
-from typing_extensions import Annotated, List
+from typing_extensions import Annotated, Dict, List, Tuple
 from fastapi import Request, Path, Depends
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import and_, asc, desc, func, or_, select
 
 from core.database import db_session
 from core.models import WriteBaseModel
 from lib.dependency.dependencies import common_search_query_params
-from lib.board_lib import get_list_thumbnail, write_search_filter, get_list, cut_name, is_owner
+from lib.board_lib import (
+    cut_name, decode_list_cursor, encode_list_cursor, get_list, get_list_thumbnail,
+    is_owner, write_search_filter
+)
+from lib.search import get_search_backend
 from service.board_file_service import BoardFileService
-from service.ajax import AJAXService
 from . import BoardService
 
 
@@ -33,6 +36,8 @@ class ListPostService(BoardService):
         self.search_params = search_params
         self.prev_spt = None
         self.next_spt = None
+        self.prev_cursor = None
+        self.next_cursor = None
 
     @classmethod
     async def async_init(
@@ -55,6 +60,7 @@ class ListPostService(BoardService):
         sod = search_params.get('sod')
 
         # 게시글 목록 조회
+        self.is_search = bool(sca or (sfl and stx))
         self.query = write_search_filter(self.write_model, sca, sfl, stx)
 
         # 정렬
@@ -75,15 +81,17 @@ class ListPostService(BoardService):
             self.query = self.get_list_sort_query(self.write_model, self.query)
 
         if (sca or (sfl and stx)):  # 검색일 경우
-            search_part = int(self.config.cf_search_part) or 10000
-            min_spt = self.db.scalar(
-                select(func.coalesce(func.min(self.write_model.wr_num), 0)))
-            spt = int(self.request.query_params.get("spt", min_spt))
-            self.prev_spt = spt - search_part if spt > min_spt else None
-            self.next_spt = spt + search_part if spt + search_part < 0 else None
-
-            # wr_num 컬럼을 기준으로 검색단위를 구분합니다. (wr_num은 음수)
-            self.query = self.query.where(self.write_model.wr_num.between(spt, spt + search_part))
+            # 색인을 사용하지 않는 검색(LIKE)은 검색단위로 나누어 검색합니다.
+            if get_search_backend().use_search_part:
+                search_part = int(self.config.cf_search_part) or 10000
+                min_spt = self.db.scalar(
+                    select(func.coalesce(func.min(self.write_model.wr_num), 0)))
+                spt = int(self.request.query_params.get("spt", min_spt))
+                self.prev_spt = spt - search_part if spt > min_spt else None
+                self.next_spt = spt + search_part if spt + search_part < 0 else None
+
+                # wr_num 컬럼을 기준으로 검색단위를 구분합니다. (wr_num은 음수)
+                self.query = self.query.where(self.write_model.wr_num.between(spt, spt + search_part))
 
             # 검색 내용에 댓글이 잡히는 경우 부모 글을 가져오기 위해 wr_parent를 불러오는 subquery를 이용합니다.
             subquery = select(self.query.add_columns(self.write_model.wr_parent).distinct().order_by(None).subquery().alias("subquery"))
@@ -103,20 +111,21 @@ class ListPostService(BoardService):
         """
         게시글 목록에 부가 정보를 추가합니다.
         (댓글, 좋아요, 회원 이미지, 회원 아이콘, 썸네일, 첨부파일)
+        - 댓글, 첨부파일은 목록의 게시글 전체를 한번에 조회합니다.
         """
-        ajax_service = AJAXService(self.request, self.db)
-        for write in writes:
-            write.num = total_count - offset - writes.index(write)
-            write = get_list(self.request, self.db, write, self)
-
-            # 댓글 정보를 불러와서 write에 추가합니다.
-            comments: List[WriteBaseModel] = self.db.scalars(
-            select(self.write_model).filter_by(
-                    wr_parent=write.wr_id,
-                    wr_is_comment=1
-                ).order_by(self.write_model.wr_comment, self.write_model.wr_comment_reply)
-            ).all()
+        wr_ids = [write.wr_id for write in writes]
+        comments_by_parent = self.get_comments_by_parent(wr_ids)
+        files_by_wr_id = self.file_service.get_board_files_by_wr_ids(self.bo_table, wr_ids)
+
+        for index, write in enumerate(writes):
+            board_files = files_by_wr_id.get(write.wr_id, [])
+            images, normal_files = self.file_service.split_files_by_type(board_files)
 
+            write.num = total_count - offset - index
+            write = get_list(self.request, self.db, write, self, icon_file=bool(board_files))
+
+            # 댓글 정보를 write에 추가합니다.
+            comments = comments_by_parent.get(write.wr_id, [])
             for comment in comments:
                 comment.name = cut_name(self.request, comment.wr_name)
                 comment.ip = self.get_display_ip(comment.wr_ip)
@@ -129,13 +138,12 @@ class ListPostService(BoardService):
                 comment.mb_image_path = self.get_member_image_path(comment.mb_id)
                 comment.mb_icon_path = self.get_member_icon_path(comment.mb_id)
 
-                # 비밀댓글 처리
+                # 비밀댓글 처리 (댓글의 부모글은 현재 게시글)
                 session_secret_comment_name = f"ss_secret_comment_{self.bo_table}_{comment.wr_id}"
-                parent_write = self.db.get(self.write_model, comment.wr_parent)
                 if (comment.is_secret
                         and not self.member.admin_type
                         and not is_owner(comment, self.member.mb_id)
-                        and not is_owner(parent_write, self.member.mb_id)
+                        and not is_owner(write, self.member.mb_id)
                         and not self.request.session.get(session_secret_comment_name)):
                     comment.is_secret_content = True
                     comment.save_content = "비밀글 입니다."
@@ -146,22 +154,46 @@ class ListPostService(BoardService):
 
             # 게시글 목록 조회시 첨부된 파일을 함께 가져올 경우, default는 False
             if with_files:
-                write.images, write.normal_files = self.file_service.get_board_files_by_type(self.bo_table, write.wr_id)
+                write.images, write.normal_files = images, normal_files
 
             # 회원 이미지, 아이콘 경로 설정
             write.mb_image_path = self.get_member_image_path(write.mb_id)
             write.mb_icon_path = self.get_member_icon_path(write.mb_id)
 
             # 게시글 좋아요/싫어요 정보 설정
-            ajax_good_data = ajax_service.get_ajax_good_data(self.bo_table, write)
-            write.good = ajax_good_data["good"]
-            write.nogood = ajax_good_data["nogood"]
+            write.good = write.wr_good
+            write.nogood = write.wr_nogood
 
             # 게시글 썸네일 설정
-            write.thumbnail = get_list_thumbnail(self.request, self.board, write, self.gallery_width, self.gallery_height)
+            write.thumbnail = get_list_thumbnail(self.request, self.board, write,
+                                                 self.gallery_width, self.gallery_height, images=images)
+
+    def get_comments_by_parent(self, wr_ids: List[int]) -> Dict[int, List[WriteBaseModel]]:
+        """여러 게시글의 댓글 목록을 한번에 조회하여 부모글 아이디별로 반환합니다."""
+        comments_by_parent = {wr_id: [] for wr_id in wr_ids}
+        if not wr_ids:
+            return comments_by_parent
+
+        comments = self.db.scalars(
+            select(self.write_model)
+            .where(
+                self.write_model.wr_parent.in_(wr_ids),
+                self.write_model.wr_is_comment == 1
+            )
+            .order_by(self.write_model.wr_parent, self.write_model.wr_comment, self.write_model.wr_comment_reply)
+        ).all()
+        for comment in comments:
+            comments_by_parent.setdefault(comment.wr_parent, []).append(comment)
+
+        return comments_by_parent
 
-    def get_writes(self, with_files=False, page=1, per_page=None, with_notice=False) -> List[WriteBaseModel]:
-        """게시글 목록을 가져옵니다."""
+    def get_writes(self, with_files=False, page=1, per_page=None, with_notice=False,
+                   cursor: str = None) -> List[WriteBaseModel]:
+        """게시글 목록을 가져옵니다.
+        - cursor가 None이 아니면 커서(keyset) 페이징으로 조회합니다. (빈 문자열은 첫 페이지)
+        - 커서 페이징은 기본 정렬(wr_num, wr_reply)일 때만 사용할 수 있으며,
+          사용할 수 없으면 page 번호로 조회합니다.
+        """
         current_page = page
         if per_page:
             page_rows = per_page        # 페이지당 게시글 수를 별도 설정
@@ -173,21 +205,94 @@ class ListPostService(BoardService):
             notice_ids = self.get_notice_list()
             self.query = self.query.where(self.write_model.wr_id.notin_(notice_ids))
 
-        # 페이지 번호에 따른 offset 계산
-        offset = (current_page - 1) * page_rows
-        # 최종 쿼리 결과를 가져옵니다.
-        writes = self.db.scalars(
-            self.query.add_columns(self.write_model)
-            .offset(offset).limit(page_rows)
-        ).all()
+        if cursor is not None and self.is_cursor_available():
+            writes, offset = self.get_writes_by_cursor(cursor, page_rows)
+            total_count = self.get_total_count(approximate=True)
+        else:
+            # 페이지 번호에 따른 offset 계산
+            offset = (current_page - 1) * page_rows
+            # 최종 쿼리 결과를 가져옵니다.
+            writes = self.db.scalars(
+                self.query.add_columns(self.write_model)
+                .offset(offset).limit(page_rows)
+            ).all()
+
+            total_count = self.get_total_count()
 
-        total_count = self.get_total_count()
+            # 다음 페이지부터 커서 페이징으로 이어서 조회할 수 있도록 커서를 설정합니다.
+            if (self.is_cursor_available()
+                    and len(writes) == page_rows
+                    and offset + page_rows < total_count):
+                self.next_cursor = encode_list_cursor(writes[-1], offset + page_rows)
 
         # 게시글 부가 정보 추가 (댓글, 좋아요, 썸네일 등)
         self.add_additional_info_to_writes(writes, total_count, offset, with_files)
 
         return writes
 
+    def is_cursor_available(self) -> bool:
+        """커서(keyset) 페이징 사용 가능 여부
+        - 커서는 idx_wr_num_reply 인덱스의 (wr_num, wr_reply) 순서를 기준으로 하므로
+          정렬 필드를 지정하지 않은 경우에만 사용할 수 있습니다.
+        """
+        sst = self.search_params.get('sst')
+        if sst and hasattr(self.write_model, sst):
+            return False
+        return not self.board.bo_sort_field
+
+    def get_writes_by_cursor(self, cursor: str, page_rows: int) -> Tuple[List[WriteBaseModel], int]:
+        """커서 이후(이전)의 게시글 목록을 가져옵니다.
+
+        Args:
+            cursor (str): 커서 문자열. 빈 문자열이면 첫 페이지를 가져옵니다.
+            page_rows (int): 페이지당 게시글 수
+
+        Returns:
+            Tuple[List[WriteBaseModel], int]: 게시글 목록, 첫 게시글의 순번(offset)
+        """
+        model = self.write_model
+        query = self.query.add_columns(model).order_by(None)
+
+        if cursor:
+            try:
+                position = decode_list_cursor(cursor)
+            except ValueError as e:
+                self.raise_exception(detail=str(e), status_code=400)
+            wr_num, wr_reply = position["wr_num"], position["wr_reply"]
+            offset, direction = position["offset"], position["direction"]
+        else:
+            wr_num = wr_reply = None
+            offset, direction = 0, "next"
+
+        if direction == "prev":
+            query = query.where(or_(
+                model.wr_num < wr_num,
+                and_(model.wr_num == wr_num, model.wr_reply < wr_reply)
+            )).order_by(desc(model.wr_num), desc(model.wr_reply))
+            writes = list(reversed(self.db.scalars(query.limit(page_rows + 1)).all()))
+            has_prev = len(writes) > page_rows
+            writes = writes[1:] if has_prev else writes
+            has_next = True
+            offset = max(offset - len(writes), 0)
+        else:
+            if wr_num is not None:
+                query = query.where(or_(
+                    model.wr_num > wr_num,
+                    and_(model.wr_num == wr_num, model.wr_reply > wr_reply)
+                ))
+            query = query.order_by(model.wr_num, model.wr_reply)
+            writes = list(self.db.scalars(query.limit(page_rows + 1)).all())
+            has_next = len(writes) > page_rows
+            writes = writes[:page_rows]
+            has_prev = offset > 0
+
+        if writes and has_next:
+            self.next_cursor = encode_list_cursor(writes[-1], offset + len(writes), "next")
+        if writes and has_prev:
+            self.prev_cursor = encode_list_cursor(writes[0], offset, "prev")
+
+        return writes, offset
+
     def get_notice_writes(self, with_files=False) -> List[WriteBaseModel]:
         """게시글 중 공지사항 목록을 가져옵니다."""
         current_page = self.search_params.get('current_page')
@@ -198,14 +303,22 @@ class ListPostService(BoardService):
             notice_query = select(self.write_model).where(self.write_model.wr_id.in_(notice_ids))
             if sca:
                 notice_query = notice_query.where(self.write_model.ca_name == sca)
-            notice_writes = [get_list(self.request, self.db, write, self) for write in self.db.scalars(notice_query).all()]
+            notice_writes = self.db.scalars(notice_query).all()
 
         # 게시글 부가 정보 추가 (댓글, 좋아요, 썸네일 등)
         self.add_additional_info_to_writes(notice_writes, len(notice_writes), 0, with_files)
 
         return notice_writes
 
-    def get_total_count(self) -> int:
-        """쿼리문을 통해 불러오는 게시글의 수"""
+    def get_total_count(self, approximate: bool = False) -> int:
+        """쿼리문을 통해 불러오는 게시글의 수
+
+        Args:
+            approximate (bool, optional): 검색이 아닌 경우 COUNT 쿼리 대신
+                게시판에 저장된 게시글 수(bo_count_write)를 반환합니다. Defaults to False.
+        """
+        if approximate and not self.is_search:
+            return self.board.bo_count_write
+
         total_count = self.db.scalar(self.query.add_columns(func.count()).order_by(None))
         return total_count
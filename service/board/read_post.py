@@ -1,3 +1,4 @@
+import os
 from typing_extensions import Annotated, List, Tuple
 
 from fastapi import Depends, Request, Path
@@ -335,7 +336,7 @@ class DownloadFileService(BoardService):
     def get_board_file(self) -> BoardFile:
         """파일 정보 조회"""
         board_file = self.file_service.get_board_file(self.bo_table, self.wr_id, self.bf_no)
-        if not board_file:
+        if not board_file or not os.path.isfile(board_file.bf_file):
             self.raise_exception(detail="파일이 존재하지 않습니다.", status_code=404)
         return board_file
 
@@ -9,6 +9,7 @@ from lib.board_lib import generate_reply_character
 from lib.g5_compatibility import G5Compatibility
 from lib.template_filters import number_format
 from lib.html_sanitizer import content_sanitizer
+from lib.search import get_search_backend
 from lib.pbkdf2 import create_hash
 from api.v1.models.board import WriteModel, CommentModel
 from service.point_service import PointService
@@ -59,6 +60,7 @@ class UpdatePostService(BoardService):
         for field, value in data.__dict__.items():
             if value:
                 setattr(write, field, value)
+        get_search_backend().index_write(self.db, self.bo_table, write)
         self.db.commit()
 
 
@@ -168,6 +170,7 @@ class CommentService(UpdatePostService):
         # 게시글에 댓글 수 증가
         write.wr_comment +=  1
 
+        get_search_backend().index_write(self.db, self.bo_table, comment)
         self.db.commit()
         return comment
 
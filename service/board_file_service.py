@@ -1,18 +1,32 @@
 """게시판 파일 관련 기능을 제공하는 서비스 모듈입니다."""
+import asyncio
+import logging
 import os
 import shutil
-from typing import List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
 from fastapi import Request, UploadFile
-from sqlalchemy import exists, func, insert, select
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import and_, bindparam, delete, exists, func, insert, or_, select, update
 
-from core.database import db_session
+from core.database import DBConnect, db_session
 from core.models import Board, BoardFile
+from lib.thumbnail import get_thumbnail_generator
+
+logger = logging.getLogger(__name__)
+
+DOWNLOAD_COUNT_FLUSH_INTERVAL = 10  # 단위: 초
 
 
 class BoardFileService():
     """
     게시판 파일 관련 서비스를 제공하는 종속성 주입 클래스입니다.
     """
+    UPLOAD_CHUNK_SIZE = 1024 * 1024  # 업로드 파일을 나누어 저장하는 단위 (1MB)
+    FILE_TRANSFER_WORKERS = 4  # 파일 복사/이동을 동시에 실행하는 스레드 수
+
     def __init__(self, request: Request, db: db_session):
         self.request = request
         self.config = request.state.config
@@ -58,6 +72,9 @@ class BoardFileService():
         Returns:
             bool: 업로드 파일 사이즈가 설정된 값보다 작으면 True, 크면 False
         """
+        # 크기를 알 수 없는 파일은 저장하면서 검사한다. (upload_file)
+        if file.size is None:
+            return True
         if file.size <= 0:
             return False
 
@@ -108,6 +125,69 @@ class BoardFileService():
             list[BoardFile]: 이미지 목록
         """
         board_files = self.get_board_files(bo_table, wr_id)
+        return self.split_files_by_type(board_files)
+
+    def get_board_files_by_wr_ids(self, bo_table: str, wr_ids: List[int]) -> Dict[int, List[BoardFile]]:
+        """여러 게시글의 업로드된 파일 목록을 한번에 가져온다.
+
+        Args:
+            bo_table (str): 게시판 테이블명
+            wr_ids (List[int]): 게시글 아이디 목록
+
+        Returns:
+            Dict[int, List[BoardFile]]: 게시글 아이디별 파일 목록
+        """
+        files_by_wr_id = {wr_id: [] for wr_id in wr_ids}
+        if not wr_ids:
+            return files_by_wr_id
+
+        board_files = self.db.scalars(
+            select(BoardFile)
+            .where(BoardFile.bo_table == bo_table, BoardFile.wr_id.in_(wr_ids))
+            .order_by(BoardFile.wr_id, BoardFile.bf_no)
+        ).all()
+        for board_file in board_files:
+            files_by_wr_id.setdefault(board_file.wr_id, []).append(board_file)
+
+        return files_by_wr_id
+
+    def get_board_files_by_tables(self, wr_ids_by_table: Dict[str, List[int]]) -> Dict[Tuple[str, int], List[BoardFile]]:
+        """여러 게시판의 업로드된 파일 목록을 한번에 가져온다.
+
+        Args:
+            wr_ids_by_table (Dict[str, List[int]]): 게시판별 게시글 아이디 목록
+
+        Returns:
+            Dict[Tuple[str, int], List[BoardFile]]: (게시판, 게시글 아이디)별 파일 목록
+        """
+        files_by_key = {}
+        conditions = [
+            and_(BoardFile.bo_table == bo_table, BoardFile.wr_id.in_(wr_ids))
+            for bo_table, wr_ids in wr_ids_by_table.items() if wr_ids
+        ]
+        if not conditions:
+            return files_by_key
+
+        board_files = self.db.scalars(
+            select(BoardFile)
+            .where(or_(*conditions))
+            .order_by(BoardFile.bo_table, BoardFile.wr_id, BoardFile.bf_no)
+        ).all()
+        for board_file in board_files:
+            files_by_key.setdefault((board_file.bo_table, board_file.wr_id), []).append(board_file)
+
+        return files_by_key
+
+    def split_files_by_type(self, board_files: List[BoardFile]):
+        """파일 목록을 파일과 이미지로 분리한다.
+
+        Args:
+            board_files (List[BoardFile]): 파일 목록
+
+        Returns:
+            list[BoardFile]: 이미지 목록
+            list[BoardFile]: 파일 목록
+        """
         images = []
         files = []
         for file in board_files:
@@ -162,10 +242,11 @@ class BoardFileService():
                 bf_file=f"{directory}/{filename}",
                 bf_download=0,
                 bf_content=content,
-                bf_filesize=file.size
+                bf_filesize=file.size if file.size is not None else os.path.getsize(f"{directory}/{filename}")
             )
         )
         self.db.commit()
+        self.create_thumbnails(bo_table, f"{directory}/{filename}")
 
     def update_board_file(self, board_file: BoardFile,
                           directory: str, filename: str, file: UploadFile,
@@ -186,45 +267,39 @@ class BoardFileService():
         board_file.bf_file = f"{directory}/{filename}"
         board_file.bf_download = 0
         board_file.bf_content = content
-        board_file.bf_filesize = file.size
+        board_file.bf_filesize = file.size if file.size is not None else os.path.getsize(board_file.bf_file)
         self.db.commit()
+        self.create_thumbnails(board_file.bo_table, board_file.bf_file)
 
-    def update_download_count(self, board_file: BoardFile):
-        """다운로드 횟수를 증가시킨다.
+    def create_thumbnails(self, bo_table: str, path: str):
+        """업로드된 이미지의 게시판 목록 섬네일을 미리 생성한다.
 
         Args:
-            board_file (BoardFile): 게시판 파일 인스턴스
+            bo_table (str): 게시판 테이블명
+            path (str): 업로드 파일 경로
         """
-        board_file.bf_download += 1
-        self.db.commit()
-
-    def move_board_files(self, directory: str,
-                         origin_bo_table: str, origin_wr_id: int,
-                         target_bo_table: str, target_wr_id: int):
-        """게시글의 파일을 이동한다.
+        ext = path.split(".")[-1].lower()
+        if ext not in set(self.config.cf_image_extension.lower().split("|")):
+            return
 
-        Args:
-            target_bo_table (str): 이동할 게시판 테이블명
-            target_wr_id (int): 이동할 게시글 아이디
-        """
-        board_directory = os.path.join(directory, target_bo_table)
-        os.makedirs(board_directory, exist_ok=True)
+        board = self.db.get(Board, bo_table)
+        if not board:
+            return
 
-        board_files = self.get_board_files(origin_bo_table, origin_wr_id)
-        for board_file in board_files:
-            file = self.create_upload_file_from_path(board_file.bf_file)
-            file.filename = board_file.bf_source
-            file.size = board_file.bf_filesize
-            filename = self.get_filename(file.filename)
+        sizes = [
+            (board.bo_gallery_width or 200, board.bo_gallery_height or 150),
+            (board.bo_mobile_gallery_width or 200, board.bo_mobile_gallery_height or 150),
+        ]
+        get_thumbnail_generator().pregenerate(path, sizes)
 
-            # 파일 이동 및 정보 업데이트
-            self.move_file(board_file.bf_file, f"{directory}/{filename}")
-            self.update_board_file(board_file, directory, filename, file,
-                                   board_file.bf_content, target_bo_table, target_wr_id)
-            board_file.bo_table = target_bo_table
-            board_file.wr_id = target_wr_id
+    def update_download_count(self, board_file: BoardFile):
+        """다운로드 횟수를 증가시킨다.
+        - 증가분은 DownloadCounter에 모아서 일정 주기로 반영한다.
 
-        self.db.commit()
+        Args:
+            board_file (BoardFile): 게시판 파일 인스턴스
+        """
+        DownloadCounter.increase(board_file.bo_table, board_file.wr_id, board_file.bf_no)
 
     def copy_board_files(self, directory: str,
                          origin_bo_table: str, origin_wr_id: int,
@@ -247,12 +322,97 @@ class BoardFileService():
             self.insert_board_file(target_bo_table, target_wr_id, board_file.bf_no,
                                    board_directory, filename, file, board_file.bf_content)
 
+    def transfer_board_files(self, directory: str,
+                             origin_bo_table: str, target_bo_table: str,
+                             wr_id_map: Dict[int, int], is_move: bool = False) -> Tuple[List[str], List[str]]:
+        """여러 게시글의 파일을 한번에 복사/이동한다.
+        - 파일 복사는 스레드풀에서 동시에 실행하고, 파일 정보는 한번에 추가/수정한다.
+        - 이동할 때도 파일을 먼저 복사하고, 원본 파일은 커밋한 뒤 호출하는 쪽에서 삭제한다.
+          (롤백하면 복사한 파일만 삭제하면 되므로 원본 파일은 그대로 남는다.)
+        - 커밋은 호출하는 쪽에서 한다.
+
+        Args:
+            directory (str): 파일 저장 경로
+            origin_bo_table (str): 원본 게시판 테이블명
+            target_bo_table (str): 대상 게시판 테이블명
+            wr_id_map (Dict[int, int]): 원본 게시글 아이디 => 대상 게시글 아이디
+            is_move (bool, optional): 이동 여부. Defaults to False.
+
+        Returns:
+            Tuple[List[str], List[str]]: (새로 만든 파일 경로 목록 - 롤백 시 삭제,
+                                          이동한 원본 파일 경로 목록 - 커밋 후 삭제)
+        """
+        board_files = self.db.scalars(
+            select(BoardFile)
+            .where(BoardFile.bo_table == origin_bo_table, BoardFile.wr_id.in_(list(wr_id_map)))
+        ).all()
+        if not board_files:
+            return [], []
+
+        board_directory = os.path.join(directory, target_bo_table)
+        os.makedirs(board_directory, exist_ok=True)
+        # 같은 게시판으로 이동하는 경우에도 원본 파일을 덮어쓰지 않도록 항상 새 파일이름을 만든다.
+        origin_paths = [board_file.bf_file for board_file in board_files]
+        target_paths = [
+            os.path.join(board_directory, self.get_filename(board_file.bf_source))
+            for board_file in board_files
+        ]
+        with ThreadPoolExecutor(max_workers=self.FILE_TRANSFER_WORKERS) as executor:
+            list(executor.map(self.copy_file, origin_paths, target_paths))
+        created_paths = [path for path in target_paths if os.path.exists(path)]
+
+        if is_move:
+            table = BoardFile.__table__
+            self.db.execute(
+                update(table)
+                .where(table.c.bo_table == origin_bo_table,
+                       table.c.wr_id == bindparam("origin_wr_id"),
+                       table.c.bf_no == bindparam("origin_bf_no"))
+                .values(bo_table=target_bo_table,
+                        wr_id=bindparam("target_wr_id"),
+                        bf_file=bindparam("target_bf_file")),
+                [
+                    {"origin_wr_id": board_file.wr_id, "origin_bf_no": board_file.bf_no,
+                     "target_wr_id": wr_id_map[board_file.wr_id], "target_bf_file": target_path}
+                    for board_file, target_path in zip(board_files, target_paths)
+                ]
+            )
+            target_path_set = set(target_paths)
+            return created_paths, [path for path in origin_paths if path not in target_path_set]
+
+        now = datetime.now()
+        self.db.execute(
+            insert(BoardFile),
+            [
+                {
+                    "bo_table": target_bo_table,
+                    "wr_id": wr_id_map[board_file.wr_id],
+                    "bf_no": board_file.bf_no,
+                    "bf_source": board_file.bf_source,
+                    "bf_file": target_path,
+                    "bf_download": 0,
+                    "bf_content": board_file.bf_content,
+                    "bf_fileurl": board_file.bf_fileurl,
+                    "bf_thumburl": board_file.bf_thumburl,
+                    "bf_storage": board_file.bf_storage,
+                    "bf_filesize": board_file.bf_filesize,
+                    "bf_width": board_file.bf_width,
+                    "bf_height": board_file.bf_height,
+                    "bf_type": board_file.bf_type,
+                    "bf_datetime": now,
+                }
+                for board_file, target_path in zip(board_files, target_paths)
+            ]
+        )
+        return created_paths, []
+
     def delete_board_file(self, bo_table: str, wr_id: int, bf_no: int):
         """게시글의 파일을 삭제한다."""
         board_file = self.get_board_file(bo_table, wr_id, bf_no)
         if not board_file:
             return
         self.remove_file(board_file.bf_file)
+        get_thumbnail_generator().delete(board_file.bf_file)
         self.db.delete(board_file)
         self.db.commit()
 
@@ -262,6 +422,7 @@ class BoardFileService():
         for board_file in board_files:
             # 파일 삭제
             self.remove_file(board_file.bf_file)
+            get_thumbnail_generator().delete(board_file.bf_file)
             # 동일한 경로에 있는 파일 중 파일이름으로 끝나는 파일들 삭제
             directory = os.path.dirname(board_file.bf_file)
             filename = os.path.basename(board_file.bf_file)
@@ -272,17 +433,64 @@ class BoardFileService():
             self.db.delete(board_file)
         self.db.commit()
 
-    def upload_file(self, directory: str, filename: str, file: UploadFile):
+    def delete_board_files_by_wr_ids(self, bo_table: str, wr_ids: List[int]) -> List[str]:
+        """여러 게시글의 파일 정보를 한번에 삭제하고, 삭제한 파일 경로 목록을 반환한다.
+        - 파일은 커밋한 뒤 remove_files_in_background()로 삭제한다.
+        - 커밋은 호출하는 쪽에서 한다.
+
+        Args:
+            bo_table (str): 게시판 테이블명
+            wr_ids (List[int]): 게시글 아이디 목록
+
+        Returns:
+            List[str]: 삭제할 파일 경로 목록
+        """
+        if not wr_ids:
+            return []
+
+        condition = and_(BoardFile.bo_table == bo_table, BoardFile.wr_id.in_(wr_ids))
+        paths = self.db.scalars(select(BoardFile.bf_file).where(condition)).all()
+        if paths:
+            self.db.execute(delete(BoardFile).where(condition))
+        return [path for path in paths if path]
+
+    def upload_file(self, directory: str, filename: str, file: UploadFile, max_size: int = 0) -> bool:
         """파일을 업로드한다.
+        - UPLOAD_CHUNK_SIZE 단위로 나누어 저장하며, max_size를 넘으면 바로 저장을 중단한다.
+        - 임시 파일에 저장한 뒤 이름을 바꾸므로 저장 중인 파일이 노출되지 않는다.
 
         Args:
             directory (str): 파일 저장 경로
             filename (str): 파일이름
             file (UploadFile): 업로드 파일
+            max_size (int, optional): 최대 파일 크기(byte). 0이면 제한하지 않는다.
+
+        Returns:
+            bool: 저장했으면 True, 파일이 없거나 최대 크기를 넘었으면 False
         """
-        if file and file.filename:
-            with open(f"{directory}/{filename}", "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+        if not (file and file.filename):
+            return False
+
+        path = f"{directory}/{filename}"
+        temp_path = f"{path}.part"
+        size = 0
+        is_saved = False
+        try:
+            file.file.seek(0)
+            with open(temp_path, "wb") as buffer:
+                while chunk := file.file.read(self.UPLOAD_CHUNK_SIZE):
+                    size += len(chunk)
+                    if max_size and size > max_size:
+                        break
+                    buffer.write(chunk)
+                else:
+                    is_saved = True
+            if is_saved:
+                os.replace(temp_path, path)
+        finally:
+            self.remove_file(temp_path)
+
+        return is_saved
 
     def move_file(self, origin: str, target: str):
         """파일을 이동한다.
@@ -325,3 +533,96 @@ class BoardFileService():
         if os.path.exists(path):
             with open(path, "rb") as f:
                 return UploadFile(f, filename=os.path.basename(path))
+
+
+_file_remove_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="file-remove")
+
+
+def remove_files_in_background(paths: Iterable[str]) -> None:
+    """게시글 파일과 섬네일을 백그라운드 스레드에서 삭제하는 함수
+
+    Args:
+        paths (Iterable[str]): 삭제할 파일 경로 목록
+    """
+    paths = list(paths)
+    if paths:
+        _file_remove_executor.submit(_remove_files, paths)
+
+
+def _remove_files(paths: List[str]) -> None:
+    """파일과 섬네일을 삭제한다. (백그라운드 스레드에서 실행)"""
+    generator = get_thumbnail_generator()
+    basenames_by_directory: Dict[str, set] = {}
+    for path in paths:
+        try:
+            if os.path.exists(path):
+                os.remove(path)
+            generator.delete(path)
+        except OSError as e:
+            logger.warning(f"파일을 삭제하지 못했습니다 ({path}) : {e}")
+        basenames_by_directory.setdefault(os.path.dirname(path), set()).add(os.path.basename(path))
+
+    # 동일한 경로에 있는 섬네일 중 매니페스트에 기록되지 않은 파일 삭제 (thumbnail_{w}x{h}_{파일이름})
+    for directory, basenames in basenames_by_directory.items():
+        try:
+            entries = os.listdir(directory)
+        except OSError:
+            continue
+        for entry in entries:
+            if entry.startswith("thumbnail_") and entry.split("_", 2)[-1] in basenames:
+                try:
+                    os.remove(os.path.join(directory, entry))
+                except OSError:
+                    pass
+
+
+class DownloadCounter:
+    """
+    파일 다운로드 횟수 증가분을 모아서 반영하는 프로세스 단위 버퍼 클래스입니다.
+    - 다운로드 시에는 메모리의 증가분만 더하고, 일정 주기로 bf_download = bf_download + n 으로 반영합니다.
+    """
+    pending: Dict[Tuple[str, int, int], int] = {}
+    lock = threading.Lock()
+
+    @classmethod
+    def increase(cls, bo_table: str, wr_id: int, bf_no: int, count: int = 1) -> None:
+        """다운로드 횟수 증가분을 버퍼에 더합니다."""
+        key = (bo_table, wr_id, bf_no)
+        with cls.lock:
+            cls.pending[key] = cls.pending.get(key, 0) + count
+
+    @classmethod
+    def flush(cls) -> None:
+        """버퍼에 모인 다운로드 횟수를 파일 테이블에 반영합니다."""
+        with cls.lock:
+            pending, cls.pending = cls.pending, {}
+        if not pending:
+            return
+
+        with DBConnect().sessionLocal() as db:
+            try:
+                for (bo_table, wr_id, bf_no), count in pending.items():
+                    db.execute(
+                        update(BoardFile)
+                        .where(BoardFile.bo_table == bo_table,
+                               BoardFile.wr_id == wr_id,
+                               BoardFile.bf_no == bf_no)
+                        .values(bf_download=BoardFile.bf_download + count)
+                    )
+                db.commit()
+            except Exception:
+                db.rollback()
+                # 반영에 실패한 증가분은 다음 주기에 다시 반영
+                for key, count in pending.items():
+                    cls.increase(*key, count)
+                raise
+
+
+async def run_download_counter() -> None:
+    """DOWNLOAD_COUNT_FLUSH_INTERVAL 주기로 다운로드 횟수를 반영하는 백그라운드 작업"""
+    while True:
+        await asyncio.sleep(DOWNLOAD_COUNT_FLUSH_INTERVAL)
+        try:
+            await run_in_threadpool(DownloadCounter.flush)
+        except Exception as e:
+            logger.error(f"다운로드 횟수 반영 중 오류가 발생했습니다: {e}")
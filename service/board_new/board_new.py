@@ -1,15 +1,16 @@
 from datetime import datetime
-from typing_extensions import Annotated, List
+from typing_extensions import Annotated, Dict, List, Tuple
 from fastapi import Depends, Request, HTTPException
-from sqlalchemy import func, select, Select
+from sqlalchemy import Row, delete, func, literal, select, Select, union_all
+from sqlalchemy.orm import selectinload
 
 from core.models import Board, BoardNew
 from core.database import db_session
 from core.exception import AlertException
-from lib.common import dynamic_create_write_table, cut_name, FileCache
+from lib.common import dynamic_create_write_table, cut_name
 from lib.board_lib import BoardConfig, get_list, get_list_thumbnail
 from service import BaseService
-from service.ajax.ajax import AJAXService
+from service.board.delete_post import BulkDeleteService
 from service.board_file_service import BoardFileService
 from service.point_service import PointService
 from api.v1.service.member import MemberImageServiceAPI
@@ -19,6 +20,10 @@ class BoardNewService(BaseService):
     """
     최신 게시글 관리 클래스(최신 게시글 목록 조회 및 삭제 등)
     """
+    UNION_CHUNK_SIZE = 100
+    # 최신글 목록에 필요한 게시글 컬럼
+    WRITE_COLUMNS = ("wr_id", "wr_is_comment", "wr_subject", "wr_content", "wr_name", "wr_datetime")
+
     def __init__(
         self,
         request: Request,
@@ -82,7 +87,11 @@ class BoardNewService(BaseService):
     def get_board_news(self, query: Select, offset: int, per_page: int = None) -> List[BoardNew]:
         """최신글 목록 조회"""
         per_page = per_page or self.page_rows
-        board_news = self.db.scalars(query.add_columns(BoardNew).offset(offset).limit(per_page)).all()
+        board_news = self.db.scalars(
+            query.add_columns(BoardNew)
+            .options(selectinload(BoardNew.board).selectinload(Board.group))
+            .offset(offset).limit(per_page)
+        ).all()
         return board_news
 
     def get_total_count(self, query: Select) -> int:
@@ -92,11 +101,11 @@ class BoardNewService(BaseService):
 
     def arrange_borad_news_data(self, board_news: List[BoardNew], total_count: int, offset: int):
         """최신글 결과 데이터 설정"""
-        for new in board_news:
-            new.num = total_count - offset - (board_news.index((new)))
+        writes = self.get_writes_by_board_news(board_news)
+        for index, new in enumerate(board_news):
+            new.num = total_count - offset - index
             # 게시글 정보 조회
-            write_model = dynamic_create_write_table(new.bo_table)
-            write = self.db.get(write_model, new.wr_id)
+            write = writes.get((new.bo_table, new.wr_id))
             if write:
                 # 댓글/게시글 구분
                 if write.wr_is_comment:
@@ -111,24 +120,56 @@ class BoardNewService(BaseService):
                 # 시간설정
                 new.datetime = self.format_datetime(write.wr_datetime)
 
+    def get_writes_by_board_news(self, board_news: List[BoardNew]) -> Dict[Tuple[str, int], Row]:
+        """최신글 목록의 게시글을 한번에 조회
+        - 게시판별 IN 조회를 UNION ALL로 묶어서 실행합니다.
+
+        Returns:
+            Dict[Tuple[str, int], Row]: (게시판, 게시글 아이디)별 게시글
+        """
+        wr_ids_by_table = {}
+        for new in board_news:
+            wr_ids_by_table.setdefault(new.bo_table, set()).add(new.wr_id)
+
+        queries = []
+        for bo_table, wr_ids in wr_ids_by_table.items():
+            write_model = dynamic_create_write_table(bo_table)
+            queries.append(
+                select(literal(bo_table).label("bo_table"),
+                       *[getattr(write_model, column) for column in self.WRITE_COLUMNS])
+                .where(write_model.wr_id.in_(wr_ids))
+            )
+
+        writes = {}
+        for i in range(0, len(queries), self.UNION_CHUNK_SIZE):
+            chunk = queries[i:i + self.UNION_CHUNK_SIZE]
+            query = chunk[0] if len(chunk) == 1 else union_all(*chunk)
+            for row in self.db.execute(query):
+                writes[(row.bo_table, row.wr_id)] = row
+        return writes
+
     def get_latest_posts(
         self,
         bo_table_list: List[str], view_type: str = "write",
         rows: int = 10, subject_len: int = 40
     ):
-        """최신글 목록 출력"""
+        """최신글 목록 출력
+        - 게시판 정보, 첨부파일은 모든 게시판을 한번에 조회합니다.
+        """
         request = self.request
         db = self.db
-        boards_info = dict()
+        boards = {
+            board.bo_table: board
+            for board in db.scalars(select(Board).where(Board.bo_table.in_(bo_table_list)))
+        }
+
+        writes_by_table = {}
         for bo_table in bo_table_list:
-            board = db.get(Board, bo_table)
-            board_config = BoardConfig(request, board)
+            board = boards.get(bo_table)
             if not board:
                 self.raise_exception(
                     status_code=400, detail=f"{bo_table} 게시판 정보가 없습니다."
                 )
-            board_config = BoardConfig(request, board)
-            board.subject = board_config.subject
 
             #게시글 목록 조회
             write_model = dynamic_create_write_table(bo_table)
@@ -137,65 +178,63 @@ class BoardNewService(BaseService):
                 query = query.where(write_model.wr_is_comment == 1)
             else:
                 query = query.where(write_model.wr_is_comment == 0)
-            writes = db.scalars(query).all()
+            writes_by_table[bo_table] = db.scalars(query).all()
+
+        wr_ids_by_table = {
+            bo_table: [write.wr_id for write in writes]
+            for bo_table, writes in writes_by_table.items()
+        }
+        files_by_key = self.file_service.get_board_files_by_tables(wr_ids_by_table)
+
+        boards_info = dict()
+        for bo_table, writes in writes_by_table.items():
+            board = boards[bo_table]
+            board_config = BoardConfig(request, board)
+            board.subject = board_config.subject
 
             for write in writes:
-                write = get_list(request, db, write, board_config, subject_len)
-                # 첨부파일 정보 조회
-                write.images, write.normal_files = self.file_service.get_board_files_by_type(bo_table, write.wr_id)
+                key = (bo_table, write.wr_id)
+                board_files = files_by_key.get(key, [])
+                write = get_list(request, db, write, board_config, subject_len, icon_file=bool(board_files))
+                # 첨부파일 정보 설정
+                write.images, write.normal_files = self.file_service.split_files_by_type(board_files)
                 # 썸네일 이미지 설정
-                write.thumbnail = get_list_thumbnail(request, board, write, board_config.gallery_width, board_config.gallery_height)
+                write.thumbnail = get_list_thumbnail(request, board, write, board_config.gallery_width,
+                                                     board_config.gallery_height, images=write.images)
 
                 # 회원 이미지, 아이콘 경로 설정
                 write.mb_image_path = MemberImageServiceAPI.get_image_path(write.mb_id)
                 write.mb_icon_path = MemberImageServiceAPI.get_icon_path(write.mb_id)
 
                 # 게시글 좋아요/싫어요 정보 설정
-                ajax_good_data = AJAXService(self.request, self.db).get_ajax_good_data(bo_table, write)
-                write.good = ajax_good_data["good"]
-                write.nogood = ajax_good_data["nogood"]
+                write.good = write.wr_good
+                write.nogood = write.wr_nogood
 
             boards_info[bo_table] = writes
 
         return boards_info
 
     def delete_board_news(self, bn_ids: list):
-        """최신글 삭제"""
+        """최신글 삭제
+        - 게시판별로 게시글/댓글을 한번에 삭제한다. (BulkDeleteService)
+        """
         # 새글 정보 조회
-        board_news = self.db.scalars(select(BoardNew).where(BoardNew.bn_id.in_(bn_ids))).all()
+        board_news = self.db.execute(
+            select(BoardNew.bo_table, BoardNew.wr_id).where(BoardNew.bn_id.in_(bn_ids))
+        ).all()
+        wr_ids_by_table: Dict[str, List[int]] = {}
         for new in board_news:
-            board = self.db.get(Board, new.bo_table)
-            write_model = dynamic_create_write_table(new.bo_table)
-            write = self.db.get(write_model, new.wr_id)
-            if write:
-                if write.wr_is_comment == 0:
-                    # 게시글 삭제
-                    # TODO: 게시글 삭제 공용함수 추가
-                    self.db.delete(write)
-
-                    # 원글 포인트 삭제
-                    if not self.point_service.delete_point(write.mb_id, board.bo_table, write.wr_id, "쓰기"):
-                        self.point_service.save_point(write.mb_id, board.bo_write_point * (-1),
-                                                      f"{board.bo_subject} {write.wr_id} 글 삭제")
-                else:
-                    # 댓글 삭제
-                    # TODO: 댓글 삭제 공용함수 추가
-                    self.db.delete(write)
-
-                    # 댓글 포인트 삭제
-                    if not self.point_service.delete_point(write.mb_id, board.bo_table, write.wr_id, "댓글"):
-                        self.point_service.save_point(write.mb_id, board.bo_comment_point * (-1),
-                                                      f"{board.bo_subject} {write.wr_parent}-{write.wr_id} 댓글 삭제")
-                # 파일 삭제
-                self.file_service.delete_board_files(board.bo_table, write.wr_id)
-
-            # 최신글 삭제
-            self.db.delete(new)
+            wr_ids_by_table.setdefault(new.bo_table, []).append(new.wr_id)
 
-            # 최신글 캐시 삭제
-            FileCache().delete_prefix(f'latest-{new.bo_table}')
+        deleter = BulkDeleteService(self.request, self.db, self.file_service, self.point_service)
+        if wr_ids_by_table:
+            boards = self.db.scalars(select(Board).where(Board.bo_table.in_(list(wr_ids_by_table)))).all()
+            for board in boards:
+                deleter.delete_writes(board, wr_ids_by_table[board.bo_table])
 
-        self.db.commit()
+        # 게시글이 없는 최신글 삭제
+        self.db.execute(delete(BoardNew).where(BoardNew.bn_id.in_(bn_ids)))
+        deleter.commit()
 
 
 class BoardNewServiceAPI(BoardNewService):
@@ -1,17 +1,24 @@
 """현재 접속자 관련 기능을 제공하는 서비스 모듈입니다."""
+import asyncio
+import logging
+import threading
 from datetime import datetime, timedelta
-from typing import Any
+from typing import Any, Dict, NamedTuple, Optional
 
-from cachetools import LRUCache, cached
-from cachetools.keys import hashkey
 from fastapi import Request
-from sqlalchemy import Row, Select, Sequence, delete, func, insert, select
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Row, Select, Sequence, bindparam, delete, func, insert, select, update
+from sqlalchemy.orm import Session
 
-from core.database import db_session
+from core.database import DBConnect, db_session
 from core.exception import AlertException
 from core.models import Login, Member
 from service import BaseService
 
+logger = logging.getLogger(__name__)
+
+CURRENT_CONNECT_FLUSH_INTERVAL = 5  # 단위: 초
+
 
 class CurrentConnectService(BaseService):
     """
@@ -22,16 +29,20 @@ class CurrentConnectService(BaseService):
         self.request = request
         self.db = db
         self.admin = getattr(request.state.config, "cf_admin", "admin")
-        login_minute = getattr(request.state.config, "cf_login_minutes", 10)
-        self.base_date = datetime.now() - timedelta(minutes=login_minute)
+        self.login_minutes = getattr(request.state.config, "cf_login_minutes", 10)
+        self.base_date = datetime.now() - timedelta(minutes=self.login_minutes)
 
     def raise_exception(self, status_code: int, detail: str = None, url: str = None):
         return AlertException(status_code=status_code, detail=detail, url=url)
 
-    @cached(LRUCache(maxsize=1),
-            key=lambda self, only_member=False: hashkey("connects_count", only_member))
     def fetch_total_records(self, only_member: bool = False) -> int:
-        """현재 접속중인 회원의 총 수를 반환합니다."""
+        """현재 접속중인 회원의 총 수를 반환합니다.
+        - 접속자 추적기가 실행 중이면 주기마다 집계한 접속자 수를 반환합니다.
+        """
+        count = CurrentConnectTracker.get_count(only_member)
+        if count is not None:
+            return count
+
         query = self._base_query(only_member)
 
         return self.db.scalar(query.add_columns(func.count(Login.mb_id)))
@@ -48,46 +59,9 @@ class CurrentConnectService(BaseService):
             .offset(offset).limit(per_page)
         ).all()
 
-    def fetch_current_connect(self, ip: str) -> Login:
-        """특정 IP의 현재 접속자 정보를 반환합니다."""
-        return self.db.scalar(select(Login).where(Login.lo_ip == ip))
-
-    def create_current_connect(self, ip: str,
-                               path: str, mb_id: str = "") -> None:
-        """현재 접속자 정보를 생성합니다."""
-        self.db.execute(
-            insert(Login).values(
-                lo_ip=ip,
-                mb_id=mb_id,
-                lo_location=path,
-                lo_url=path
-            )
-        )
-        self.db.commit()
-
-        # 캐시 초기화
-        self.fetch_total_records.cache_clear()
-
-    def update_current_connect(self, login: Login,
-                               path: str, mb_id: str = "") -> None:
-        """현재 접속자 정보를 갱신합니다."""
-        login.mb_id = mb_id
-        login.lo_datetime = datetime.now()
-        login.lo_location = path
-        login.lo_url = path
-
-        self.db.commit()
-
-    def delete_current_connect(self) -> None:
-        """설정 시간 이전의 현재 접속자 정보를 삭제합니다."""
-        result = self.db.execute(
-            delete(Login).where(Login.lo_datetime < self.base_date)
-        )
-        self.db.commit()
-
-        # 캐시 초기화
-        if result.rowcount:
-            self.fetch_total_records.cache_clear()
+    def track_current_connect(self, ip: str, path: str, mb_id: str = "") -> None:
+        """현재 접속자 정보를 접속자 추적기에 기록합니다. (테이블 반영은 주기적으로 처리)"""
+        CurrentConnectTracker.track(ip, path, mb_id, self.login_minutes, self.admin)
 
     def _base_query(self, only_member: bool = False) -> Select:
         """기본 쿼리를 반환합니다."""
@@ -101,3 +75,122 @@ class CurrentConnectService(BaseService):
             query = query.where(Login.mb_id != "")
 
         return query
+
+
+class ConnectInfo(NamedTuple):
+    """접속자 추적기에 기록되는 접속 정보"""
+    mb_id: str
+    path: str
+    last_seen: datetime
+
+
+class CurrentConnectTracker:
+    """
+    현재 접속자 정보를 모아서 반영하는 프로세스 단위 추적기 클래스입니다.
+    - 요청 처리 중에는 메모리의 접속 정보(IP => 회원아이디, 경로, 마지막 접속시간)만 갱신하고,
+      같은 IP의 접속은 마지막 정보만 남깁니다.
+    - 일정 주기로 접속자 테이블(Login)에 한번에 반영하고(UPDATE/INSERT), 만료된 접속자 삭제와
+      접속자 수 집계도 주기마다 한번만 실행합니다.
+    - 접속자 수는 다른 worker의 접속자를 포함하도록 반영이 끝난 테이블에서 집계합니다.
+    """
+    pending: Dict[str, ConnectInfo] = {}
+    lock = threading.Lock()
+    login_minutes: int = 10
+    admin: str = "admin"
+    # 회원만 집계 여부 => 접속자 수 (추적기가 실행 중일 때만 사용)
+    counts: Dict[bool, int] = {}
+    is_running = False
+
+    @classmethod
+    def track(cls, ip: str, path: str, mb_id: str, login_minutes: int, admin: str) -> None:
+        """접속 정보를 갱신합니다."""
+        with cls.lock:
+            cls.pending[ip] = ConnectInfo(mb_id, path, datetime.now())
+            cls.login_minutes = login_minutes
+            cls.admin = admin
+
+    @classmethod
+    def get_count(cls, only_member: bool = False) -> Optional[int]:
+        """주기마다 집계한 접속자 수를 반환합니다. 추적기가 실행 중이 아니면 None을 반환합니다."""
+        if not cls.is_running:
+            return None
+        return cls.counts.get(only_member)
+
+    @classmethod
+    def flush(cls) -> None:
+        """모인 접속 정보를 접속자 테이블에 반영하고, 만료된 접속자를 삭제한 뒤 접속자 수를 집계합니다."""
+        with cls.lock:
+            pending, cls.pending = cls.pending, {}
+
+        with DBConnect().sessionLocal() as db:
+            try:
+                if pending:
+                    cls._upsert_logins(db, pending)
+                base_date = datetime.now() - timedelta(minutes=cls.login_minutes)
+                db.execute(delete(Login).where(Login.lo_datetime < base_date))
+                db.commit()
+            except Exception:
+                db.rollback()
+                # 반영에 실패한 접속 정보는 더 최근 정보가 없을 때만 다시 반영
+                with cls.lock:
+                    for ip, info in pending.items():
+                        cls.pending.setdefault(ip, info)
+                raise
+
+            cls.counts = {
+                only_member: cls._count_logins(db, base_date, only_member)
+                for only_member in (False, True)
+            }
+
+    @staticmethod
+    def _upsert_logins(db: Session, pending: Dict[str, ConnectInfo]) -> None:
+        """이미 있는 IP는 한번에 수정하고, 없는 IP는 한번에 추가합니다."""
+        exist_ips = set(db.scalars(select(Login.lo_ip).where(Login.lo_ip.in_(list(pending)))).all())
+
+        table = Login.__table__
+        update_rows = [
+            {"target_ip": ip, "mb_id": info.mb_id, "lo_datetime": info.last_seen,
+             "lo_location": info.path, "lo_url": info.path}
+            for ip, info in pending.items() if ip in exist_ips
+        ]
+        if update_rows:
+            db.execute(
+                update(table)
+                .where(table.c.lo_ip == bindparam("target_ip"))
+                .values(mb_id=bindparam("mb_id"), lo_datetime=bindparam("lo_datetime"),
+                        lo_location=bindparam("lo_location"), lo_url=bindparam("lo_url")),
+                update_rows
+            )
+
+        insert_rows = [
+            {"lo_ip": ip, "mb_id": info.mb_id, "lo_datetime": info.last_seen,
+             "lo_location": info.path, "lo_url": info.path}
+            for ip, info in pending.items() if ip not in exist_ips
+        ]
+        if insert_rows:
+            db.execute(insert(Login), insert_rows)
+
+    @classmethod
+    def _count_logins(cls, db: Session, base_date: datetime, only_member: bool) -> int:
+        query = select(func.count(Login.mb_id)).where(
+            Login.mb_id != cls.admin,
+            Login.lo_ip != "",
+            Login.lo_datetime > base_date
+        )
+        if only_member:
+            query = query.where(Login.mb_id != "")
+        return db.scalar(query) or 0
+
+
+async def run_current_connect_tracker() -> None:
+    """CURRENT_CONNECT_FLUSH_INTERVAL 주기로 현재 접속자 정보를 반영하는 백그라운드 작업"""
+    CurrentConnectTracker.is_running = True
+    try:
+        while True:
+            await asyncio.sleep(CURRENT_CONNECT_FLUSH_INTERVAL)
+            try:
+                await run_in_threadpool(CurrentConnectTracker.flush)
+            except Exception as e:
+                logger.error(f"현재 접속자 정보 반영 중 오류가 발생했습니다: {e}")
+    finally:
+        CurrentConnectTracker.is_running = False
@@ -3,11 +3,14 @@ import hashlib
 import os
 import re
 import secrets
+import threading
+import time
 from datetime import date, datetime, timedelta
 from glob import glob
 from typing import Optional, Tuple
 from typing_extensions import Annotated
 
+from cachetools import LRUCache
 from fastapi import Depends, Request, UploadFile
 from PIL import Image, UnidentifiedImageError
 from sqlalchemy import select, update
@@ -15,8 +18,11 @@ from sqlalchemy import select, update
 from core.database import db_session
 from core.exception import AlertException, JSONException
 from core.models import Member
-from lib.common import filter_words, get_client_ip, is_none_datetime, check_prohibit_words
+from lib.common import (
+    VersionStamp, filter_words, get_client_ip, is_none_datetime, check_prohibit_words
+)
 from lib.member import get_next_open_date, hide_member_id
+from lib.member_auth_cache import invalidate_member_auth
 from lib.pbkdf2 import validate_password
 from service import BaseService
 
@@ -174,6 +180,7 @@ class MemberService(BaseService):
             if hasattr(member, key) and value is not None:
                 setattr(member, key, value)
         self.db.commit()
+        invalidate_member_auth(member.mb_id)
 
         return member
 
@@ -194,6 +201,7 @@ class MemberService(BaseService):
         member.mb_leave_date = datetime.now().strftime("%Y%m%d")
         member.mb_memo = f"{member.mb_memo}\n{datetime.now().strftime('%Y-%m-%d')}탈퇴함"
         self.db.commit()
+        invalidate_member_auth(member.mb_id)
 
     def find_id(self, mb_name: str, mb_email: str) -> Member:
         """
@@ -305,6 +313,94 @@ class MemberService(BaseService):
         return self.db.scalar(query)
 
 
+class MemberImageIndex():
+    """회원 아이콘/이미지 파일 색인
+    - (이미지 경로, 회원아이디) => (파일 경로, 수정시간) 또는 None(이미지 없음)을 저장한다.
+    - 처음 조회할 때 파일시스템을 확인하고, 이후에는 메모리에서 바로 반환한다.
+    - 업로드/삭제 시 색인을 갱신하고 VersionStamp를 갱신하여 다른 worker의 색인을 비운다.
+      버전 확인은 VERSION_CHECK_INTERVAL 간격으로만 하므로 조회마다 파일시스템을 확인하지 않는다.
+    """
+    MAX_SIZE = 10000
+    VERSION_CHECK_INTERVAL = 1  # 단위: 초
+
+    _images = LRUCache(maxsize=MAX_SIZE)
+    _lock = threading.Lock()
+    _stamp = VersionStamp("member-image")
+    _version = None
+    _checked_at = 0.0
+
+    @classmethod
+    def get(cls, directory: str, mb_id: str) -> Optional[Tuple[str, float]]:
+        """회원 이미지 파일 경로와 수정시간을 반환한다.
+
+        Args:
+            directory (str): 이미지 경로
+            mb_id (str): 회원아이디
+
+        Returns:
+            Optional[Tuple[str, float]]: (파일 경로, 수정시간), 이미지가 없으면 None
+        """
+        cls._check_version()
+        key = (directory, mb_id)
+        with cls._lock:
+            if key in cls._images:
+                return cls._images[key]
+
+        image = cls._find_image(directory, mb_id)
+        with cls._lock:
+            cls._images[key] = image
+        return image
+
+    @classmethod
+    def update(cls, directory: str, mb_id: str, image: Optional[Tuple[str, float]]) -> None:
+        """업로드/삭제된 회원 이미지를 색인에 반영한다.
+
+        Args:
+            directory (str): 이미지 경로
+            mb_id (str): 회원아이디
+            image (Optional[Tuple[str, float]]): (파일 경로, 수정시간), 삭제된 경우 None
+        """
+        version = cls._stamp.bump()
+        with cls._lock:
+            # 마지막 확인 이후 다른 worker가 변경한 이미지가 있을 수 있으므로
+            # 새 버전을 반영할 때는 색인을 비운다.
+            cls._images.clear()
+            cls._images[(directory, mb_id)] = image
+            cls._version = version
+
+    @classmethod
+    def clear(cls) -> None:
+        """색인을 비운다."""
+        with cls._lock:
+            cls._images.clear()
+
+    @classmethod
+    def _check_version(cls) -> None:
+        """다른 worker에서 이미지가 변경되었으면 색인을 비운다."""
+        now = time.monotonic()
+        if now - cls._checked_at < cls.VERSION_CHECK_INTERVAL:
+            return
+
+        cls._checked_at = now
+        version = cls._stamp.current()
+        if version != cls._version:
+            with cls._lock:
+                cls._images.clear()
+                cls._version = version
+
+    @staticmethod
+    def _find_image(directory: str, mb_id: str) -> Optional[Tuple[str, float]]:
+        """파일시스템에서 회원 이미지 파일을 찾는다."""
+        member_directory = os.path.join(directory, mb_id[:2])
+        image_files = glob(os.path.join(member_directory, f"{mb_id}.*"))
+        if image_files:
+            try:
+                return image_files[0], os.path.getmtime(image_files[0])
+            except OSError:
+                return None
+        return None
+
+
 class MemberImageService(BaseService):
     """
     회원 이미지 관련 서비스를 제공하는 종속성 주입 클래스입니다.
@@ -349,6 +445,7 @@ class MemberImageService(BaseService):
     def _get_image_path(directory: str, mb_id: str = None) -> str:
         """이미지 경로를 반환하는 함수
         - 회원 아이콘/이미지는 아이디의 앞 2자리 디렉토리에 저장됩니다.
+        - 조회 결과는 MemberImageIndex에 저장하므로 같은 회원은 파일시스템을 다시 조회하지 않습니다.
 
         Args:
             directory (str): 이미지 경로
@@ -360,11 +457,10 @@ class MemberImageService(BaseService):
         if not mb_id:
             return MemberImageService.NO_IMAGE_PATH
 
-        member_directory = os.path.join(directory, mb_id[:2])
-        image_files = glob(os.path.join(member_directory, f"{mb_id}.*"))
-        if image_files:
-            mtime = os.path.getmtime(image_files[0])  # 캐시를 위해 파일 수정시간을 추가
-            return f"/{image_files[0]}?{int(mtime)}"
+        image = MemberImageIndex.get(directory, mb_id)
+        if image:
+            path, mtime = image  # 캐시를 위해 파일 수정시간을 추가
+            return f"/{path}?{int(mtime)}"
 
         return MemberImageService.NO_IMAGE_PATH
 
@@ -390,6 +486,7 @@ class MemberImageService(BaseService):
 
         if is_delete or image_obj:
             self._delete_existing_images(image_directory, mb_id)
+            MemberImageIndex.update(directory, mb_id, None)
 
         if image_obj:
             # 이미지 저장 경로 생성
@@ -400,6 +497,7 @@ class MemberImageService(BaseService):
 
             image_obj.save(save_path)
             image_obj.close()
+            MemberImageIndex.update(directory, mb_id, (save_path, os.path.getmtime(save_path)))
 
     def _delete_existing_images(self, directory: str, mb_id: str):
         """기존 이미지 파일 삭제 처리"""
@@ -419,6 +517,7 @@ class MemberImageService(BaseService):
             # 이미지 저장
             image_obj.save(save_path)
             image_obj.close()
+            MemberImageIndex.update(directory, mb_id, (save_path, os.path.getmtime(save_path)))
 
     def _validate_and_open_image(
             self,
@@ -1,21 +1,51 @@
-"""메뉴 서비스를 제공하는 모듈입니다."""
-from typing import List
-from cachetools import LRUCache, cached
-from cachetools.keys import hashkey
+"""메뉴 서비스를 제공하는 모듈입니다.
+
+사용자페이지의 모든 요청에서 메뉴를 조회하므로, 한번의 쿼리로 조회한 메뉴 트리를
+세션과 분리된 읽기 전용 데이터로 프로세스 메모리에 저장하여 재사용합니다.
+- 관리자에서 메뉴를 변경하면 버전 스탬프를 갱신하여 모든 worker가 다음 요청에서 다시 조회합니다.
+"""
+import threading
+from dataclasses import dataclass
+from typing import Optional, Tuple
 
 from fastapi import Request
-from sqlalchemy import func, select
+from sqlalchemy import select
 
 from core.database import db_session
 from core.exception import AlertException
 from core.models import Menu
+from lib.common import VersionStamp
 from service import BaseService
 
+menu_version = VersionStamp("menu")
+
+
+@dataclass(frozen=True)
+class MenuItem:
+    """세션과 분리된 읽기 전용 메뉴 객체"""
+    me_id: int
+    me_code: str
+    me_name: str
+    me_link: str
+    me_target: str
+    me_order: int
+    me_use: int
+    me_mobile_use: int
+    sub: Tuple["MenuItem", ...] = ()
+
+
+class _MenuCache:
+    """프로세스 단위 메뉴 캐시"""
+    menus: Optional[Tuple[MenuItem, ...]] = None
+    version: int = 0
+    lock = threading.Lock()
+
 
 class MenuService(BaseService):
     """
     메뉴 관련 서비스를 제공하는 종속성 주입 클래스입니다.
     """
+    MENU_COLUMNS = ("me_id", "me_code", "me_name", "me_link", "me_target", "me_order", "me_use", "me_mobile_use")
 
     def __init__(self, request: Request, db: db_session) -> None:
         self.request = request
@@ -24,27 +54,42 @@ class MenuService(BaseService):
     def raise_exception(self, status_code: int = 400, detail: str = None, url: str = None) -> None:
         raise AlertException(detail, status_code, url)
 
-    @cached(LRUCache(maxsize=128), key=lambda _: hashkey("menus"))
-    def fetch_menus(self) -> List[Menu]:
-        """사용자페이지 메뉴 조회 함수"""
-        menus = []
-        # 부모메뉴 조회
-        parent_menus = self.db.scalars(
-            select(Menu)
-            .where(func.char_length(Menu.me_code) == 2)
-            .order_by(Menu.me_order)
+    def fetch_menus(self) -> Tuple[MenuItem, ...]:
+        """사용자페이지 메뉴 조회 함수
+        - 캐시가 없거나 버전이 변경되었으면 다시 조회한다.
+        """
+        version = menu_version.current()
+        if _MenuCache.menus is not None and _MenuCache.version == version:
+            return _MenuCache.menus
+
+        with _MenuCache.lock:
+            _MenuCache.menus = self._build_menu_tree()
+            _MenuCache.version = version
+
+        return _MenuCache.menus
+
+    def _build_menu_tree(self) -> Tuple[MenuItem, ...]:
+        """메뉴 전체를 한번에 조회하여 부모메뉴(코드 2자리) - 자식메뉴(코드 4자리) 트리로 만든다."""
+        rows = self.db.execute(
+            select(*[getattr(Menu, column) for column in self.MENU_COLUMNS])
+            .order_by(Menu.me_order, Menu.me_id)
         ).all()
 
-        for menu in parent_menus:
-            parent_code = menu.me_code
-            # 자식 메뉴 조회
-            child_menus = self.db.scalars(
-                select(Menu).where(
-                    func.char_length(Menu.me_code) == 4,
-                    func.substr(Menu.me_code, 1, 2) == parent_code
-                ).order_by(Menu.me_order)
-            ).all()
-
-            menu.sub = child_menus
-            menus.append(menu)
-        return menus
+        parent_rows = [row for row in rows if len(row.me_code) == 2]
+        child_rows = {}
+        for row in rows:
+            if len(row.me_code) == 4:
+                child_rows.setdefault(row.me_code[:2], []).append(MenuItem(**row._asdict()))
+
+        return tuple(
+            MenuItem(**row._asdict(), sub=tuple(child_rows.get(row.me_code, ())))
+            for row in parent_rows
+        )
+
+
+def invalidate_menu_cache() -> None:
+    """메뉴 캐시를 무효화한다.
+    - 버전 스탬프를 갱신하여 다른 worker의 캐시도 다음 요청에서 갱신되도록 한다.
+    """
+    _MenuCache.menus = None
+    menu_version.bump()
@@ -1,15 +1,15 @@
 """포인트 관련 기능을 제공하는 서비스 모듈입니다."""
 import uuid
-from datetime import datetime, timedelta
-from typing import List
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
 from typing_extensions import Annotated
 
 from fastapi import Depends, Request
-from sqlalchemy import delete, func, select, update
+from sqlalchemy import Row, bindparam, delete, func, insert, select, update
 
-from core.database import db_session
+from core.database import DBConnect, db_session
 from core.exception import AlertException
-from core.models import Member, Point
+from core.models import Board, Config, Member, Point
 from service import BaseService
 from service.member_service import MemberService
 
@@ -69,35 +69,30 @@ class PointService(BaseService):
                    expire: int = 0) -> None:
         """
         포인트를 적립합니다.
+        - 회원 행을 잠근 뒤 회원 포인트(mb_point)에 적립 포인트만큼 더하므로
+          포인트 총합을 다시 계산하지 않습니다.
+        - 포인트를 차감하는 경우 만료일이 빠른 적립 내역부터 사용 처리하며,
+          내역 추가/사용 처리/회원 포인트 갱신은 하나의 트랜잭션으로 커밋합니다.
+        - 만료된 포인트의 소멸은 expire_points()에서 매일 한번에 처리합니다.
         """
         if not self.use_point:  # 포인트 사용여부 체크
             return None
         if point == 0:  # 포인트가 0일 경우
             return None
 
-        member = self.member_service.fetch_member_by_id(mb_id)
-        if not member:  # 회원정보가 없을 경우
+        mb_point = self._lock_member_point(mb_id)
+        if mb_point is None:  # 회원정보가 없을 경우
             return None
 
         if rel_table or rel_id or rel_action:  # 동일한 내용으로 포인트를 적립한 내역 체크
             point_row = self._fetch_point_by_relation(mb_id, rel_table,
                                                       str(rel_id), rel_action)
             if point_row:
+                self.db.commit()  # 회원 행 잠금 해제
                 return None
 
         # 포인트 내역 추가
-        if point > 0:
-            po_expired = 0
-            po_expire_date = datetime.strptime(self.MAX_DATE, '%Y-%m-%d')
-            if self.point_term > 0:
-                expire_days = expire if expire > 0 else self.point_term
-                after_datetime = timedelta(days=expire_days - 1)
-                po_expire_date = (datetime.now() + after_datetime).strftime('%Y-%m-%d')
-        else:
-            po_expired = 1
-            po_expire_date = datetime.now()
-
-        mb_point = self.get_total_point(mb_id)
+        po_expired, po_expire_date = self._get_expire_values(point, expire)
         po_mb_point = mb_point + point
 
         new_point = Point(
@@ -114,8 +109,13 @@ class PointService(BaseService):
         )
         self.db.add(new_point)
 
+        # 차감한 포인트만큼 적립 내역 사용 처리
+        if point < 0:
+            self.insert_use_point(mb_id, point)
+
         # 회원 포인트 갱신
-        self.member_service.update_member_point(mb_id, po_mb_point)
+        self.increase_member_point(mb_id, point)
+        self.db.commit()
 
     def get_config_point(self, cf_name: str) -> int:
         """
@@ -126,26 +126,28 @@ class PointService(BaseService):
     def get_total_point(self, mb_id: str) -> int:
         """
         회원의 포인트 총합
+        - 포인트를 적립/차감할 때마다 회원 포인트(mb_point)를 갱신하므로 그대로 반환합니다.
+        - 포인트 내역과 어긋난 회원 포인트는 reconcile_member_points()에서 보정합니다.
         """
-        # 만료된 포인트들을 소진 처리
-        expire_point = self._fetch_expire_points(mb_id)
-        if expire_point > 0:
-            self._insert_expire_point(mb_id, expire_point)
-
-        # 만료된 포인트 내역 업데이트
-        self._update_expired_points(mb_id)
-
-        # 포인트 총합
-        point_sum = self.db.scalar(
-            select(func.sum(Point.po_point))
-            .where(Point.mb_id == mb_id)
-        )
+        mb_point = self.db.scalar(select(Member.mb_point).where(Member.mb_id == mb_id))
+        return int(mb_point) if mb_point else 0
 
-        return int(point_sum) if point_sum else 0
+    def increase_member_point(self, mb_id: str, point: int) -> None:
+        """
+        회원 포인트를 point만큼 증가(음수이면 감소)시킵니다.
+        - 커밋은 호출하는 쪽에서 합니다.
+        """
+        if not point:
+            return
+        self.db.execute(
+            update(Member).values(mb_point=Member.mb_point + point)
+            .where(Member.mb_id == mb_id)
+        )
 
     def insert_use_point(self, mb_id: str, point: int, po_id: int = None) -> None:
         """
         사용한 포인트 내역 입력&업데이트
+        - 커밋은 호출하는 쪽에서 합니다.
         """
         using_point = abs(point)
         # 사용할 수 있는 포인트 내역 조회
@@ -157,7 +159,7 @@ class PointService(BaseService):
             )
         )
         if po_id:
-            query.where(Point.po_id != po_id)
+            query = query.where(Point.po_id != po_id)
 
         order_list = [Point.po_id.asc()]
         if self.point_term:
@@ -172,10 +174,10 @@ class PointService(BaseService):
 
             if (row_point - used_point) > using_point:
                 self.db.execute(
-                    update(Point).values(po_mb_point=Point.po_mb_point + using_point)
+                    update(Point).values(po_use_point=Point.po_use_point + using_point)
                     .where(Point.po_id == row.po_id)
                 )
-                self.db.commit()
+                break
             else:
                 deduction_point = row_point - used_point
                 self.db.execute(
@@ -184,15 +186,18 @@ class PointService(BaseService):
                         po_expired=100
                     ).where(Point.po_id == row.po_id)
                 )
-                self.db.commit()
                 using_point -= deduction_point
 
     def delete_point(self, mb_id: str, rel_table: str, rel_id: str, rel_action: str) -> None:
         """
         포인트 내역 삭제
+        - 삭제한 포인트만큼 회원 포인트를 되돌리며, 하나의 트랜잭션으로 커밋합니다.
         """
         result = False
 
+        if self._lock_member_point(mb_id) is None:
+            return result
+
         # 포인트 내역정보
         row = self._fetch_point_by_relation(mb_id, rel_table, rel_id, rel_action)
         if row:
@@ -211,7 +216,6 @@ class PointService(BaseService):
                     Point.po_rel_action == rel_action
                 )
             )
-            self.db.commit()
 
             if delete_result.rowcount > 0:
                 result = True
@@ -224,17 +228,17 @@ class PointService(BaseService):
                         )
                         .where(Point.mb_id == mb_id, Point.po_id > row.po_id)
                     )
-                    self.db.commit()
 
-                # 회원 포인트 총합 갱신
-                sum_point = self.get_total_point(mb_id)
-                self.member_service.update_member_point(mb_id, sum_point)
+                # 회원 포인트 갱신
+                self.increase_member_point(mb_id, -row.po_point)
 
+        self.db.commit()
         return result
 
     def delete_use_point(self, mb_id: str, point: int) -> None:
         """
         사용포인트 삭제
+        - 커밋은 호출하는 쪽에서 합니다.
         """
         point1 = abs(point)
         query = select(Point).where(
@@ -265,7 +269,6 @@ class PointService(BaseService):
                     )
                     .where(Point.po_id == row.po_id)
                 )
-                self.db.commit()
                 break
 
             self.db.execute(
@@ -275,12 +278,126 @@ class PointService(BaseService):
                 )
                 .where(Point.po_id == row.po_id)
             )
-            self.db.commit()
             point1 = point1 - point2
 
+    def delete_write_points(self, board: Board, writes: Iterable[Row]) -> None:
+        """
+        삭제하는 게시글/댓글의 포인트를 회원별로 합산하여 한번에 되돌립니다.
+        - 적립 내역이 있으면 내역을 삭제하고, 없으면 게시판에 설정된 포인트만큼 차감합니다.
+        - 회원 포인트는 회원별로 한번씩만 수정하며, 커밋은 호출하는 쪽에서 합니다.
+
+        Args:
+            board (Board): 게시판 정보
+            writes (Iterable[Row]): 삭제하는 게시글/댓글 (wr_id, wr_is_comment, mb_id)
+        """
+        writes_by_rel_id = {str(write.wr_id): write for write in writes if write.mb_id}
+        if not writes_by_rel_id:
+            return
+
+        points = self.db.scalars(
+            select(Point)
+            .where(Point.po_rel_table == board.bo_table,
+                   Point.po_rel_id.in_(list(writes_by_rel_id)),
+                   Point.po_rel_action.in_(("쓰기", "댓글")))
+            .order_by(Point.po_id)
+        ).all()
+        earned_points: List[Point] = []
+        for point in points:
+            write = writes_by_rel_id[point.po_rel_id]
+            rel_action = "댓글" if write.wr_is_comment else "쓰기"
+            if point.mb_id == write.mb_id and point.po_rel_action == rel_action:
+                earned_points.append(point)
+
+        # 회원별 포인트 변경량
+        deltas: Dict[str, int] = {}
+
+        # 적립 내역 삭제
+        if earned_points:
+            positive_points: Dict[str, int] = {}
+            for point in earned_points:
+                deltas[point.mb_id] = deltas.get(point.mb_id, 0) - point.po_point
+                if point.po_point > 0:
+                    positive_points[point.mb_id] = positive_points.get(point.mb_id, 0) + point.po_point
+                elif point.po_use_point > 0:
+                    self.insert_use_point(point.mb_id, point.po_use_point, point.po_id)
+            for mb_id, positive_point in positive_points.items():
+                self.delete_use_point(mb_id, positive_point)
+
+            self.db.execute(delete(Point).where(Point.po_id.in_([point.po_id for point in earned_points])))
+            # 이후 내역의 po_mb_point에 반영
+            table = Point.__table__
+            mb_point_params = [
+                {"target_mb_id": point.mb_id, "target_po_id": point.po_id, "target_point": point.po_point}
+                for point in earned_points if point.po_point
+            ]
+            if mb_point_params:
+                self.db.execute(
+                    update(table)
+                    .where(table.c.mb_id == bindparam("target_mb_id"), table.c.po_id > bindparam("target_po_id"))
+                    .values(po_mb_point=table.c.po_mb_point - bindparam("target_point")),
+                    mb_point_params
+                )
+
+        # 적립 내역이 없는 게시글/댓글은 설정된 포인트만큼 회원별로 합산하여 차감
+        earned_rel_ids = {point.po_rel_id for point in earned_points}
+        penalties: Dict[Tuple[str, bool], List[int]] = {}
+        if self.use_point:
+            for rel_id, write in writes_by_rel_id.items():
+                if rel_id not in earned_rel_ids:
+                    penalties.setdefault((write.mb_id, bool(write.wr_is_comment)), []).append(write.wr_id)
+
+        mb_ids = {mb_id for mb_id, _ in penalties} | set(deltas)
+        member_points = dict(self.db.execute(
+            select(Member.mb_id, Member.mb_point).where(Member.mb_id.in_(mb_ids))
+        ).all())
+
+        new_points = []
+        for (mb_id, is_comment), wr_ids in penalties.items():
+            config_point = board.bo_comment_point if is_comment else board.bo_write_point
+            point = config_point * len(wr_ids) * (-1)
+            if mb_id not in member_points or point == 0:
+                continue
+            action = "댓글" if is_comment else "글"
+            content = (f"{board.bo_subject} {wr_ids[0]} {action} 삭제" if len(wr_ids) == 1
+                       else f"{board.bo_subject} {action} {len(wr_ids)}건 삭제")
+            deltas[mb_id] = deltas.get(mb_id, 0) + point
+            # 차감한 만큼 적립 내역을 사용 처리 (save_point와 동일)
+            self.insert_use_point(mb_id, point)
+            po_expired, po_expire_date = self._get_expire_values(point)
+            new_points.append({
+                "mb_id": mb_id,
+                "po_datetime": datetime.now(),
+                "po_content": content,
+                "po_point": point,
+                "po_use_point": 0,
+                "po_mb_point": member_points[mb_id] + deltas[mb_id],
+                "po_expired": po_expired,
+                "po_expire_date": po_expire_date,
+                "po_rel_table": "",
+                "po_rel_id": "",
+                "po_rel_action": "",
+            })
+        if new_points:
+            self.db.execute(insert(Point), new_points)
+
+        # 회원 포인트 갱신 (회원별 1회)
+        table = Member.__table__
+        member_deltas = [
+            {"target_mb_id": mb_id, "delta": delta}
+            for mb_id, delta in deltas.items() if delta and mb_id in member_points
+        ]
+        if member_deltas:
+            self.db.execute(
+                update(table)
+                .where(table.c.mb_id == bindparam("target_mb_id"))
+                .values(mb_point=table.c.mb_point + bindparam("delta")),
+                member_deltas
+            )
+
     def delete_expire_point(self, mb_id: str, point: int):
         """
         소멸 포인트 삭제
+        - 커밋은 호출하는 쪽에서 합니다.
         """
         point1 = abs(point)
         points = self.db.scalars(
@@ -309,7 +426,6 @@ class PointService(BaseService):
                     )
                     .where(Point.po_id == row.po_id)
                 )
-                self.db.commit()
                 break
 
             self.db.execute(
@@ -320,9 +436,25 @@ class PointService(BaseService):
                 )
                 .where(Point.po_id == row.po_id)
             )
-            self.db.commit()
             point1 = point1 - point2
 
+    def _get_expire_values(self, point: int, expire: int = 0) -> Tuple[int, datetime]:
+        """
+        포인트 내역의 소멸 여부와 만료일을 반환합니다.
+        """
+        if point > 0:
+            po_expired = 0
+            po_expire_date = datetime.strptime(self.MAX_DATE, '%Y-%m-%d')
+            if self.point_term > 0:
+                expire_days = expire if expire > 0 else self.point_term
+                after_datetime = timedelta(days=expire_days - 1)
+                po_expire_date = (datetime.now() + after_datetime).strftime('%Y-%m-%d')
+        else:
+            po_expired = 1
+            po_expire_date = datetime.now()
+
+        return po_expired, po_expire_date
+
     def _fetch_point_by_relation(self, mb_id: str,
                                  rel_table: str, rel_id: str, rel_action: str):
         """
@@ -336,61 +468,123 @@ class PointService(BaseService):
                     Point.po_rel_action == rel_action)
         )
 
-    def _fetch_expire_points(self, mb_id: str) -> int:
+    def _lock_member_point(self, mb_id: str) -> Optional[int]:
         """
-        회원의 만료 예정 포인트 얻기
+        회원 행을 잠그고(SELECT ... FOR UPDATE) 회원 포인트를 반환합니다.
+        - 같은 회원의 포인트를 동시에 적립/차감해도 po_mb_point가 어긋나지 않습니다.
+        - 회원정보가 없으면 None을 반환합니다.
         """
-        if self.point_term <= 0:
-            return 0
-
-        point_sum = self.db.scalar(
-            select(func.sum(Point.po_point - Point.po_use_point))
-            .where(Point.mb_id == mb_id,
-                   Point.po_expired == 0,
-                   Point.po_expire_date < datetime.now())
+        return self.db.scalar(
+            select(Member.mb_point).where(Member.mb_id == mb_id).with_for_update()
         )
 
-        return int(point_sum) if point_sum else 0
 
-    def _insert_expire_point(self, mb_id: str, point: int) -> None:
-        """
-        만료된 포인트만큼 포인트를 소멸시킵니다.
-        """
-        member = self.member_service.fetch_member_by_id(mb_id)
-        mb_point = member.mb_point if member else 0
-        expired_point = point * (-1)
-        new_point = Point(
-            mb_id=mb_id,
-            po_content='포인트 소멸',
-            po_point=expired_point,
-            po_use_point=0,
-            po_mb_point=mb_point + expired_point,
-            po_expired=1,
-            po_rel_table='@expire',
-            po_rel_id=str(mb_id),
-            po_rel_action='expire-' + str(uuid.uuid4()),
+def expire_points(batch_size: int = 500) -> None:
+    """
+    유효기간이 지난 포인트를 한번에 소멸 처리합니다. (매일 실행)
+    - 만료된 적립 내역의 남은 포인트를 회원별로 합산하여 '포인트 소멸' 내역을 추가하고,
+      회원 포인트를 차감한 뒤 적립 내역을 소멸 처리합니다.
+    - batch_size명의 회원 단위로 회원 행을 잠그고 커밋하므로 잠금은 짧게 유지됩니다.
+    """
+    with DBConnect().sessionLocal() as db:
+        config = db.scalar(select(Config))
+        if not config or not config.cf_use_point or config.cf_point_term <= 0:
+            return
+
+        today = date.today()
+        expired_condition = (
+            Point.po_expired != 1,
+            Point.po_expire_date != PointService.MAX_DATE,
+            Point.po_expire_date < today,
         )
-        self.db.add(new_point)
-        self.db.commit()
-
-        # 포인트를 사용한 경우 포인트 내역에 사용금액 기록
-        # TODO: 주석처리된 이유를 확인해야 함
-        if expired_point < 0:
-            # insert_use_point(mb_id, point)
-            pass
-
-    def _update_expired_points(self, mb_id: str) -> None:
-        if self.point_term <= 0:
-            return None
+        mb_ids = db.scalars(
+            select(Point.mb_id).where(*expired_condition).distinct()
+        ).all()
 
-        self.db.execute(
-            update(Point).values(po_expired=1)
-            .where(Point.mb_id == mb_id,
-                   Point.po_expired != 1,
-                   Point.po_expire_date != self.MAX_DATE,
-                   Point.po_expire_date < datetime.now()
+        expire_count = 0
+        for i in range(0, len(mb_ids), batch_size):
+            chunk = mb_ids[i:i + batch_size]
+            try:
+                member_points = dict(db.execute(
+                    select(Member.mb_id, Member.mb_point)
+                    .where(Member.mb_id.in_(chunk))
+                    .with_for_update()
+                ).all())
+                expire_sums = dict(db.execute(
+                    select(Point.mb_id, func.sum(Point.po_point - Point.po_use_point))
+                    .where(Point.mb_id.in_(chunk), Point.po_expired == 0, *expired_condition[1:])
+                    .group_by(Point.mb_id)
+                ).all())
+
+                new_points = []
+                member_deltas = []
+                for mb_id, expire_sum in expire_sums.items():
+                    expire_point = int(expire_sum or 0)
+                    if expire_point <= 0 or mb_id not in member_points:
+                        continue
+                    new_points.append({
+                        "mb_id": mb_id,
+                        "po_datetime": datetime.now(),
+                        "po_content": "포인트 소멸",
+                        "po_point": -expire_point,
+                        "po_use_point": 0,
+                        "po_mb_point": member_points[mb_id] - expire_point,
+                        "po_expired": 1,
+                        "po_rel_table": "@expire",
+                        "po_rel_id": mb_id,
+                        "po_rel_action": "expire-" + str(uuid.uuid4()),
+                    })
+                    member_deltas.append({"target_mb_id": mb_id, "delta": -expire_point})
+
+                if new_points:
+                    db.execute(insert(Point), new_points)
+                    table = Member.__table__
+                    db.execute(
+                        update(table)
+                        .where(table.c.mb_id == bindparam("target_mb_id"))
+                        .values(mb_point=table.c.mb_point + bindparam("delta")),
+                        member_deltas
+                    )
+                # 남은 포인트를 모두 사용한 것으로 기록하여 소멸 내역 삭제 시 되돌릴 수 있도록 한다.
+                db.execute(
+                    update(Point).values(po_use_point=Point.po_point)
+                    .where(Point.mb_id.in_(chunk), Point.po_expired == 0, *expired_condition[1:])
+                    .execution_options(synchronize_session=False)
+                )
+                db.execute(
+                    update(Point).values(po_expired=1)
+                    .where(Point.mb_id.in_(chunk), *expired_condition)
+                    .execution_options(synchronize_session=False)
+                )
+                db.commit()
+                expire_count += len(new_points)
+            except Exception as e:
+                db.rollback()
+                print("포인트 소멸 처리 실패 : ", e)
+
+        print("포인트 소멸 기준일 : ", today, f"{expire_count}명 소멸")
+
+
+def reconcile_member_points() -> None:
+    """
+    회원 포인트(mb_point)를 포인트 내역의 합계와 맞춥니다. (매일 실행)
+    - 포인트 내역 합계를 다시 계산하여 어긋난 회원만 수정합니다.
+    """
+    with DBConnect().sessionLocal() as db:
+        try:
+            point_sum = (
+                select(func.coalesce(func.sum(Point.po_point), 0))
+                .where(Point.mb_id == Member.mb_id)
+                .scalar_subquery()
             )
-        )
-        self.db.commit()
-
-        return None
\ No newline at end of file
+            result = db.execute(
+                update(Member)
+                .where(Member.mb_point != point_sum)
+                .values(mb_point=point_sum)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            print(f"회원 포인트 보정 : {result.rowcount}건")
+        except Exception as e:
+            db.rollback()
+            print("회원 포인트 보정 실패 : ", e)
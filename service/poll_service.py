@@ -1,8 +1,6 @@
 """설문조사 관련 기능을 제공하는 서비스 모듈입니다."""
 from typing import List, Tuple
 
-from cachetools import LRUCache, cached
-from cachetools.keys import hashkey
 from fastapi import Request
 from sqlalchemy import select
 
@@ -131,7 +129,6 @@ class PollService(BaseService):
         self.db.delete(poll_etc)
         self.db.commit()
 
-    @cached(LRUCache(maxsize=1), key=lambda _: hashkey("latest_poll"))
     def fetch_latest_poll(self):
         """
         사용 설정된 최신 설문조사 1건을 조회합니다.
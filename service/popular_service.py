@@ -1,17 +1,29 @@
 """인기 검색어 관련 기능을 제공하는 서비스 모듈입니다."""
+import asyncio
+import logging
+import threading
+from collections import Counter
 from datetime import date, datetime, timedelta
-from typing import List
+from typing import Dict, Iterable, List, Set, Tuple
 
-from cachetools import TTLCache, cached
-from cachetools.keys import hashkey
 from fastapi import Request
-from sqlalchemy import delete, desc, exists, func, select
-from sqlalchemy.exc import SQLAlchemyError
-from core.database import db_session
-from core.models import Popular
+from fastapi.concurrency import run_in_threadpool
+from filelock import FileLock
+from sqlalchemy import bindparam, delete, desc, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from core.database import DBConnect, db_session
+from core.models import Popular, PopularDaily
 from lib.common import get_client_ip
 from service import BaseService
 
+logger = logging.getLogger(__name__)
+
+POPULAR_FLUSH_INTERVAL = 10  # 단위: 초
+
+PopularKey = Tuple[date, str, str]
+
 
 class PopularService(BaseService):
     """인기 검색어 관련 서비스를 제공하는 종속성 주입 클래스입니다."""
@@ -27,12 +39,10 @@ class PopularService(BaseService):
     def raise_exception(self, status_code: int, detail: str = None):
         pass
 
-    @cached(TTLCache(maxsize=128, ttl=60),
-            key=lambda self, limit=10, day=3: hashkey("populars", limit, day))
     def fetch_populars(self, limit: int = 10, day: int = 3) -> List[Popular]:
         """
         현재 날짜와 day일 전 날짜 사이의 인기검색어를 조회한다.
-        - TTL(Time To Live)캐시를 사용하여 조회한다.
+        - 일별 집계 테이블(PopularDaily)의 검색 수를 합산하여 순위를 구한다.
 
         Args:
             limit (int, optional): 조회 갯수. Defaults to 7.
@@ -42,61 +52,197 @@ class PopularService(BaseService):
             List[Popular]: 인기검색어 리스트
 
         """
+        prepare_popular_daily()
+
         today = datetime.now()
         before_day = today - timedelta(days=day)
         populars = self.db.execute(
-            select(Popular.pp_word, func.count(Popular.pp_word).label('count'))
+            select(PopularDaily.pp_word, func.sum(PopularDaily.pp_count).label('count'))
             .where(
-                Popular.pp_word != '',
-                Popular.pp_date >= before_day,
-                Popular.pp_date <= today
+                PopularDaily.pp_word != '',
+                PopularDaily.pp_date >= before_day.date(),
+                PopularDaily.pp_date <= today.date()
             )
-            .group_by(Popular.pp_word)
-            .order_by(desc('count'), Popular.pp_word)
+            .group_by(PopularDaily.pp_word)
+            .order_by(desc('count'), PopularDaily.pp_word)
             .limit(limit)
         ).all()
 
         return populars
 
     def create_popular(self, request: Request, fields: str, word: str) -> None:
-        """인기검색어를 생성합니다."""
-        try:
-            if not word or not fields:
-                self.raise_exception(400, "검색어가 없습니다.")
-                return None
+        """인기검색어를 생성합니다.
+        - 검색어는 버퍼에 추가하고 PopularBuffer.flush()에서 한번에 등록합니다.
+        """
+        if not word or not fields:
+            self.raise_exception(400, "검색어가 없습니다.")
+            return None
 
-            if "mb_id" in fields:  # 회원아이디로 검색은 제외
-                self.raise_exception(400, "회원아이디로 검색은 제외합니다.")
-                return None
+        if "mb_id" in fields:  # 회원아이디로 검색은 제외
+            self.raise_exception(400, "회원아이디로 검색은 제외합니다.")
+            return None
 
-            today_date = datetime.now()
-            exists_popular = self.db.scalar(
-                exists(Popular)
-                .where(
-                    Popular.pp_word == word,
-                    Popular.pp_date == today_date.strftime("%Y-%m-%d")
-                ).select()
-            )
+        # 같은 날 같은 IP에서 검색한 검색어는 한번만 등록한다.
+        if not PopularBuffer.add(date.today(), word, get_client_ip(request)):
+            self.raise_exception(409, "이미 등록된 검색어입니다.")
+            return None
 
-            if exists_popular:
-                self.raise_exception(409, "이미 등록된 검색어입니다.")
-                return None
-
-            # 현재 날짜의 인기검색어가 없으면 새로 등록한다.
-            popular = Popular(
-                pp_word=word,
-                pp_date=today_date,
-                pp_ip=get_client_ip(request))
-            self.db.add(popular)
-            self.db.commit()
-        except SQLAlchemyError:
-            pass
         return None
 
     def delete_populars(self, base_date: date) -> int:
-        """기준 날짜 이전의 인기검색어를 삭제합니다."""
+        """기준 날짜 이전의 인기검색어와 일별 집계를 삭제합니다."""
+        prepare_popular_daily()
+
         result = self.db.execute(
             delete(Popular).where(Popular.pp_date < base_date)
         )
+        self.db.execute(
+            delete(PopularDaily).where(PopularDaily.pp_date < base_date)
+        )
         self.db.commit()
         return result.rowcount
+
+    def delete_populars_by_ids(self, pp_ids: List[int]) -> None:
+        """선택한 인기검색어를 삭제하고 일별 집계에서 검색 수를 뺍니다."""
+        prepare_popular_daily()
+
+        rows = self.db.execute(
+            select(Popular.pp_date, Popular.pp_word).where(Popular.pp_id.in_(pp_ids))
+        ).all()
+        if not rows:
+            return
+
+        table = PopularDaily.__table__
+        self.db.execute(
+            update(table)
+            .where(table.c.pp_date == bindparam("target_date"), table.c.pp_word == bindparam("target_word"))
+            .values(pp_count=table.c.pp_count - bindparam("target_count")),
+            [
+                {"target_date": pp_date, "target_word": pp_word, "target_count": count}
+                for (pp_date, pp_word), count in Counter(tuple(row) for row in rows).items()
+            ]
+        )
+        self.db.execute(delete(PopularDaily).where(PopularDaily.pp_count <= 0))
+        self.db.execute(delete(Popular).where(Popular.pp_id.in_(pp_ids)))
+        self.db.commit()
+
+
+class PopularBuffer:
+    """
+    인기검색어 등록을 모아서 반영하는 프로세스 단위 버퍼 클래스입니다.
+    - 검색 시에는 메모리에 (날짜, 검색어, IP)만 추가하고, 일정 주기로 한번에 반영합니다.
+    - 원본 테이블(Popular)에 한번에 추가하고, 일별 집계 테이블(PopularDaily)의 검색 수를 증가시킵니다.
+    """
+    pending: Set[PopularKey] = set()
+    lock = threading.Lock()
+
+    @classmethod
+    def add(cls, pp_date: date, word: str, ip: str) -> bool:
+        """검색어를 버퍼에 추가합니다. 이미 버퍼에 있으면 False를 반환합니다."""
+        key = (pp_date, word, ip)
+        with cls.lock:
+            if key in cls.pending:
+                return False
+            cls.pending.add(key)
+        return True
+
+    @classmethod
+    def flush(cls) -> None:
+        """버퍼에 모인 검색어를 원본 테이블과 일별 집계 테이블에 반영합니다."""
+        with cls.lock:
+            pending, cls.pending = cls.pending, set()
+        if not pending:
+            return
+
+        with DBConnect().sessionLocal() as db:
+            try:
+                prepare_popular_daily()
+                cls._insert_populars(db, pending)
+                db.commit()
+            except Exception:
+                db.rollback()
+                # 반영에 실패한 검색어는 다음 주기에 다시 반영
+                with cls.lock:
+                    cls.pending.update(pending)
+                raise
+
+    @classmethod
+    def _insert_populars(cls, db: Session, pending: Iterable[PopularKey]) -> None:
+        """이미 등록된 검색어를 제외하고 추가한 뒤, 추가한 수만큼 일별 집계를 증가시킵니다."""
+        pending = set(pending)
+        exist_keys = {
+            tuple(row) for row in db.execute(
+                select(Popular.pp_date, Popular.pp_word, Popular.pp_ip)
+                .where(
+                    Popular.pp_date.in_({key[0] for key in pending}),
+                    Popular.pp_word.in_({key[1] for key in pending})
+                )
+            ).all()
+        }
+        new_keys = [key for key in pending if key not in exist_keys]
+        if not new_keys:
+            return
+
+        db.execute(
+            insert(Popular),
+            [{"pp_date": pp_date, "pp_word": pp_word, "pp_ip": pp_ip} for pp_date, pp_word, pp_ip in new_keys]
+        )
+        counts: Dict[Tuple[date, str], int] = Counter((pp_date, pp_word) for pp_date, pp_word, _ in new_keys)
+        for (pp_date, pp_word), count in counts.items():
+            cls._increase_daily_count(db, pp_date, pp_word, count)
+
+    @staticmethod
+    def _increase_daily_count(db: Session, pp_date: date, pp_word: str, count: int) -> None:
+        """일별 집계 테이블의 검색 수를 증가시킵니다. (없으면 추가)"""
+        increase_query = (
+            update(PopularDaily)
+            .where(PopularDaily.pp_date == pp_date, PopularDaily.pp_word == pp_word)
+            .values(pp_count=PopularDaily.pp_count + count)
+        )
+        if db.execute(increase_query).rowcount:
+            return
+
+        try:
+            with db.begin_nested():
+                db.execute(insert(PopularDaily).values(pp_date=pp_date, pp_word=pp_word, pp_count=count))
+        except IntegrityError:
+            # 다른 worker가 먼저 추가한 경우
+            db.execute(increase_query)
+
+
+_is_daily_prepared = False
+POPULAR_DAILY_LOCK_PATH = "data/popular_daily.lock"
+
+
+def prepare_popular_daily() -> None:
+    """일별 집계 테이블이 없으면 생성하고, 기존 인기검색어로 집계를 채운다.
+    - 서버 시작 시 실행하며, 여러 worker가 동시에 실행하지 않도록 파일 잠금을 사용한다.
+    - 집계가 비어있을 때만 채우므로 중간에 실패해도 다음 실행에서 다시 채운다.
+    """
+    global _is_daily_prepared
+    if _is_daily_prepared:
+        return
+
+    engine = DBConnect().engine
+    with FileLock(POPULAR_DAILY_LOCK_PATH):
+        PopularDaily.__table__.create(bind=engine, checkfirst=True)
+        with engine.begin() as conn:
+            if conn.scalar(select(PopularDaily.pp_date).limit(1)) is None:
+                conn.execute(
+                    insert(PopularDaily).from_select(
+                        ["pp_date", "pp_word", "pp_count"],
+                        select(Popular.pp_date, Popular.pp_word, func.count())
+                        .group_by(Popular.pp_date, Popular.pp_word)
+                    )
+                )
+    _is_daily_prepared = True
+
+
+async def run_popular_buffer() -> None:
+    """POPULAR_FLUSH_INTERVAL 주기로 인기검색어를 반영하는 백그라운드 작업"""
+    while True:
+        await asyncio.sleep(POPULAR_FLUSH_INTERVAL)
+        try:
+            await run_in_threadpool(PopularBuffer.flush)
+        except Exception as e:
+            logger.error(f"인기검색어 반영 중 오류가 발생했습니다: {e}")
@@ -1,10 +1,13 @@
 """전체검색 관련 기능을 제공하는 서비스 모듈입니다."""
-from typing_extensions import Annotated, List
+from typing_extensions import Annotated, Dict, List, Set, Tuple
 from fastapi import Depends, Query, Request, HTTPException
-from sqlalchemy import select, func
+from sqlalchemy import func, literal, select, union_all
+from sqlalchemy.orm import selectinload
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.expression import Select, UnaryExpression
 
 from api.v1.dependencies.member import get_current_member_optional
-from core.models import Member, Board, Group, GroupMember
+from core.models import Member, Board, BoardFile, Group, GroupMember, WriteBaseModel
 from core.database import db_session
 from core.exception import AlertException
 from lib.board_lib import BoardConfig, write_search_filter, get_list
@@ -17,6 +20,8 @@ class SearchService(BaseService):
     """
     게시판 검색 서비스 클래스
     """
+    # 한번에 UNION ALL로 묶을 게시판 수
+    UNION_CHUNK_SIZE = 100
 
     def __init__(
         self,
@@ -62,6 +67,7 @@ class SearchService(BaseService):
         """게시판 목록 조회"""
         boards_query = (
             select(Board)
+            .options(selectinload(Board.group))
             .where(
                 Board.bo_use_search == 1,
                 Board.bo_list_level <= self.member.level,
@@ -82,65 +88,229 @@ class SearchService(BaseService):
         page: int = 1,
         per_page: int = 5
     ) -> dict:
-        """게시판 검색 데이터"""
+        """게시판 검색 데이터
+        - 게시판별로 쿼리를 실행하지 않고, 여러 게시판 테이블을 UNION ALL로 묶어
+          검색 건수, 검색 결과, 댓글의 원글을 각각 한번에 조회한다.
+        """
         if len(stx) < 2:
             self.raise_exception(status_code=400, detail="검색어는 2글자 이상 입력해 주세요.")
 
-        remove_boards = []
-        total_search_count = 0
         offset = (page - 1) * per_page
+        boards = self.filter_accessible_boards(boards)
+
+        # 게시판 별 검색 Query 설정
+        board_configs: Dict[str, BoardConfig] = {}
+        search_queries: Dict[str, Select] = {}
         for board in boards:
             board_config = BoardConfig(self.request, board)
             board.subject = board_config.subject
-            # 그룹접근 사용이면서 그룹관리자도 아니고 그룹회원도 아닌 경우 boards에서 제외
+            write_model = dynamic_create_write_table(board.bo_table)
+            query = write_search_filter(write_model, search_field=sfl,
+                                        keyword=stx, operator=sop)
+            board_configs[board.bo_table] = board_config
+            search_queries[board.bo_table] = board_config.get_list_sort_query(write_model, query)
+
+        # 게시판 별 검색 건수
+        search_counts = self.get_search_counts(search_queries)
+        boards = [board for board in boards if search_counts.get(board.bo_table, 0) > 0]
+        total_search_count = 0
+        for board in boards:
+            board.search_count = search_counts[board.bo_table]
+            total_search_count += board.search_count
+
+        # 게시판 별 검색 결과 + 첨부파일 여부 + 댓글의 원글
+        writes_by_board = self.get_search_writes(
+            {board.bo_table: search_queries[board.bo_table] for board in boards}, offset, per_page)
+        file_keys = self.get_file_keys(writes_by_board)
+        parent_keys = {
+            bo_table: [write.wr_parent for write in writes if write.wr_is_comment]
+            for bo_table, writes in writes_by_board.items()
+        }
+        parent_subjects = self.get_write_subjects(parent_keys)
+
+        for board in boards:
+            board_config = board_configs[board.bo_table]
+            board.writes = writes_by_board.get(board.bo_table, [])
+            for write in board.writes:
+                icon_file = (board.bo_table, write.wr_id) in file_keys
+                write = get_list(self.request, self.db, write, board_config, icon_file=icon_file)
+                if write.wr_is_comment:
+                    word = "댓글"
+                    parent_subject = parent_subjects.get((board.bo_table, write.wr_parent))
+                    if parent_subject is not None:
+                        write.subject = parent_subject
+                        write.href = f"/board/{board.bo_table}/{write.wr_parent}?{self.request.query_params}#c_{write.wr_id}"
+                else:
+                    word = "글"
+                    write.href = f"/board/{board.bo_table}/{write.wr_id}?{self.request.query_params}"
+
+                if "secret" in write.wr_option:
+                    write.wr_content = f"[비밀{word} 입니다.]"
+
+        return {"total_search_count": total_search_count, "boards": boards}
+
+    def filter_accessible_boards(self, boards: List[Board]) -> List[Board]:
+        """그룹접근을 사용하는 게시판 중 접근할 수 없는 게시판을 제외한다.
+        - 그룹접근 사용이면서 그룹관리자도 아니고 그룹회원도 아닌 경우 제외
+        - 회원의 그룹 가입정보는 한번만 조회한다.
+        """
+        if self.member.is_super_admin():
+            return list(boards)
+
+        access_gr_ids = {board.gr_id for board in boards if board.group.gr_use_access}
+        member_gr_ids = set()
+        if access_gr_ids and self.member.mb_id:
+            member_gr_ids = set(self.db.scalars(
+                select(GroupMember.gr_id).where(
+                    GroupMember.gr_id.in_(access_gr_ids),
+                    GroupMember.mb_id == self.member.mb_id
+                )
+            ).all())
+
+        accessible_boards = []
+        for board in boards:
             group = board.group
-            if group.gr_use_access and not self.member.is_super_admin():
+            if group.gr_use_access:
                 is_group_admin = group.gr_admin == self.member.mb_id
-                group_member = self.db.scalar(
-                    select(GroupMember).where(
-                        GroupMember.gr_id == group.gr_id,
-                        GroupMember.mb_id == self.member.mb_id
-                    )
-                )
-                if not (is_group_admin or group_member):
-                    remove_boards.append(board)
+                if not (is_group_admin or group.gr_id in member_gr_ids):
                     continue
+            accessible_boards.append(board)
+        return accessible_boards
 
-            # 게시판 별 검색 Query 설정
-            write_model = dynamic_create_write_table(board.bo_table)
-            query = write_search_filter(write_model, search_field=sfl,
-                                        keyword=stx, operator=sop)
-            query = board_config.get_list_sort_query(write_model, query)
-            board.search_count = self.db.scalar(query.add_columns(func.count()).order_by(None))
-
-            if board.search_count > 0:
-                board.writes = self.db.scalars(query.add_columns(write_model).\
-                                offset(offset).limit(per_page)).all()
-                total_search_count += board.search_count
-                for write in board.writes:
-                    write = get_list(self.request, self.db, write, board_config)
-                    if write.wr_is_comment:
-                        word = "댓글"
-                        parent_write = self.db.get(write_model, write.wr_parent)
-                        if parent_write:
-                            write.subject = parent_write.wr_subject
-                            write.href = f"/board/{board.bo_table}/{parent_write.wr_id}?{self.request.query_params}#c_{write.wr_id}"
-                    else:
-                        word = "글"
-                        write.href = f"/board/{board.bo_table}/{write.wr_id}?{self.request.query_params}"
-
-                    if "secret" in write.wr_option:
-                        write.wr_content = f"[비밀{word} 입니다.]"
-            else:
-                # 검색 결과가 없으면 remove_boards 추가
-                remove_boards.append(board)
+    def get_search_counts(self, search_queries: Dict[str, Select]) -> Dict[str, int]:
+        """게시판 별 검색 건수를 UNION ALL로 한번에 조회한다.
+
+        Args:
+            search_queries (Dict[str, Select]): 게시판 아이디별 검색 쿼리
+
+        Returns:
+            Dict[str, int]: 게시판 아이디별 검색 건수
+        """
+        count_queries = [
+            query.add_columns(literal(bo_table).label("bo_table"), func.count().label("search_count"))
+            .select_from(dynamic_create_write_table(bo_table))
+            .order_by(None)
+            for bo_table, query in search_queries.items()
+        ]
+        search_counts = {}
+        for rows in self._execute_union_all(count_queries):
+            search_counts.update({row.bo_table: row.search_count for row in rows})
+        return search_counts
+
+    def get_search_writes(self, search_queries: Dict[str, Select],
+                          offset: int, limit: int) -> Dict[str, List[WriteBaseModel]]:
+        """게시판 별 검색 결과를 UNION ALL로 한번에 조회한다.
+        - 게시판 테이블마다 컬럼이 다를 수 있으므로 공통 컬럼만 조회한다.
+
+        Returns:
+            Dict[str, List[WriteBaseModel]]: 게시판 아이디별 게시글 목록 (세션과 분리된 객체)
+        """
+        if not search_queries:
+            return {}
+
+        write_models = {bo_table: dynamic_create_write_table(bo_table) for bo_table in search_queries}
+        columns = self._get_common_columns(write_models.values())
+
+        write_queries = []
+        for bo_table, query in search_queries.items():
+            write_model = write_models[bo_table]
+            subquery = (
+                query.add_columns(literal(bo_table).label("bo_table"),
+                                  *[getattr(write_model, column) for column in columns])
+                .offset(offset).limit(limit)
+                .subquery()
+            )
+            write_queries.append(select(subquery))
+
+        writes_by_board = {bo_table: [] for bo_table in search_queries}
+        for rows in self._execute_union_all(write_queries):
+            for row in rows:
+                mapping = row._mapping
+                write = write_models[row.bo_table](**{column: mapping[column] for column in columns})
+                writes_by_board[row.bo_table].append(write)
+
+        # UNION ALL 결과는 순서가 보장되지 않으므로 게시판의 정렬 기준으로 다시 정렬한다.
+        for bo_table, writes in writes_by_board.items():
+            self._sort_writes(writes, search_queries[bo_table], columns)
+        return writes_by_board
+
+    def get_file_keys(self, writes_by_board: Dict[str, List[WriteBaseModel]]) -> Set[Tuple[str, int]]:
+        """검색된 게시글 중 첨부파일이 있는 게시글을 한번에 조회한다.
+
+        Returns:
+            Set[Tuple[str, int]]: 첨부파일이 있는 (게시판 아이디, 게시글 아이디) 목록
+        """
+        wr_ids = {write.wr_id for writes in writes_by_board.values() for write in writes}
+        if not wr_ids:
+            return set()
+
+        rows = self.db.execute(
+            select(BoardFile.bo_table, BoardFile.wr_id).distinct()
+            .where(BoardFile.bo_table.in_(writes_by_board.keys()), BoardFile.wr_id.in_(wr_ids))
+        ).all()
+        return {(row.bo_table, row.wr_id) for row in rows}
+
+    def get_write_subjects(self, wr_ids_by_board: Dict[str, List[int]]) -> Dict[Tuple[str, int], str]:
+        """여러 게시판의 게시글 제목을 UNION ALL로 한번에 조회한다.
+
+        Args:
+            wr_ids_by_board (Dict[str, List[int]]): 게시판 아이디별 게시글 아이디 목록
+
+        Returns:
+            Dict[Tuple[str, int], str]: (게시판 아이디, 게시글 아이디)별 제목
+        """
+        subject_queries = []
+        for bo_table, wr_ids in wr_ids_by_board.items():
+            if not wr_ids:
                 continue
+            write_model = dynamic_create_write_table(bo_table)
+            subject_queries.append(
+                select(literal(bo_table).label("bo_table"), write_model.wr_id, write_model.wr_subject)
+                .where(write_model.wr_id.in_(set(wr_ids)))
+            )
 
-        # boards에서 제외된 게시판 제거
-        for board in remove_boards:
-            boards.remove(board)
+        subjects = {}
+        for rows in self._execute_union_all(subject_queries):
+            subjects.update({(row.bo_table, row.wr_id): row.wr_subject for row in rows})
+        return subjects
 
-        return {"total_search_count": total_search_count, "boards": boards}
+    def _execute_union_all(self, queries: List[Select]):
+        """쿼리 목록을 UNION ALL로 묶어서 실행한다.
+        - 데이터베이스의 UNION 개수 제한을 고려하여 UNION_CHUNK_SIZE 단위로 나누어 실행한다.
+        """
+        for i in range(0, len(queries), self.UNION_CHUNK_SIZE):
+            chunk = queries[i:i + self.UNION_CHUNK_SIZE]
+            query = chunk[0] if len(chunk) == 1 else union_all(*chunk)
+            yield self.db.execute(query).all()
+
+    def _sort_writes(self, writes: List[WriteBaseModel], query: Select, columns: List[str]) -> None:
+        """게시글 목록을 쿼리의 정렬 기준(ORDER BY)과 같은 순서로 정렬한다.
+        - NULL은 데이터베이스와 같이 오름차순에서 앞에, 내림차순에서 뒤에 둔다.
+        """
+        sort_keys = []
+        for clause in query._order_by_clauses:
+            is_desc = isinstance(clause, UnaryExpression) and clause.modifier is operators.desc_op
+            column = clause.element if isinstance(clause, UnaryExpression) else clause
+            if getattr(column, "key", None) in columns:
+                sort_keys.append((column.key, is_desc))
+
+        # 마지막 정렬 기준부터 차례로 안정 정렬한다.
+        for column, is_desc in reversed(sort_keys):
+            writes.sort(key=lambda write: self._get_sort_value(getattr(write, column)), reverse=is_desc)
+
+    @staticmethod
+    def _get_sort_value(value) -> tuple:
+        """NULL을 다른 값보다 작게 비교하기 위한 정렬 값"""
+        return (True, value) if value is not None else (False,)
+
+    def _get_common_columns(self, write_models) -> List[str]:
+        """게시판 테이블들의 공통 컬럼 목록"""
+        write_models = list(write_models)
+        columns = write_models[0].__table__.columns.keys()
+        for write_model in write_models[1:]:
+            model_columns = set(write_model.__table__.columns.keys())
+            columns = [column for column in columns if column in model_columns]
+        return columns
 
 
 class SearchServiceAPI(SearchService):
@@ -1,16 +1,33 @@
 """방문자 서비스를 제공하는 모듈입니다."""
-from datetime import date, datetime, timedelta
+import asyncio
+import logging
 import re
-from typing import Union
+import threading
+import time
+from collections import deque
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Deque, Dict, List, Tuple
 
 from fastapi import Request
-from sqlalchemy import exists, func, select
+from fastapi.concurrency import run_in_threadpool
+from filelock import FileLock
+from sqlalchemy import exists, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 from user_agents import parse
 
-from core.database import db_session
+from core.database import DBConnect, db_session
 from core.models import Config, Visit, VisitSum
 from lib.common import get_client_ip
 
+logger = logging.getLogger(__name__)
+
+VISIT_LOG_FLUSH_INTERVAL = 5  # 단위: 초
+# 여러 worker가 같은 IP를 중복 기록하지 않도록 기록(확인 + 추가)을 worker 간에 직렬화하는 잠금 파일
+VISIT_LOG_LOCK_PATH = "data/visit_log.lock"
+VISIT_LOG_LOCK_TIMEOUT = 10  # 단위: 초
+
 
 class VisitService:
     """
@@ -37,38 +54,21 @@ class VisitService:
 
         return visit
 
-    def create_visit_record(self) -> Union[Visit, None]:
+    def create_visit_record(self) -> bool:
         """
         방문자 접속 이력 생성 함수
-        - 새로운 접속 이력 생성
-        - 방문자 합계 테이블 갱신
-        - 기본설정 테이블에 방문자 수 기록
+        - 오늘 접속 이력이 없으면 접속 이력을 대기열에 추가
+        - 대기열의 접속 이력과 방문자 수는 VisitLogWriter가 주기적으로 반영
+
+        Returns:
+            bool: 접속 이력을 추가했으면 True, 이미 방문한 경우 False
         """
         vi_ip = get_client_ip(self.request)
         if self.is_exists_visit(vi_ip, self.today):
-            return None
-
-        referer = self.request.headers.get("referer", "")
-        user_agent = self.request.headers.get("User-Agent", "")
-        browser, os, device = self._parse_user_agent(user_agent)
-        visit = Visit(
-            vi_ip=vi_ip,
-            vi_date=self.today,
-            vi_time=datetime.now().time(),
-            vi_referer=referer,
-            vi_agent=user_agent,
-            vi_browser=browser,
-            vi_os=os,
-            vi_device=device,
-        )
-        self.db.add(visit)
-        self.db.commit()
-        self.db.refresh(visit)
+            return False
 
-        self._update_visit_sum()
-        self._update_config()
-
-        return visit
+        VisitLogWriter.enqueue(self.request)
+        return True
 
     def is_exists_visit(self, ip: str, visit_date: date) -> bool:
         """오늘의 접속이 이미 기록되어 있는지 확인합니다."""
@@ -79,35 +79,228 @@ class VisitService:
             ).select()
         )
 
-    def _parse_user_agent(self, user_agent: str):
-        """User-Agent 문자열을 파싱하여 브라우저, OS, 디바이스 정보를 반환합니다."""
-        ua = parse(user_agent)
-        browser = getattr(ua.browser, 'family', 'unknown')
-        os = getattr(ua.os, 'family', 'unknown')
-        device = 'pc' if ua.is_pc else 'mobile' if ua.is_mobile else 'tablet' if ua.is_tablet else 'unknown'
-        return browser, os, device
-
-    def _update_config(self) -> None:
-        """기본설정 테이블 > 방문자 수 갱신 함수"""
-        today = self.db.scalar(
-            select(VisitSum.vs_count).where(VisitSum.vs_date == self.today)
+
+@lru_cache(maxsize=2048)
+def parse_user_agent(user_agent: str) -> Tuple[str, str, str]:
+    """User-Agent 문자열을 파싱하여 브라우저, OS, 디바이스 정보를 반환합니다.
+    - 같은 User-Agent가 반복되므로 파싱 결과를 캐시합니다.
+    """
+    ua = parse(user_agent)
+    browser = getattr(ua.browser, 'family', 'unknown')
+    os = getattr(ua.os, 'family', 'unknown')
+    device = 'pc' if ua.is_pc else 'mobile' if ua.is_mobile else 'tablet' if ua.is_tablet else 'unknown'
+    return browser, os, device
+
+
+class VisitLogWriter:
+    """
+    방문자 접속 이력을 모아서 기록하는 프로세스 단위 대기열 클래스입니다.
+    - 요청 처리 중에는 접속 정보만 대기열에 추가합니다.
+    - 백그라운드 작업에서 User-Agent를 파싱하고, 오늘 이미 기록된 IP를 제외한 뒤
+      접속 이력을 한번에(executemany) 추가합니다.
+    - 기록된 IP 확인과 추가는 파일 잠금으로 worker 간에 한번에 하나씩 실행하므로,
+      여러 worker의 대기열에 같은 IP가 있어도 한번만 기록됩니다.
+    """
+    # 대기열 최대 크기 (데이터베이스 장애 시 메모리 사용량 제한)
+    MAX_QUEUE_SIZE = 10000
+    queue: Deque[dict] = deque(maxlen=MAX_QUEUE_SIZE)
+    flush_lock = threading.Lock()
+    metrics = {
+        "flush_count": 0,
+        "written_count": 0,
+        "failed_count": 0,
+        "last_flush_size": 0,
+        "last_flush_seconds": 0.0,
+        "max_flush_seconds": 0.0,
+    }
+
+    @classmethod
+    def enqueue(cls, request: Request) -> None:
+        """접속 정보를 대기열에 추가합니다."""
+        now = datetime.now()
+        cls.queue.append({
+            "vi_ip": get_client_ip(request),
+            "vi_date": now.date(),
+            "vi_time": now.time(),
+            "vi_referer": request.headers.get("referer", ""),
+            "vi_agent": request.headers.get("User-Agent", ""),
+        })
+
+    @classmethod
+    def get_metrics(cls) -> dict:
+        """대기열 크기와 기록 소요시간 등 현재 프로세스의 지표를 반환합니다."""
+        return {"queue_depth": len(cls.queue), **cls.metrics}
+
+    @classmethod
+    def flush(cls) -> int:
+        """대기열의 접속 이력을 기록하고, 방문자 수 증가분을 VisitCounter에 더합니다.
+
+        Returns:
+            int: 기록한 접속 이력 수
+        """
+        with cls.flush_lock:
+            records = []
+            while cls.queue:
+                records.append(cls.queue.popleft())
+            if not records:
+                return 0
+
+            started_at = time.perf_counter()
+            try:
+                with FileLock(VISIT_LOG_LOCK_PATH, timeout=VISIT_LOG_LOCK_TIMEOUT):
+                    with DBConnect().sessionLocal() as db:
+                        visit_counts = cls._insert_visits(db, records)
+            except Exception:
+                cls.metrics["failed_count"] += 1
+                # 기록에 실패한 접속 이력은 다음 주기에 다시 기록
+                cls.queue.extendleft(reversed(records))
+                raise
+
+            for visit_date, count in visit_counts.items():
+                VisitCounter.increase(visit_date, count)
+
+            elapsed = time.perf_counter() - started_at
+            written_count = sum(visit_counts.values())
+            cls.metrics["flush_count"] += 1
+            cls.metrics["written_count"] += written_count
+            cls.metrics["last_flush_size"] = written_count
+            cls.metrics["last_flush_seconds"] = elapsed
+            cls.metrics["max_flush_seconds"] = max(cls.metrics["max_flush_seconds"], elapsed)
+            return written_count
+
+    @staticmethod
+    def _insert_visits(db: Session, records: List[dict]) -> Dict[date, int]:
+        """날짜별로 이미 기록된 IP를 제외하고 접속 이력을 추가합니다.
+
+        Returns:
+            Dict[date, int]: 날짜별 추가된 접속 이력 수
+        """
+        # 대기열 안에서 중복된 (날짜, IP) 제거
+        unique_records = {}
+        for record in records:
+            unique_records.setdefault((record["vi_date"], record["vi_ip"]), record)
+
+        ips_by_date: Dict[date, set] = {}
+        for visit_date, ip in unique_records:
+            ips_by_date.setdefault(visit_date, set()).add(ip)
+
+        # 이미 기록된 (날짜, IP) 제외
+        for visit_date, ips in ips_by_date.items():
+            exists_ips = db.scalars(
+                select(Visit.vi_ip).where(Visit.vi_date == visit_date, Visit.vi_ip.in_(ips))
+            ).all()
+            for ip in exists_ips:
+                unique_records.pop((visit_date, ip), None)
+
+        rows = []
+        visit_counts: Dict[date, int] = {}
+        for record in unique_records.values():
+            browser, os, device = parse_user_agent(record["vi_agent"])
+            rows.append({
+                **record,
+                "vi_agent": record["vi_agent"][:200],
+                "vi_browser": browser,
+                "vi_os": os,
+                "vi_device": device,
+            })
+            visit_counts[record["vi_date"]] = visit_counts.get(record["vi_date"], 0) + 1
+
+        if rows:
+            db.execute(insert(Visit), rows)
+            db.commit()
+        return visit_counts
+
+
+class VisitCounter:
+    """
+    방문자 수 증가분을 모아서 반영하는 프로세스 단위 버퍼 클래스입니다.
+    - 방문 시에는 메모리의 날짜별 증가분만 더하고, 일정 주기로 한번에 반영합니다.
+    - 방문자 합계는 vs_count = vs_count + n 으로 증가시키고,
+      최대/전체 방문자 수는 기본설정의 값에 증가분을 더해 갱신하므로
+      여러 worker가 동시에 반영해도 정확한 값이 유지됩니다.
+    """
+    pending: Dict[date, int] = {}
+    lock = threading.Lock()
+
+    @classmethod
+    def increase(cls, visit_date: date, count: int = 1) -> None:
+        """방문자 수 증가분을 버퍼에 더합니다."""
+        with cls.lock:
+            cls.pending[visit_date] = cls.pending.get(visit_date, 0) + count
+
+    @classmethod
+    def flush(cls, db: Session) -> None:
+        """버퍼에 모인 방문자 수를 방문자 합계 테이블과 기본설정에 반영합니다."""
+        with cls.lock:
+            pending, cls.pending = cls.pending, {}
+        if not pending:
+            return
+
+        try:
+            for visit_date, count in pending.items():
+                cls._increase_visit_sum(db, visit_date, count)
+            cls._update_config(db, sum(pending.values()))
+            db.commit()
+        except Exception:
+            db.rollback()
+            # 반영에 실패한 증가분은 다음 주기에 다시 반영
+            for visit_date, count in pending.items():
+                cls.increase(visit_date, count)
+            raise
+
+    @staticmethod
+    def _increase_visit_sum(db: Session, visit_date: date, count: int) -> None:
+        """방문자 합계 테이블의 방문자 수를 증가시킵니다. (없으면 추가)"""
+        increase_query = (
+            update(VisitSum)
+            .where(VisitSum.vs_date == visit_date)
+            .values(vs_count=VisitSum.vs_count + count)
+        )
+        if db.execute(increase_query).rowcount:
+            return
+
+        try:
+            with db.begin_nested():
+                db.execute(insert(VisitSum).values(vs_date=visit_date, vs_count=count))
+        except IntegrityError:
+            # 다른 worker가 먼저 추가한 경우
+            db.execute(increase_query)
+
+    @staticmethod
+    def _update_config(db: Session, count: int) -> None:
+        """기본설정 테이블 > 방문자 수 갱신
+        - 기본설정 행을 잠근 상태에서 최대/전체 방문자 수에 증가분을 반영합니다.
+        """
+        config = db.scalar(select(Config).with_for_update())
+        if not config:
+            return
+
+        today = date.today()
+        visit = VisitService.parse_visit_data(config.cf_visit)
+        visit_today = db.scalar(
+            select(VisitSum.vs_count).where(VisitSum.vs_date == today)
         ) or 0
-        yesterday = self.db.scalar(
-            select(VisitSum.vs_count)
-            .where(VisitSum.vs_date == self.today - timedelta(days=1))
+        visit_yesterday = db.scalar(
+            select(VisitSum.vs_count).where(VisitSum.vs_date == today - timedelta(days=1))
         ) or 0
-        visit_max = self.db.scalar(func.max(VisitSum.vs_count)) or 0
-        visit_total = self.db.scalar(func.sum(VisitSum.vs_count)) or 0
-
-        config = self.db.scalars(select(Config)).first()
-        config.cf_visit = f"오늘:{today},어제:{yesterday},최대:{visit_max},전체:{visit_total}"
-        self.db.commit()
-
-    def _update_visit_sum(self) -> None:
-        """방문자 합계 테이블 갱신 함수"""
-        visit_count_today = self.db.scalar(
-            select(func.count(Visit.vi_id))
-            .where(Visit.vi_date == self.today)
-        )
-        self.db.merge(VisitSum(vs_date=self.today, vs_count=visit_count_today))
-        self.db.commit()
+        visit_max = max(visit["max"], visit_today)
+        visit_total = visit["total"] + count
+
+        config.cf_visit = f"오늘:{visit_today},어제:{visit_yesterday},최대:{visit_max},전체:{visit_total}"
+
+
+def flush_visit_log() -> None:
+    """대기열의 접속 이력과 방문자 수 버퍼를 데이터베이스에 반영합니다."""
+    VisitLogWriter.flush()
+    with DBConnect().sessionLocal() as db:
+        VisitCounter.flush(db)
+
+
+async def run_visit_log_writer() -> None:
+    """VISIT_LOG_FLUSH_INTERVAL 주기로 접속 이력과 방문자 수를 반영하는 백그라운드 작업"""
+    while True:
+        await asyncio.sleep(VISIT_LOG_FLUSH_INTERVAL)
+        try:
+            await run_in_threadpool(flush_visit_log)
+        except Exception as e:
+            logger.error(f"방문자 접속 이력 기록 중 오류가 발생했습니다: {e}")